@@ -7,6 +7,9 @@ from pathlib import Path
 from typing import Any, Dict
 
 from entity.infrastructure.async_duckdb_infra import AsyncDuckDBInfrastructure
+from entity.infrastructure.async_duckdb_worker_infra import (
+    AsyncDuckDBWorkerInfrastructure,
+)
 from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
 from entity.resources.async_database import AsyncDatabaseResource
 from entity.resources.async_memory import AsyncMemory
@@ -132,6 +135,65 @@ class DatabaseBenchmark:
 
             await async_memory.database.infrastructure.shutdown()
 
+    async def benchmark_async_backends(self) -> None:
+        """Benchmark AsyncMemory on aiosqlite against the DuckDB worker backend."""
+        print("🔍 Benchmarking Async Backends (aiosqlite vs DuckDB workers)...")
+
+        test_data = {
+            f"key_{i}": {"id": i, "data": f"test_value_{i}"}
+            for i in range(self.num_operations)
+        }
+        backends = {
+            "aiosqlite": AsyncDuckDBInfrastructure,
+            "duckdb_worker": AsyncDuckDBWorkerInfrastructure,
+        }
+        results = {}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for label, infra_cls in backends.items():
+                infra = infra_cls(
+                    file_path=str(Path(temp_dir) / f"{label}.db"),
+                    pool_size=10,
+                    query_timeout=30.0,
+                )
+                await infra.startup()
+                memory = AsyncMemory(
+                    AsyncDatabaseResource(infra), VectorStoreResource(infra)
+                )
+
+                start_time = time.perf_counter()
+                for key, value in test_data.items():
+                    await memory.store(key, value)
+                store_time = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                for key in test_data:
+                    await memory.load(key)
+                load_time = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                await asyncio.gather(
+                    *(
+                        memory.database.execute_fetch_one(
+                            "SELECT value FROM memory WHERE key = ?", key
+                        )
+                        for key in test_data
+                    )
+                )
+                concurrent_read_time = time.perf_counter() - start_time
+
+                results[label] = {
+                    "store_time": store_time,
+                    "load_time": load_time,
+                    "concurrent_read_time": concurrent_read_time,
+                    "ops_per_second": self.num_operations
+                    * 2
+                    / (store_time + load_time),
+                }
+                await infra.shutdown()
+
+        self.results["async_backends"] = results
+
     async def benchmark_raw_database_operations(self) -> None:
         """Benchmark raw database operations comparing sync vs async."""
         print("🔍 Benchmarking Raw Database Operations...")
@@ -317,6 +379,15 @@ class DatabaseBenchmark:
             print(f"  Performance Gain:     {mem['performance_improvement']:.2f}x")
             print(f"  Batch Improvement:    {mem['batch_improvement']:.2f}x")
 
+        if "async_backends" in self.results:
+            print("\n📊 Async Backends:")
+            for label, data in self.results["async_backends"].items():
+                print(
+                    f"  {label:14s} store {data['store_time']:.3f}s, "
+                    f"load {data['load_time']:.3f}s, "
+                    f"concurrent reads {data['concurrent_read_time']:.3f}s"
+                )
+
         if "database_operations" in self.results:
             db = self.results["database_operations"]
             print(f"\n📊 Database Operations ({db['num_operations']} ops):")
@@ -358,6 +429,7 @@ class DatabaseBenchmark:
 
         try:
             await self.benchmark_memory_operations()
+            await self.benchmark_async_backends()
             await self.benchmark_raw_database_operations()
             await self.benchmark_concurrent_operations()
 
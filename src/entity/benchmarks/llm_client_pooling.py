@@ -0,0 +1,111 @@
+"""Requests/sec of OllamaInfrastructure with and without connection pooling."""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict
+
+import httpx
+
+from entity.benchmarks.stub_ollama import StubOllamaServer
+from entity.infrastructure.ollama_infra import OllamaInfrastructure
+
+
+class LLMClientPoolingBenchmark:
+    """Compare a client per request against the pooled infrastructure client."""
+
+    def __init__(self, num_requests: int = 2000, concurrency: int = 8):
+        """Initialize benchmark parameters.
+
+        Args:
+            num_requests: Generate calls per configuration
+            concurrency: Number of concurrent callers
+        """
+        self.num_requests = num_requests
+        self.concurrency = concurrency
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    async def _unpooled_generate(self, url: str, prompt: str) -> str:
+        """The pre-pooling request path: a fresh client for every call."""
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{url}/api/generate",
+                json={"model": "stub", "prompt": prompt, "stream": False},
+            )
+            response.raise_for_status()
+            return response.json().get("response", "")
+
+    async def _drive(self, label: str, server: StubOllamaServer, call) -> None:
+        remaining = iter(range(self.num_requests))
+        connections = server.connections
+
+        async def worker() -> None:
+            for i in remaining:
+                await call(f"prompt {i}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        elapsed = time.perf_counter() - start
+        self.results[label] = {
+            "requests_per_sec": self.num_requests / elapsed,
+            "ms_per_request": elapsed / self.num_requests * 1000 * self.concurrency,
+            "connections": server.connections - connections,
+        }
+
+    async def run_all_benchmarks(self) -> None:
+        """Run both configurations against a local stub server."""
+        async with StubOllamaServer() as server:
+            await self._drive(
+                "client per request",
+                server,
+                lambda prompt: self._unpooled_generate(server.url, prompt),
+            )
+
+            infra = OllamaInfrastructure(
+                server.url, "stub", max_keepalive_connections=self.concurrency
+            )
+            await infra.startup()
+            try:
+                await self._drive("pooled client", server, infra.generate)
+            finally:
+                await infra.shutdown()
+        self.print_results()
+
+    def print_results(self) -> None:
+        """Print benchmark results in a formatted way."""
+        print("\n" + "=" * 70)
+        print(
+            f"🔌 LLM CLIENT POOLING BENCHMARK "
+            f"({self.num_requests:,d} requests, concurrency {self.concurrency})"
+        )
+        print("=" * 70)
+        print(f"  {'client':<22}{'req/s':>10}{'ms/request':>12}{'connections':>13}")
+        for label, data in self.results.items():
+            print(
+                f"  {label:<22}{data['requests_per_sec']:>10.0f}"
+                f"{data['ms_per_request']:>12.2f}{data['connections']:>13d}"
+            )
+        baseline = self.results.get("client per request")
+        pooled = self.results.get("pooled client")
+        if baseline and pooled:
+            speedup = pooled["requests_per_sec"] / baseline["requests_per_sec"]
+            print(f"\n  Pooling speedup: {speedup:.1f}x")
+        print("=" * 70)
+
+
+def main():
+    """Main function to run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    asyncio.run(
+        LLMClientPoolingBenchmark(
+            num_requests=args.requests, concurrency=args.concurrency
+        ).run_all_benchmarks()
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Minimal local stand-in for the Ollama HTTP API.
+
+Used by benchmarks and tests to exercise the HTTP client path without a
+model server. Speaks just enough HTTP/1.1 (keep-alive, ``Content-Length``
+request bodies, chunked NDJSON streams) for ``/api/generate`` and
+``/api/tags``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from typing import Any
+
+
+class StubOllamaServer:
+    """Serve canned Ollama responses on ``127.0.0.1``.
+
+    Example::
+
+        async with StubOllamaServer(response="hi") as server:
+            infra = OllamaInfrastructure(server.url, "stub")
+    """
+
+    def __init__(
+        self,
+        response: str = "ok",
+        latency: float = 0.0,
+        token_delay: float = 0.0,
+        status: int = 200,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Configure the stub.
+
+        Args:
+            response: Text returned by ``/api/generate``
+            latency: Seconds to wait before answering each generate request
+                (before the first token when streaming)
+            token_delay: Seconds between streamed tokens
+            status: HTTP status for generate requests; errors carry no text
+            host: Interface to bind
+            port: Port to bind; ``0`` picks a free one
+        """
+        self.response = response
+        self.latency = latency
+        self.token_delay = token_delay
+        self.status = status
+        self.host = host
+        self.port = port
+        self.connections = 0
+        self.requests = 0
+        self.disconnects = 0
+        self.payloads: list[dict[str, Any]] = []
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "StubOllamaServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "StubOllamaServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, path, _ = request_line.split(" ", 2)
+                headers = {
+                    name.strip().lower(): value.strip()
+                    for name, _, value in (
+                        line.partition(":") for line in header_lines if line
+                    )
+                }
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+                payload = json.loads(body) if body else {}
+                self.requests += 1
+                if method == "POST" and path == "/api/generate":
+                    self.payloads.append(payload)
+                    # Ollama streams unless the request opts out.
+                    if payload.get("stream", True) and self.status == 200:
+                        if not await self._stream(reader, writer, payload):
+                            break
+                        continue
+                status, result = await self._route(method, path, payload)
+                data = json.dumps(result).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _tokens(self) -> list[str]:
+        return re.findall(r"\S+\s*|\s+", self.response)
+
+    def _counts(self, payload: dict[str, Any]) -> dict[str, int]:
+        """Token counts as Ollama reports them on the final message."""
+
+        prompt = str(payload.get("prompt", ""))
+        return {
+            "prompt_eval_count": len(re.findall(r"\S+", prompt)),
+            "eval_count": len(self._tokens()),
+        }
+
+    async def _stream(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        payload: dict[str, Any],
+    ) -> bool:
+        """Write an NDJSON stream; return ``False`` if the client went away."""
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/x-ndjson\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        chunks = [{"response": token, "done": False} for token in self._tokens()]
+        chunks.append({"response": "", "done": True, **self._counts(payload)})
+        for index, chunk in enumerate(chunks):
+            delay = self.latency if index == 0 else self.token_delay
+            if delay:
+                await asyncio.sleep(delay)
+            if reader.at_eof():
+                self.disconnects += 1
+                return False
+            line = json.dumps({"model": payload.get("model"), **chunk}).encode()
+            line += b"\n"
+            writer.write(b"%x\r\n%s\r\n" % (len(line), line))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        return True
+
+    async def _route(
+        self, method: str, path: str, payload: dict[str, Any]
+    ) -> tuple[str, Any]:
+        if method == "GET" and path == "/api/tags":
+            return "200 OK", {"models": [{"name": "stub"}]}
+        if method == "POST" and path == "/api/generate":
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.status != 200:
+                return f"{self.status} Error", {"error": "stub failure"}
+            return "200 OK", {
+                "model": payload.get("model"),
+                "response": self.response,
+                "done": True,
+                **self._counts(payload),
+            }
+        return "404 Not Found", {"error": "not found"}
@@ -0,0 +1,198 @@
+"""Recall, latency and size trade-offs of vector quantization."""
+
+import argparse
+import gc
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from entity.infrastructure.numpy_vector_infra import NumPyVectorInfrastructure
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - optional dependency
+    psutil = None
+
+
+def _process_mb() -> float:
+    """Return process memory in MB, excluding page cache behind memory maps.
+
+    Linux reports anonymous pages separately; elsewhere fall back to the
+    full resident set size from psutil.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    return float("nan")
+
+
+class VectorQuantizationBenchmark:
+    """Compare exact, int8 and product-quantized NumPy vector search."""
+
+    def __init__(
+        self,
+        size: int = 100_000,
+        dim: int = 768,
+        k: int = 10,
+        num_queries: int = 100,
+        rerank_factors: List[int] | None = None,
+        seed: int = 0,
+    ):
+        """Initialize benchmark parameters.
+
+        Args:
+            size: Number of stored vectors
+            dim: Embedding dimension
+            k: Number of neighbours per query
+            num_queries: Queries per configuration
+            rerank_factors: Candidate multipliers to try for quantized search
+            seed: Random seed for the synthetic data
+        """
+        self.size = size
+        self.dim = dim
+        self.k = k
+        self.num_queries = num_queries
+        self.rerank_factors = rerank_factors or [4, 10]
+        self.rng = np.random.default_rng(seed)
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def _clustered(self, count: int, centers: Any) -> Any:
+        """Sample points around random cluster centers, like real embeddings."""
+        labels = self.rng.integers(0, len(centers), count)
+        noise = self.rng.normal(scale=0.35, size=(count, self.dim))
+        return (centers[labels] + noise).astype(np.float32)
+
+    def _run(
+        self, label: str, vectors: Any, queries: Any, truth: List[set], **options: Any
+    ) -> None:
+        gc.collect()
+        baseline_mb = _process_mb()
+        infra = NumPyVectorInfrastructure(**options)
+        ids = [str(i) for i in range(len(vectors))]
+        infra.upsert_vectors(
+            "bench", ids, vectors, [None] * len(ids), [None] * len(ids)
+        )
+
+        start = time.perf_counter()
+        infra.search_vectors("bench", queries[0], k=self.k)  # trains the quantizer
+        train_seconds = time.perf_counter() - start
+        stats = infra.get_table_stats("bench")
+
+        start = time.perf_counter()
+        batched = infra.search_vectors("bench", queries, k=self.k)
+        batch_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        start = time.perf_counter()
+        for query in queries[:20]:
+            infra.search_vectors("bench", query, k=self.k)
+        single_ms = (time.perf_counter() - start) / min(20, len(queries)) * 1000
+
+        hits = sum(
+            len({match[0] for match in found} & expected)
+            for found, expected in zip(batched, truth)
+        )
+        del batched
+        gc.collect()
+        index_bytes = stats["resident_bytes"]
+        self.results[label] = {
+            "train_seconds": train_seconds,
+            "batch_ms": batch_ms,
+            "single_ms": single_ms,
+            "recall": hits / (self.k * len(queries)),
+            "bytes_per_vector": index_bytes / len(vectors),
+            "index_mb": index_bytes / 1e6,
+            "process_mb": _process_mb() - baseline_mb,
+        }
+        del infra
+
+    def run_all_benchmarks(self) -> None:
+        """Run every configuration and print the comparison."""
+        print(f"🏁 Generating {self.size:,d} x {self.dim} clustered vectors")
+        centers = self.rng.normal(size=(256, self.dim))
+        vectors = self._clustered(self.size, centers)
+        queries = self._clustered(self.num_queries, centers)
+
+        exact = NumPyVectorInfrastructure()
+        ids = [str(i) for i in range(self.size)]
+        exact.upsert_vectors(
+            "bench", ids, vectors, [None] * self.size, [None] * self.size
+        )
+        truth = [
+            {match[0] for match in found}
+            for found in exact.search_vectors("bench", queries, k=self.k)
+        ]
+
+        self._run("float32", vectors, queries, truth)
+        for factor in self.rerank_factors:
+            self._run(
+                f"int8 (rerank x{factor})",
+                vectors,
+                queries,
+                truth,
+                quantization="int8",
+                rerank_factor=factor,
+            )
+            self._run(
+                f"pq (rerank x{factor})",
+                vectors,
+                queries,
+                truth,
+                quantization="pq",
+                rerank_factor=factor,
+            )
+        self.print_results()
+
+    def print_results(self) -> None:
+        """Print benchmark results in a formatted way."""
+        print("\n" + "=" * 80)
+        print(
+            f"🗜️  VECTOR QUANTIZATION BENCHMARK "
+            f"({self.size:,d} x {self.dim}, k={self.k}, cosine)"
+        )
+        print("=" * 80)
+        print(
+            f"  {'index':<22}{'recall':>8}{'batch ms':>10}{'single ms':>11}"
+            f"{'B/vector':>10}{'index MB':>10}{'proc MB':>9}{'train s':>9}"
+        )
+        for label, data in self.results.items():
+            print(
+                f"  {label:<22}{data['recall']:>8.3f}{data['batch_ms']:>10.2f}"
+                f"{data['single_ms']:>11.2f}{data['bytes_per_vector']:>10.0f}"
+                f"{data['index_mb']:>10.1f}{data['process_mb']:>9.1f}"
+                f"{data['train_seconds']:>9.2f}"
+            )
+        print("\n  index MB counts arrays held in memory. Quantized indexes keep")
+        print("  float32 rows in a memory-mapped file for re-ranking; proc MB is")
+        print("  the process growth while building and querying, excluding the")
+        print("  page cache behind that file.")
+        print("=" * 80)
+
+
+def main():
+    """Main function to run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--rerank", type=int, nargs="+", default=[4, 10])
+    args = parser.parse_args()
+
+    VectorQuantizationBenchmark(
+        size=args.size,
+        dim=args.dim,
+        k=args.k,
+        num_queries=args.queries,
+        rerank_factors=args.rerank,
+    ).run_all_benchmarks()
+
+
+if __name__ == "__main__":
+    main()
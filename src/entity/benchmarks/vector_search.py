@@ -0,0 +1,130 @@
+"""Benchmarks for top-k vector search in VectorStoreResource."""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+from entity.resources.vector_store import VectorStoreResource
+
+
+class VectorSearchBenchmark:
+    """Measure exact and HNSW search latency over growing collections."""
+
+    def __init__(
+        self,
+        sizes: List[int] | None = None,
+        dim: int = 128,
+        k: int = 10,
+        num_queries: int = 20,
+    ):
+        """Initialize benchmark parameters.
+
+        Args:
+            sizes: Collection sizes to benchmark
+            dim: Embedding dimension
+            k: Number of neighbours per query
+            num_queries: Queries timed at each size
+        """
+        self.sizes = sizes or [10_000, 100_000, 1_000_000]
+        self.dim = dim
+        self.k = k
+        self.num_queries = num_queries
+        self.results: Dict[int, Dict[str, Any]] = {}
+
+    def _populate(self, store: VectorStoreResource, table: str, size: int) -> float:
+        """Fill ``table`` with ``size`` random vectors generated inside DuckDB."""
+        store.create_table(table, self.dim)
+        start = time.perf_counter()
+        with store.infrastructure.connect(write=True) as conn:
+            conn.execute(
+                f"INSERT INTO {table} (id, embedding) "
+                f"SELECT 'v' || i, "
+                f"list_transform(range({self.dim}), x -> random())::FLOAT[{self.dim}] "
+                f"FROM range({size}) t(i)"
+            )
+        return time.perf_counter() - start
+
+    def _time_queries(
+        self, store: VectorStoreResource, table: str, queries: List[List[float]]
+    ) -> tuple[float, List[set]]:
+        found = []
+        start = time.perf_counter()
+        for query in queries:
+            found.append({r.id for r in store.search(table, query, k=self.k)})
+        elapsed = time.perf_counter() - start
+        return elapsed / len(queries) * 1000, found
+
+    def benchmark_size(self, size: int) -> Dict[str, Any]:
+        """Benchmark one collection size and return its results."""
+        store = VectorStoreResource(DuckDBInfrastructure(":memory:"))
+        table = f"bench_{size}"
+        load_seconds = self._populate(store, table, size)
+        queries = [
+            [random.random() for _ in range(self.dim)] for _ in range(self.num_queries)
+        ]
+
+        exact_ms, exact_ids = self._time_queries(store, table, queries)
+        result: Dict[str, Any] = {
+            "load_seconds": load_seconds,
+            "exact_ms": exact_ms,
+            "hnsw_ms": None,
+            "recall": None,
+        }
+
+        start = time.perf_counter()
+        if store.create_index(table):
+            result["index_seconds"] = time.perf_counter() - start
+            hnsw_ms, hnsw_ids = self._time_queries(store, table, queries)
+            hits = sum(len(a & b) for a, b in zip(exact_ids, hnsw_ids))
+            result["hnsw_ms"] = hnsw_ms
+            result["recall"] = hits / (self.k * len(queries))
+        return result
+
+    def print_results(self) -> None:
+        """Print benchmark results in a formatted way."""
+        print("\n" + "=" * 80)
+        print(f"🔍 VECTOR SEARCH BENCHMARK (dim={self.dim}, k={self.k})")
+        print("=" * 80)
+        for size, data in self.results.items():
+            line = (
+                f"  {size:>9,d} vectors: load {data['load_seconds']:7.2f}s, "
+                f"exact {data['exact_ms']:8.2f} ms/query"
+            )
+            if data["hnsw_ms"] is not None:
+                line += (
+                    f", hnsw {data['hnsw_ms']:8.2f} ms/query "
+                    f"(recall@{self.k} {data['recall']:.3f})"
+                )
+            else:
+                line += ", hnsw unavailable"
+            print(line)
+        print("\n" + "=" * 80)
+
+    def run_all_benchmarks(self) -> None:
+        """Run the benchmark for every configured size."""
+        for size in self.sizes:
+            print(f"🏁 Benchmarking {size:,d} vectors")
+            self.results[size] = self.benchmark_size(size)
+        self.print_results()
+
+
+def main():
+    """Main function to run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    VectorSearchBenchmark(
+        sizes=args.sizes, dim=args.dim, k=args.k, num_queries=args.queries
+    ).run_all_benchmarks()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 import os
 import tempfile
+import time
 from dataclasses import dataclass
+from typing import Any, Callable
 
 from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
 from entity.infrastructure.local_storage_infra import LocalStorageInfrastructure
@@ -11,6 +14,7 @@ from entity.resources import (
     DatabaseResource,
     FileStorage,
     LLMResource,
+    LLMResponseCache,
     LocalStorageResource,
     LogLevel,
     Memory,
@@ -31,6 +35,7 @@ class DefaultConfig:
     ollama_model: str = "llama3.2:3b"
     storage_path: str = "./agent_files"
     auto_install_ollama: bool = True
+    llm_cache: bool = False
 
     @classmethod
     def from_env(cls) -> "DefaultConfig":
@@ -46,51 +51,71 @@ class DefaultConfig:
                 str(cls.auto_install_ollama),
             ).lower()
             in {"1", "true", "yes"},
+            llm_cache=os.getenv("ENTITY_LLM_CACHE", str(cls.llm_cache)).lower()
+            in {"1", "true", "yes"},
         )
 
 
-def load_defaults(config: DefaultConfig | None = None) -> dict[str, object]:
-    """Build canonical resources using ``config`` or environment overrides."""
+class DefaultResources(dict):
+    """Resource mapping returned by :func:`load_defaults_async`.
 
-    cfg = config or DefaultConfig.from_env()
-    logger = logging.getLogger("defaults")
+    ``startup_timings`` maps each probed resource to the seconds spent
+    bringing it up. Deferred resources appear once first used.
+    """
+
+    def __init__(
+        self, resources: dict[str, object], startup_timings: dict[str, float]
+    ) -> None:
+        super().__init__(resources)
+        self.startup_timings = startup_timings
+
+
+class _DeferredInfrastructure:
+    """Build an infrastructure the first time one of its attributes is used."""
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self._factory = factory
+        self._target: Any = None
 
+    def __getattr__(self, name: str) -> Any:
+        if self._target is None:
+            self._target = self._factory()
+        return getattr(self._target, name)
+
+
+def _logging_resource() -> RichLoggingResource:
     log_level = LogLevel(os.getenv("ENTITY_LOG_LEVEL", "info"))
     json_logs = os.getenv("ENTITY_JSON_LOGS", "0").lower() in {"1", "true", "yes"}
     log_file = os.getenv("ENTITY_LOG_FILE", "./agent.log")
-    logging_resource = RichLoggingResource(
+    return RichLoggingResource(
         level=log_level,
         json=json_logs,
         log_file=log_file,
     )
 
-    try:
-        if cfg.auto_install_ollama:
-            OllamaInstaller.ensure_ollama_available(cfg.ollama_model)
-        ollama_infra = OllamaInfrastructure(cfg.ollama_url, cfg.ollama_model)
-        if ollama_infra.health_check_sync():
-            llm_infra = ollama_infra
-            logger.info("Using Ollama with model: %s", cfg.ollama_model)
-        else:
-            raise InfrastructureError("Ollama unavailable")
-    except Exception as exc:
-        raise InfrastructureError(f"No LLM infrastructure available: {exc}")
 
-    duckdb = DuckDBInfrastructure(cfg.duckdb_path)
-    if not duckdb.health_check_sync():
-        logger.debug("Falling back to in-memory DuckDB")
-        duckdb = DuckDBInfrastructure(":memory:")
+def _storage_infrastructure(cfg: DefaultConfig) -> LocalStorageInfrastructure:
+    """Return storage at the configured path, or a temp-dir fallback."""
 
     storage_infra = LocalStorageInfrastructure(cfg.storage_path)
-    if not storage_infra.health_check_sync():
+    if not storage_infra.is_writable():
         fallback = os.path.join(tempfile.gettempdir(), "entity_files")
-        logger.warning(
+        logging.getLogger("defaults").warning(
             "Storage path %s unavailable; falling back to %s",
             cfg.storage_path,
             fallback,
         )
         storage_infra = LocalStorageInfrastructure(fallback)
+    return storage_infra
+
 
+def _assemble(
+    cfg: DefaultConfig,
+    llm_infra: Any,
+    duckdb: DuckDBInfrastructure,
+    storage_infra: Any,
+    logging_resource: RichLoggingResource,
+) -> dict[str, object]:
     db_resource = DatabaseResource(duckdb)
     vector_resource = VectorStoreResource(duckdb)
     llm_resource = LLMResource(llm_infra)
@@ -104,8 +129,144 @@ def load_defaults(config: DefaultConfig | None = None) -> dict[str, object]:
 
     return {
         "memory": Memory(db_resource, vector_resource),
-        "llm": LLM(llm_resource),
+        "llm": LLM(
+            llm_resource,
+            cache=LLMResponseCache(db_resource) if cfg.llm_cache else None,
+        ),
         "file_storage": FileStorage(storage_resource),
         "logging": logging_resource,
         "argument_parsing": argument_parsing_resource,
     }
+
+
+def load_defaults(config: DefaultConfig | None = None) -> dict[str, object]:
+    """Build canonical resources using ``config`` or environment overrides."""
+
+    cfg = config or DefaultConfig.from_env()
+    logger = logging.getLogger("defaults")
+    logging_resource = _logging_resource()
+
+    try:
+        if cfg.auto_install_ollama:
+            OllamaInstaller.ensure_ollama_available(cfg.ollama_model)
+        ollama_infra = OllamaInfrastructure(cfg.ollama_url, cfg.ollama_model)
+        if ollama_infra.health_check_sync():
+            llm_infra = ollama_infra
+            logger.info("Using Ollama with model: %s", cfg.ollama_model)
+        else:
+            raise InfrastructureError("Ollama unavailable")
+    except Exception as exc:
+        raise InfrastructureError(f"No LLM infrastructure available: {exc}")
+
+    duckdb = DuckDBInfrastructure(cfg.duckdb_path)
+    if not duckdb.health_check_sync():
+        logger.debug("Falling back to in-memory DuckDB")
+        duckdb = DuckDBInfrastructure(":memory:")
+
+    storage_infra = _storage_infrastructure(cfg)
+    return _assemble(cfg, llm_infra, duckdb, storage_infra, logging_resource)
+
+
+async def load_defaults_async(
+    config: DefaultConfig | None = None,
+    probe_timeout: float = 2.0,
+    defer_optional: bool = True,
+    install_timeout: float = 900.0,
+) -> DefaultResources:
+    """Build the same resources as :func:`load_defaults` without blocking.
+
+    The Ollama, DuckDB and storage probes run concurrently, each bounded by
+    ``probe_timeout`` and tried once. Ollama installation is only attempted
+    if the first probe fails, and is bounded by ``install_timeout`` since
+    it may download a model. With ``defer_optional`` the file storage
+    backend (the only resource agents can run without) is set up and
+    checked on first use instead of at startup. Per-resource timings are
+    available as ``startup_timings`` on the returned mapping.
+    """
+
+    cfg = config or DefaultConfig.from_env()
+    logger = logging.getLogger("defaults")
+    timings: dict[str, float] = {}
+
+    async def timed(name: str, probe: Any, default: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(probe, probe_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("%s probe timed out after %.1fs", name, probe_timeout)
+            return default
+        finally:
+            timings[name] = time.perf_counter() - start
+            logger.debug("%s ready in %.3fs", name, timings[name])
+
+    probe_infra = OllamaInfrastructure(
+        cfg.ollama_url,
+        cfg.ollama_model,
+        health_check_attempts=1,
+        health_check_timeout=probe_timeout,
+    )
+
+    async def install_ollama() -> bool:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(
+                    OllamaInstaller.ensure_ollama_available, cfg.ollama_model
+                ),
+                install_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Ollama install timed out after %.0fs", install_timeout)
+            return False
+        except Exception as exc:
+            logger.warning("Ollama install failed: %s", exc)
+            return False
+        finally:
+            timings["llm_install"] = time.perf_counter() - start
+        return await probe_infra.health_check()
+
+    duckdb = DuckDBInfrastructure(cfg.duckdb_path)
+
+    def build_storage() -> LocalStorageInfrastructure:
+        start = time.perf_counter()
+        try:
+            return _storage_infrastructure(cfg)
+        finally:
+            timings["file_storage"] = time.perf_counter() - start
+
+    probes = [
+        timed("llm", probe_infra.health_check(), False),
+        # DuckDB and filesystem probes block, so they run in worker threads.
+        timed("database", asyncio.to_thread(asyncio.run, duckdb.health_check()), False),
+    ]
+    if not defer_optional:
+        probes.append(timed("file_storage", asyncio.to_thread(build_storage), None))
+    results = await asyncio.gather(*probes)
+
+    try:
+        ollama_ready = results[0]
+        if not ollama_ready and cfg.auto_install_ollama:
+            ollama_ready = await install_ollama()
+    finally:
+        await probe_infra.shutdown()
+    if not results[1] or not ollama_ready:
+        # Release the pool and writer the failed probe may have opened.
+        await asyncio.to_thread(asyncio.run, duckdb.shutdown())
+    if not ollama_ready:
+        raise InfrastructureError(
+            f"No LLM infrastructure available: Ollama unavailable at {cfg.ollama_url}"
+        )
+    logger.info("Using Ollama with model: %s", cfg.ollama_model)
+    ollama_infra = OllamaInfrastructure(cfg.ollama_url, cfg.ollama_model)
+    if not results[1]:
+        logger.debug("Falling back to in-memory DuckDB")
+        duckdb = DuckDBInfrastructure(":memory:")
+    if defer_optional:
+        storage_infra: Any = _DeferredInfrastructure(build_storage)
+    else:
+        storage_infra = results[2] or build_storage()
+
+    start = time.perf_counter()
+    resources = _assemble(cfg, ollama_infra, duckdb, storage_infra, _logging_resource())
+    timings["wrappers"] = time.perf_counter() - start
+    return DefaultResources(resources, timings)
@@ -1,25 +1,45 @@
 from .adaptive_llm_infra import AdaptiveLLMInfrastructure
+from .async_duckdb_worker_infra import AsyncDuckDBWorkerInfrastructure
 from .base import BaseInfrastructure
 from .duckdb_infra import DuckDBInfrastructure
 from .harmony_oss_infra import HarmonyOSSInfrastructure
+from .load_balanced_llm_infra import LoadBalancedLLMInfrastructure
 from .local_storage_infra import LocalStorageInfrastructure
+from .numpy_vector_infra import NumPyVectorInfrastructure
 from .ollama_infra import OllamaInfrastructure
 from .protocols import (
     DatabaseInfrastructure,
     StorageInfrastructure,
+    VectorIndexInfrastructure,
     VectorStoreInfrastructure,
 )
 from .s3_infrastructure import S3Infrastructure
+from .token_counter import (
+    EstimatingTokenCounter,
+    TiktokenTokenCounter,
+    TokenCounter,
+    TokenUsage,
+    default_token_counter,
+)
 
 __all__ = [
     "AdaptiveLLMInfrastructure",
+    "AsyncDuckDBWorkerInfrastructure",
     "BaseInfrastructure",
     "DuckDBInfrastructure",
     "HarmonyOSSInfrastructure",
+    "LoadBalancedLLMInfrastructure",
     "LocalStorageInfrastructure",
+    "NumPyVectorInfrastructure",
     "OllamaInfrastructure",
     "S3Infrastructure",
     "DatabaseInfrastructure",
     "VectorStoreInfrastructure",
+    "VectorIndexInfrastructure",
     "StorageInfrastructure",
+    "TokenCounter",
+    "TokenUsage",
+    "EstimatingTokenCounter",
+    "TiktokenTokenCounter",
+    "default_token_counter",
 ]
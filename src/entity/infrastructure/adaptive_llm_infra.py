@@ -7,15 +7,41 @@ standard transformers models based on GPU acceleration availability and performa
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
 import platform
+import sys
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base import BaseInfrastructure
 from .harmony_oss_infra import HarmonyOSSInfrastructure
+from .token_counter import TokenCounter, default_token_counter
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+try:
+    import transformers
+
+    TRANSFORMERS_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    transformers = None
+    TRANSFORMERS_AVAILABLE = False
+
+DEFAULT_BENCHMARK_CACHE = Path("./benchmark_results/backend_benchmarks.json")
+BENCHMARK_PROMPT = "What is the capital of France? Please provide a brief explanation."
 
 
 class AccelerationType(Enum):
@@ -47,6 +73,7 @@ class PerformanceBenchmark:
     memory_usage_mb: float
     success: bool
     error_message: Optional[str] = None
+    ttft_ms: float = 0.0
 
 
 @dataclass
@@ -62,6 +89,114 @@ class ModelConfig:
     priority: int = 100
 
 
+def _memory_usage_mb() -> float:
+    """Resident memory of this process, or its peak where RSS is unavailable."""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows without psutil
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def hardware_fingerprint(acceleration: Optional[AccelerationType]) -> Dict[str, Any]:
+    """Describe the hardware a benchmark ran on."""
+    fingerprint: Dict[str, Any] = {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "acceleration": acceleration.value if acceleration else None,
+    }
+    if PSUTIL_AVAILABLE:
+        fingerprint["memory_mb"] = psutil.virtual_memory().total // (1024 * 1024)
+    if acceleration == AccelerationType.CUDA:
+        try:
+            import torch
+
+            fingerprint["gpu"] = torch.cuda.get_device_name(0)
+        except Exception:
+            pass
+    return fingerprint
+
+
+class BenchmarkCache:
+    """JSON file of backend benchmarks keyed by hardware and model fingerprint.
+
+    Only successful benchmarks are stored. Entries older than ``max_age``
+    seconds are ignored, so driver or library upgrades are eventually
+    picked up even when the hardware fingerprint is unchanged.
+    """
+
+    def __init__(self, path: Path | str, max_age: Optional[float] = 7 * 86_400.0):
+        self.path = Path(path)
+        self.max_age = max_age
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def key(
+        model_config: ModelConfig,
+        acceleration: Optional[AccelerationType],
+        prompt: str = BENCHMARK_PROMPT,
+    ) -> str:
+        """Return the cache key of ``model_config`` on this machine."""
+        payload = {
+            "hardware": hardware_fingerprint(acceleration),
+            "backend": model_config.backend.value,
+            "model_name": model_config.model_name,
+            "quantization": model_config.quantization,
+            "max_tokens": model_config.max_tokens,
+            "temperature": model_config.temperature,
+            "prompt": prompt,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> Optional[PerformanceBenchmark]:
+        """Return the stored benchmark for ``key`` if it is still fresh."""
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        if (
+            self.max_age is not None
+            and time.time() - entry["measured_at"] > self.max_age
+        ):
+            return None
+        try:
+            return PerformanceBenchmark(**entry["benchmark"])
+        except TypeError:
+            return None
+
+    def put(
+        self, key: str, model_config: ModelConfig, benchmark: PerformanceBenchmark
+    ) -> None:
+        """Store a successful ``benchmark`` and write the file."""
+        if not benchmark.success:
+            return
+        entries = self._load()
+        entries[key] = {
+            "backend": model_config.backend.value,
+            "model_name": model_config.model_name,
+            "measured_at": time.time(),
+            "benchmark": asdict(benchmark),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(entries, indent=2))
+        os.replace(tmp, self.path)
+
+
 class AdaptiveLLMInfrastructure(BaseInfrastructure):
     """Adaptive LLM infrastructure with automatic backend selection.
 
@@ -74,6 +209,17 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
         preferred_models: Optional[List[ModelConfig]] = None,
         benchmark_timeout: float = 10.0,
         min_tokens_per_second: float = 20.0,
+        benchmark_cache: Optional[Path | str] = None,
+        cache_benchmarks: bool = True,
+        force_benchmark: bool = False,
+        failover_window: int = 20,
+        failover_min_samples: int = 5,
+        max_error_rate: float = 0.5,
+        failover_latency: Optional[float] = None,
+        latency_tolerance: float = 3.0,
+        failover_cooldown: float = 30.0,
+        recovery_interval: float = 300.0,
+        token_counter: Optional[TokenCounter] = None,
         **kwargs,
     ):
         """Initialize adaptive LLM infrastructure.
@@ -82,12 +228,34 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
             preferred_models: List of model configurations in order of preference
             benchmark_timeout: Timeout for performance benchmarking in seconds
             min_tokens_per_second: Minimum acceptable tokens/second performance
+            benchmark_cache: File of stored benchmarks; defaults to
+                ``ENTITY_BENCHMARK_CACHE`` or ``./benchmark_results``
+            cache_benchmarks: Reuse and store benchmark results across startups
+            force_benchmark: Re-run benchmarks even when stored results exist
+            failover_window: Recent generations used to judge the active backend
+            failover_min_samples: Generations needed before a backend is judged
+            max_error_rate: Error rate in the window that triggers failover
+            failover_latency: Median latency in seconds that triggers failover;
+                defaults to ``latency_tolerance`` times the backend's baseline
+            latency_tolerance: Multiple of the baseline latency treated as degraded
+            failover_cooldown: Seconds on a backend before it may be switched away
+            recovery_interval: Seconds before a failed backend is tried again;
+                doubled after each consecutive failure
+            token_counter: Counts generated tokens for benchmark throughput
             **kwargs: Additional arguments passed to BaseInfrastructure
         """
         super().__init__(**kwargs)
 
         self.benchmark_timeout = benchmark_timeout
         self.min_tokens_per_second = min_tokens_per_second
+        self.force_benchmark = force_benchmark
+        self.token_counter = token_counter or default_token_counter()
+        self.benchmark_cache: Optional[BenchmarkCache] = None
+        if cache_benchmarks:
+            self.benchmark_cache = BenchmarkCache(
+                benchmark_cache
+                or os.getenv("ENTITY_BENCHMARK_CACHE", DEFAULT_BENCHMARK_CACHE)
+            )
 
         self.model_configs = preferred_models or self._get_default_model_configs()
 
@@ -96,6 +264,24 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
         self.acceleration_type: Optional[AccelerationType] = None
         self.benchmark_results: Dict[ModelBackend, PerformanceBenchmark] = {}
 
+        self.failover_min_samples = failover_min_samples
+        self.max_error_rate = max_error_rate
+        self.failover_latency = failover_latency
+        self.latency_tolerance = latency_tolerance
+        self.failover_cooldown = failover_cooldown
+        self.recovery_interval = recovery_interval
+        self.current_config: Optional[ModelConfig] = None
+        self._candidates: List[ModelConfig] = []
+        # candidate index -> (consecutive failures, monotonic time it may be retried)
+        self._backoff: Dict[int, Tuple[int, float]] = {}
+        self._samples: deque[Tuple[float, bool]] = deque(maxlen=failover_window)
+        self._baseline_latency: Optional[float] = None
+        self._active_since = time.monotonic()
+        self._time_on_backend: Dict[str, float] = {}
+        self._switch_log: deque[Dict[str, Any]] = deque(maxlen=50)
+        self._switch_lock = asyncio.Lock()
+        self._failover_metrics = {"generations": 0, "errors": 0, "switches": 0}
+
         self.logger = logging.getLogger(__name__)
 
     def _get_default_model_configs(self) -> List[ModelConfig]:
@@ -155,6 +341,10 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
         if not best_model:
             raise RuntimeError("No suitable model backend found")
 
+        # Failover walks the remaining compatible models in priority order.
+        self._candidates = [best_model] + [
+            model for model in compatible_models if model is not best_model
+        ]
         await self._initialize_backend(best_model)
 
         self.logger.info(
@@ -163,10 +353,181 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
 
     async def shutdown(self) -> None:
         """Shutdown the active infrastructure."""
+        self._account_backend_time()
         if self.active_infrastructure:
             await self.active_infrastructure.shutdown()
         await super().shutdown()
 
+    async def generate(self, prompt: str) -> str:
+        """Generate with the active backend, failing over if it degrades.
+
+        Every call's latency and outcome feed a sliding window. Once the
+        window holds enough samples and the backend has been active for
+        ``failover_cooldown`` seconds, an error rate above
+        ``max_error_rate`` or a median latency above the failover latency
+        switches to the next compatible model. A request that failed on the
+        backend being abandoned is retried once on its replacement.
+        """
+        if self.active_infrastructure is None:
+            raise RuntimeError("Adaptive LLM infrastructure has not been started")
+        await self._maybe_recover()
+
+        error: Optional[Exception] = None
+        for _ in range(2):
+            infrastructure = self.active_infrastructure
+            start = time.perf_counter()
+            try:
+                result = await infrastructure.generate(prompt)
+            except Exception as e:
+                error = e
+                self._record_sample(infrastructure, time.perf_counter() - start, False)
+                await self._evaluate_backend()
+                if self.active_infrastructure is infrastructure:
+                    raise
+                continue
+            self._record_sample(infrastructure, time.perf_counter() - start, True)
+            await self._evaluate_backend()
+            return result
+        raise error
+
+    def _record_sample(
+        self, infrastructure: BaseInfrastructure, latency: float, ok: bool
+    ) -> None:
+        self._failover_metrics["generations"] += 1
+        if not ok:
+            self._failover_metrics["errors"] += 1
+        # Calls that finish after a switch say nothing about the new backend.
+        if infrastructure is self.active_infrastructure:
+            self._samples.append((latency, ok))
+
+    def _latency_threshold(self) -> Optional[float]:
+        if self.failover_latency is not None:
+            return self.failover_latency
+        if self._baseline_latency is None:
+            return None
+        return self._baseline_latency * self.latency_tolerance
+
+    def _window_stats(self) -> Tuple[float, Optional[float]]:
+        if not self._samples:
+            return 0.0, None
+        errors = sum(1 for _, ok in self._samples if not ok)
+        latencies = sorted(latency for latency, ok in self._samples if ok)
+        median = latencies[len(latencies) // 2] if latencies else None
+        return errors / len(self._samples), median
+
+    async def _evaluate_backend(self) -> None:
+        if len(self._samples) < self.failover_min_samples:
+            return
+        error_rate, median = self._window_stats()
+        if self._baseline_latency is None and median is not None:
+            # The first full window on a backend is its latency baseline.
+            self._baseline_latency = median
+        if time.monotonic() - self._active_since < self.failover_cooldown:
+            return
+        threshold = self._latency_threshold()
+        if error_rate > self.max_error_rate:
+            reason = f"error rate {error_rate:.0%}"
+        elif threshold is not None and median is not None and median > threshold:
+            reason = (
+                f"median latency {median * 1000:.0f}ms over {threshold * 1000:.0f}ms"
+            )
+        else:
+            # A full healthy window clears the backend's failure history.
+            self._backoff.pop(self._candidate_index(self.current_config), None)
+            return
+        await self._fail_over(self.current_config, reason)
+
+    async def _fail_over(self, degraded: Optional[ModelConfig], reason: str) -> None:
+        async with self._switch_lock:
+            if self.current_config is not degraded:
+                return  # another caller already switched
+            index = self._candidate_index(degraded)
+            if index is not None:
+                self._mark_failed(index)
+            now = time.monotonic()
+            for candidate in range(len(self._candidates)):
+                if candidate == index or self._backoff.get(candidate, (0, 0))[1] > now:
+                    continue
+                if await self._switch_to(candidate, reason):
+                    return
+            self.logger.warning(
+                f"LLM backend {self.current_backend} degraded ({reason}) "
+                "but no other compatible backend is available"
+            )
+            # Judge the backend afresh rather than on every later call.
+            self._samples.clear()
+            self._active_since = time.monotonic()
+
+    async def _maybe_recover(self) -> None:
+        """Return to a preferred backend once its retry time has passed."""
+        index = self._candidate_index(self.current_config)
+        if not index or time.monotonic() - self._active_since < self.failover_cooldown:
+            return
+        now = time.monotonic()
+        for candidate in range(index):
+            if self._backoff.get(candidate, (0, 0))[1] <= now:
+                async with self._switch_lock:
+                    if self._candidate_index(self.current_config) == index:
+                        await self._switch_to(candidate, "retrying preferred backend")
+                return
+
+    def _candidate_index(self, config: Optional[ModelConfig]) -> Optional[int]:
+        for index, candidate in enumerate(self._candidates):
+            if candidate is config:
+                return index
+        return None
+
+    def _mark_failed(self, index: int) -> None:
+        failures = self._backoff.get(index, (0, 0))[0] + 1
+        delay = self.recovery_interval * 2 ** min(failures - 1, 4)
+        self._backoff[index] = (failures, time.monotonic() + delay)
+
+    async def _switch_to(self, index: int, reason: str) -> bool:
+        config = self._candidates[index]
+        try:
+            infrastructure = self._build_backend(config)
+            await infrastructure.startup()
+        except Exception as e:
+            self.logger.warning(f"Could not start LLM backend {config.backend}: {e}")
+            self._mark_failed(index)
+            return False
+
+        previous, previous_backend = self.active_infrastructure, self.current_backend
+        self._account_backend_time()
+        self.active_infrastructure = infrastructure
+        self.current_backend = config.backend
+        self.current_config = config
+        self._samples.clear()
+        self._baseline_latency = None
+        self._failover_metrics["switches"] += 1
+        self._switch_log.append(
+            {
+                "at": time.time(),
+                "from": previous_backend.value if previous_backend else None,
+                "to": config.backend.value,
+                "reason": reason,
+            }
+        )
+        self.logger.warning(
+            f"Switched LLM backend from {previous_backend} to {config.backend}: "
+            f"{reason}"
+        )
+        if previous is not None:
+            try:
+                await previous.shutdown()
+            except Exception as e:
+                self.logger.debug(f"Previous LLM backend shutdown failed: {e}")
+        return True
+
+    def _account_backend_time(self) -> None:
+        now = time.monotonic()
+        if self.current_backend is not None:
+            key = self.current_backend.value
+            self._time_on_backend[key] = (
+                self._time_on_backend.get(key, 0.0) + now - self._active_since
+            )
+        self._active_since = now
+
     async def health_check(self) -> bool:
         """Check if the active infrastructure is healthy."""
         if not self.active_infrastructure:
@@ -259,9 +620,7 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
 
         for model_config in models[:3]:
             try:
-                self.logger.info(f"Benchmarking {model_config.backend}...")
-
-                benchmark = await self._run_performance_test(model_config)
+                benchmark = await self._cached_benchmark(model_config)
                 self.benchmark_results[model_config.backend] = benchmark
 
                 if (
@@ -295,48 +654,74 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
 
         return best_model
 
+    async def _cached_benchmark(
+        self, model_config: ModelConfig
+    ) -> PerformanceBenchmark:
+        """Return a stored benchmark for this machine, or measure and store one."""
+        key = None
+        if self.benchmark_cache is not None:
+            key = BenchmarkCache.key(model_config, self.acceleration_type)
+            if not self.force_benchmark:
+                cached = self.benchmark_cache.get(key)
+                if cached is not None:
+                    self.logger.info(
+                        f"Using stored benchmark for {model_config.backend}"
+                    )
+                    return cached
+
+        self.logger.info(f"Benchmarking {model_config.backend}...")
+        benchmark = await self._run_performance_test(model_config)
+        if key is not None:
+            try:
+                self.benchmark_cache.put(key, model_config, benchmark)
+            except OSError as e:
+                self.logger.warning(f"Could not store benchmark: {e}")
+        return benchmark
+
     async def _run_performance_test(
         self, model_config: ModelConfig
     ) -> PerformanceBenchmark:
-        """Run performance test on a model configuration."""
-        start_time = time.time()
+        """Time a real generation through the backend described by ``model_config``.
+
+        Model loading happens in ``startup`` and is excluded from the timings
+        but included in the memory figure, which is the growth in resident
+        memory while the backend is loaded.
+        """
+        start_time = time.perf_counter()
+        memory_before = _memory_usage_mb()
+        test_infra = None
 
         try:
             test_infra = await self._create_test_infrastructure(model_config)
+            await test_infra.startup()
 
-            test_prompt = (
-                "What is the capital of France? Please provide a brief explanation."
+            generation_start = time.perf_counter()
+            result, ttft = await asyncio.wait_for(
+                self._measure_generation(test_infra, BENCHMARK_PROMPT),
+                self.benchmark_timeout,
             )
+            generation_time = time.perf_counter() - generation_start
+            memory_usage_mb = max(0.0, _memory_usage_mb() - memory_before)
 
-            generation_start = time.time()
-
-            if model_config.backend == ModelBackend.GPT_OSS_HARMONY:
-                result = await self._test_harmony_model(test_infra, test_prompt)
-            else:
-                result = await self._test_standard_model(test_infra, test_prompt)
-
-            generation_time = time.time() - generation_start
-
-            token_count = len(result.split()) if result else 0
+            token_count = self.token_counter.count(result) if result else 0
             tokens_per_second = (
                 token_count / generation_time if generation_time > 0 else 0
             )
-            latency_ms = generation_time * 1000
-
-            memory_usage_mb = 1024
-
-            if hasattr(test_infra, "shutdown"):
-                await test_infra.shutdown()
 
             return PerformanceBenchmark(
                 tokens_per_second=tokens_per_second,
-                latency_ms=latency_ms,
+                latency_ms=generation_time * 1000,
                 memory_usage_mb=memory_usage_mb,
                 success=True,
+                ttft_ms=ttft * 1000,
             )
 
         except Exception as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
+            if isinstance(e, asyncio.TimeoutError):
+                e = TimeoutError(
+                    f"Benchmark exceeded {self.benchmark_timeout:.1f}s timeout"
+                )
             return PerformanceBenchmark(
                 tokens_per_second=0.0,
                 latency_ms=elapsed_time * 1000,
@@ -345,41 +730,66 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
                 error_message=str(e),
             )
 
+        finally:
+            if test_infra is not None:
+                try:
+                    await test_infra.shutdown()
+                except Exception as e:
+                    self.logger.debug(f"Benchmark backend shutdown failed: {e}")
+
+    async def _measure_generation(
+        self, infrastructure: Any, prompt: str
+    ) -> Tuple[str, float]:
+        """Generate a response and return it with the time to its first chunk.
+
+        Backends that cannot stream report their full latency as TTFT.
+        """
+        start = time.perf_counter()
+        stream = getattr(infrastructure, "stream", None)
+        if stream is None:
+            result = await infrastructure.generate(prompt)
+            return result, time.perf_counter() - start
+
+        chunks: List[str] = []
+        ttft = 0.0
+        async for chunk in stream(prompt):
+            if not chunks:
+                ttft = time.perf_counter() - start
+            chunks.append(chunk)
+        return "".join(chunks), ttft
+
     async def _create_test_infrastructure(self, model_config: ModelConfig) -> Any:
         """Create a test infrastructure instance for benchmarking."""
         if model_config.backend == ModelBackend.GPT_OSS_HARMONY:
             return HarmonyOSSInfrastructure(
-                model_name=model_config.model_name,
+                model_path=model_config.model_name,
                 temperature=model_config.temperature,
                 max_tokens=min(100, model_config.max_tokens),
             )
         else:
-            return MockInfrastructure(model_config)
-
-    async def _test_harmony_model(self, infrastructure: Any, prompt: str) -> str:
-        """Test harmony model performance."""
-        await asyncio.sleep(0.1)
-        return (
-            "Paris is the capital of France. It is known for its culture and history."
-        )
+            return StandardModelInfrastructure(
+                model_config, max_tokens=min(100, model_config.max_tokens)
+            )
 
-    async def _test_standard_model(self, infrastructure: Any, prompt: str) -> str:
-        """Test standard transformers model performance."""
-        await asyncio.sleep(0.2)
-        return "The capital of France is Paris."
+    def _build_backend(self, model_config: ModelConfig) -> BaseInfrastructure:
+        """Create, without starting, the infrastructure for ``model_config``."""
+        if model_config.backend == ModelBackend.GPT_OSS_HARMONY:
+            return HarmonyOSSInfrastructure(
+                model_path=model_config.model_name,
+                temperature=model_config.temperature,
+                max_tokens=model_config.max_tokens,
+            )
+        return StandardModelInfrastructure(model_config)
 
     async def _initialize_backend(self, model_config: ModelConfig) -> None:
         """Initialize the selected backend infrastructure."""
+        self._account_backend_time()
         self.current_backend = model_config.backend
+        self.current_config = model_config
+        self._samples.clear()
+        self._baseline_latency = None
 
-        if model_config.backend == ModelBackend.GPT_OSS_HARMONY:
-            self.active_infrastructure = HarmonyOSSInfrastructure(
-                model_name=model_config.model_name,
-                temperature=model_config.temperature,
-                max_tokens=model_config.max_tokens,
-            )
-        else:
-            self.active_infrastructure = StandardModelInfrastructure(model_config)
+        self.active_infrastructure = self._build_backend(model_config)
 
         await self.active_infrastructure.startup()
 
@@ -393,9 +803,36 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
                 "memory_usage_mb": benchmark.memory_usage_mb,
                 "success": benchmark.success,
                 "error_message": benchmark.error_message,
+                "ttft_ms": benchmark.ttft_ms,
             }
         return results
 
+    @property
+    def model(self) -> Optional[str]:
+        """Backend and model name of the active configuration.
+
+        Response caches and request coalescing key on this, so answers from
+        one backend are never served after failing over to another.
+        """
+        if self.current_config is None:
+            return None
+        return f"{self.current_config.backend.value}:{self.current_config.model_name}"
+
+    @property
+    def stateful(self) -> bool:
+        """Whether the active backend's answers depend on conversation state."""
+        return bool(getattr(self.active_infrastructure, "stateful", False))
+
+    @property
+    def temperature(self) -> Optional[float]:
+        """Sampling temperature of the active configuration."""
+        return self.current_config.temperature if self.current_config else None
+
+    @property
+    def max_tokens(self) -> Optional[int]:
+        """Completion token limit of the active configuration."""
+        return self.current_config.max_tokens if self.current_config else None
+
     def get_current_config(self) -> Dict[str, Any]:
         """Get current active configuration."""
         return {
@@ -406,6 +843,32 @@ class AdaptiveLLMInfrastructure(BaseInfrastructure):
             "benchmark_results": self.get_benchmark_results(),
         }
 
+    def get_failover_stats(self) -> Dict[str, Any]:
+        """Return live backend health and switching history for monitoring.
+
+        ``time_on_backend`` is the seconds each backend has been active,
+        including the current one up to now.
+        """
+        time_on_backend = dict(self._time_on_backend)
+        if self.current_backend is not None:
+            key = self.current_backend.value
+            time_on_backend[key] = (
+                time_on_backend.get(key, 0.0) + time.monotonic() - self._active_since
+            )
+        error_rate, median = self._window_stats()
+        return {
+            **self._failover_metrics,
+            "current_backend": (
+                self.current_backend.value if self.current_backend else None
+            ),
+            "window_samples": len(self._samples),
+            "window_error_rate": error_rate,
+            "window_median_latency": median,
+            "latency_threshold": self._latency_threshold(),
+            "time_on_backend": time_on_backend,
+            "recent_switches": list(self._switch_log),
+        }
+
 
 class MockInfrastructure(BaseInfrastructure):
     """Mock infrastructure for testing fallback models."""
@@ -419,11 +882,53 @@ class MockInfrastructure(BaseInfrastructure):
 
 
 class StandardModelInfrastructure(BaseInfrastructure):
-    """Standard transformers model infrastructure."""
+    """Standard transformers model infrastructure.
 
-    def __init__(self, model_config: ModelConfig):
+    The model is loaded into a ``transformers`` text-generation pipeline in
+    ``startup``, so benchmarks time generation only; loading and generation
+    both run in a worker thread.
+    """
+
+    def __init__(self, model_config: ModelConfig, max_tokens: Optional[int] = None):
         super().__init__()
         self.model_config = model_config
+        self.max_tokens = max_tokens or model_config.max_tokens
+        self._pipeline = None
+
+    def _load_pipeline(self) -> Any:
+        if self._pipeline is None:
+            if not TRANSFORMERS_AVAILABLE:
+                raise RuntimeError(
+                    f"transformers is required for the "
+                    f"{self.model_config.backend.value} backend"
+                )
+            self._pipeline = transformers.pipeline(
+                "text-generation", model=self.model_config.model_name
+            )
+        return self._pipeline
+
+    async def startup(self) -> None:
+        await super().startup()
+        await asyncio.to_thread(self._load_pipeline)
+
+    async def generate(self, prompt: str) -> str:
+        """Generate a completion for ``prompt``."""
+
+        def run() -> str:
+            output = self._load_pipeline()(
+                prompt,
+                max_new_tokens=self.max_tokens,
+                temperature=self.model_config.temperature,
+                do_sample=self.model_config.temperature > 0,
+                return_full_text=False,
+            )
+            return output[0]["generated_text"]
+
+        return await asyncio.to_thread(run)
+
+    async def shutdown(self) -> None:
+        self._pipeline = None
+        await super().shutdown()
 
     async def health_check(self) -> bool:
         return True
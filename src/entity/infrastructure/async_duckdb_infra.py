@@ -10,6 +10,14 @@ from typing import Any, AsyncGenerator, Optional
 import aiosqlite
 
 from .base import BaseInfrastructure
+from .bulk_load import (
+    AdaptiveChunker,
+    BulkLoadStats,
+    ProgressCallback,
+    RowSource,
+    bulk_load,
+    insert_statement,
+)
 
 
 class AsyncDuckDBInfrastructure(BaseInfrastructure):
@@ -302,6 +310,18 @@ class AsyncDuckDBInfrastructure(BaseInfrastructure):
                 self.logger.error("Script execution error: %s", e)
                 raise
 
+    async def _executemany_in_transaction(
+        self, conn: aiosqlite.Connection, query: str, parameters_list: list[tuple]
+    ) -> None:
+        """Run ``executemany`` inside one transaction so the batch commits once."""
+        await conn.execute("BEGIN")
+        try:
+            await conn.executemany(query, parameters_list)
+        except BaseException:
+            await conn.execute("ROLLBACK")
+            raise
+        await conn.execute("COMMIT")
+
     async def execute_many(self, query: str, parameters_list: list[tuple]) -> None:
         """Execute a query multiple times with different parameters.
 
@@ -318,8 +338,8 @@ class AsyncDuckDBInfrastructure(BaseInfrastructure):
         async with self.connect() as conn:
             try:
                 await asyncio.wait_for(
-                    conn.executemany(query, parameters_list),
-                    timeout=self.query_timeout * len(parameters_list) / 100,
+                    self._executemany_in_transaction(conn, query, parameters_list),
+                    timeout=self.query_timeout,
                 )
             except asyncio.TimeoutError:
                 self.logger.error(
@@ -329,3 +349,54 @@ class AsyncDuckDBInfrastructure(BaseInfrastructure):
             except Exception as e:
                 self.logger.error("Batch execution error: %s", e)
                 raise
+
+    async def bulk_insert(
+        self,
+        table: str,
+        rows: RowSource,
+        columns: Optional[list[str]] = None,
+        chunker: Optional[AdaptiveChunker] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> BulkLoadStats:
+        """Insert rows from any iterable or async iterable in chunks.
+
+        Each chunk is written with ``executemany`` in its own transaction and
+        gets the full ``query_timeout``. Chunk sizes adapt to keep each
+        commit near the chunker's target duration.
+
+        Args:
+            table: Target table name
+            rows: Iterable or async iterable of row tuples
+            columns: Optional column names matching each row's values
+            chunker: Chunk sizing policy; a default ``AdaptiveChunker`` if omitted
+            on_progress: Called with the running statistics after each chunk
+
+        Returns:
+            Final statistics with row count, chunk count and throughput
+
+        Examples:
+            >>> stats = await infra.bulk_insert(
+            ...     "events", ((i, f"event_{i}") for i in range(100_000))
+            ... )
+            >>> print(f"{stats.rows_per_second:.0f} rows/s")
+        """
+
+        async def write_chunk(chunk: list[tuple]) -> None:
+            query = insert_statement(table, columns, len(chunk[0]))
+            async with self.connect() as conn:
+                await asyncio.wait_for(
+                    self._executemany_in_transaction(conn, query, chunk),
+                    timeout=self.query_timeout,
+                )
+
+        stats = await bulk_load(
+            rows, write_chunk, chunker or AdaptiveChunker(), on_progress
+        )
+        self.logger.info(
+            "Bulk inserted %d rows into %s in %d chunks (%.0f rows/s)",
+            stats.rows,
+            table,
+            stats.chunks,
+            stats.rows_per_second,
+        )
+        return stats
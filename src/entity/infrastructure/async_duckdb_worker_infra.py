@@ -0,0 +1,545 @@
+"""Asynchronous DuckDB infrastructure backed by per-connection worker threads."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import queue
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncGenerator, Callable, Optional, Sequence
+
+from .base import BaseInfrastructure
+from .bulk_load import (
+    AdaptiveChunker,
+    BulkLoadStats,
+    ProgressCallback,
+    RowSource,
+    bulk_load,
+    insert_statement,
+    insert_target,
+)
+from .duckdb_infra import _is_read_only
+
+try:
+    import pyarrow
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pyarrow = None
+    PYARROW_AVAILABLE = False
+
+_ROWCOUNT_KEYWORDS = frozenset({"INSERT", "UPDATE", "DELETE"})
+
+
+def _returns_rowcount(query: str) -> bool:
+    """Return ``True`` if DuckDB answers ``query`` with a single row count."""
+
+    words = query.lstrip(" \t\r\n(").split(None, 1)
+    return (
+        bool(words)
+        and words[0].upper() in _ROWCOUNT_KEYWORDS
+        and "RETURNING" not in query.upper()
+    )
+
+
+class _Worker:
+    """A DuckDB connection owned by one thread that runs queued requests.
+
+    DuckDB connections must not be used from several threads at once, so
+    every call for a connection is executed by its worker in submission
+    order. Requests cancelled before they start are skipped; a request that
+    is already running is stopped with ``interrupt()``.
+    """
+
+    def __init__(self, conn: Any, name: str) -> None:
+        self.conn = conn
+        self._requests: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._current: Optional[concurrent.futures.Future] = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+            future, func, args = request
+            with self._lock:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._current = future
+            try:
+                result = func(*args)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+            finally:
+                with self._lock:
+                    self._current = None
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._requests.put((future, func, args))
+        return future
+
+    def interrupt(self, future: concurrent.futures.Future) -> bool:
+        """Interrupt ``future`` if it is the request currently running."""
+        with self._lock:
+            if self._current is not future:
+                return False
+            self.conn.interrupt()
+            return True
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._requests.put(None)
+        self._thread.join(timeout)
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+class AsyncDuckDBCursor:
+    """Awaitable cursor over a DuckDB result.
+
+    Buffered cursors hold rows that were materialized before the connection
+    went back to the pool. Unbuffered cursors fetch from the connection on
+    its worker thread, so they are only valid inside ``connect()``.
+    """
+
+    def __init__(
+        self,
+        connection: AsyncDuckDBConnection,
+        description: Any,
+        rowcount: int = -1,
+        rows: Optional[list[tuple]] = None,
+    ) -> None:
+        self._connection = connection
+        self.description = description
+        self.rowcount = rowcount
+        self._rows = rows
+        self._position = 0
+
+    async def fetchone(self) -> Optional[tuple]:
+        if self._rows is not None:
+            rows = await self.fetchmany(1)
+            return rows[0] if rows else None
+        return await self._connection._call(self._connection._conn.fetchone)
+
+    async def fetchmany(self, size: int = 1) -> list[tuple]:
+        if self._rows is not None:
+            start = self._position
+            self._position = min(start + size, len(self._rows))
+            return self._rows[start : self._position]
+        return await self._connection._call(self._connection._conn.fetchmany, size)
+
+    async def fetchall(self) -> list[tuple]:
+        if self._rows is not None:
+            return await self.fetchmany(len(self._rows))
+        return await self._connection._call(self._connection._conn.fetchall)
+
+    async def close(self) -> None:
+        self._rows = []
+        self._position = 0
+
+
+class AsyncDuckDBConnection:
+    """Async facade over a pooled DuckDB cursor running on its own worker."""
+
+    def __init__(
+        self, infrastructure: AsyncDuckDBWorkerInfrastructure, worker: _Worker
+    ) -> None:
+        self._infrastructure = infrastructure
+        self._worker = worker
+        self._conn = worker.conn
+
+    async def _call(
+        self, func: Callable[..., Any], *args: Any, timeout: float | None = None
+    ) -> Any:
+        """Run ``func`` on the worker thread, interrupting it on timeout or cancel."""
+        timeout = self._infrastructure.query_timeout if timeout is None else timeout
+        future = self._worker.submit(func, *args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            future.cancel()
+            interrupted = self._worker.interrupt(future)
+            self._infrastructure._record_abort(
+                timed_out=isinstance(exc, asyncio.TimeoutError),
+                interrupted=interrupted,
+            )
+            raise
+
+    def _execute(
+        self, query: str, parameters: Sequence[Any], materialize: bool
+    ) -> tuple[Any, int, Optional[list[tuple]]]:
+        self._conn.execute(query, parameters)
+        description = self._conn.description
+        if _returns_rowcount(query):
+            row = self._conn.fetchone()
+            return description, row[0] if row else -1, []
+        if materialize:
+            return description, -1, self._conn.fetchall()
+        return description, -1, None
+
+    async def execute(
+        self,
+        query: str,
+        parameters: Sequence[Any] = (),
+        materialize: bool = False,
+    ) -> AsyncDuckDBCursor:
+        """Execute ``query`` and return a cursor over its result."""
+        description, rowcount, rows = await self._call(
+            self._execute, query, tuple(parameters), materialize
+        )
+        return AsyncDuckDBCursor(self, description, rowcount, rows)
+
+    def _executemany(self, query: str, parameters_list: list[tuple]) -> None:
+        self._conn.execute("BEGIN TRANSACTION")
+        try:
+            self._conn.executemany(query, parameters_list)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    async def executemany(
+        self, query: str, parameters_list: list[tuple], timeout: float | None = None
+    ) -> None:
+        """Execute ``query`` for every parameter tuple inside one transaction."""
+        await self._call(self._executemany, query, parameters_list, timeout=timeout)
+
+    def _insert_arrow(self, target: str, table: Any) -> None:
+        view = f"entity_bulk_{id(table)}"
+        self._conn.register(view, table)
+        try:
+            self._conn.execute("BEGIN TRANSACTION")
+            try:
+                self._conn.execute(f"INSERT INTO {target} SELECT * FROM {view}")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        finally:
+            self._conn.unregister(view)
+
+    async def insert_arrow(
+        self, target: str, table: Any, timeout: float | None = None
+    ) -> None:
+        """Insert a ``pyarrow.Table`` into ``target`` in one transaction.
+
+        ``target`` is a table name, optionally followed by a column list.
+        """
+        await self._call(self._insert_arrow, target, table, timeout=timeout)
+
+    async def executescript(self, script: str, timeout: float | None = None) -> None:
+        """Execute a multi-statement SQL script."""
+        await self._call(self._conn.execute, script, timeout=timeout)
+
+    async def commit(self) -> None:
+        """No-op for API parity; DuckDB auto-commits outside explicit transactions."""
+
+    async def close(self) -> None:
+        """No-op; pooled connections are closed by the infrastructure."""
+
+
+class AsyncDuckDBWorkerInfrastructure(BaseInfrastructure):
+    """Layer 1 infrastructure running DuckDB asynchronously on worker threads.
+
+    One owner connection opens the database. Each pooled reader and the
+    single writer is a cursor from it with a dedicated thread fed by a
+    request queue, so the event loop never blocks on DuckDB and every
+    connection is used by exactly one thread. Writes are routed to the
+    writer and run one at a time. The public API mirrors
+    :class:`AsyncDuckDBInfrastructure`, so it can back
+    ``AsyncDatabaseResource`` unchanged while storing data in DuckDB like
+    the synchronous path.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        pool_size: int = 5,
+        query_timeout: float = 30.0,
+        version: str | None = None,
+    ) -> None:
+        """Initialize the worker-backed infrastructure.
+
+        Args:
+            file_path: Path to the database file, or ":memory:" for in-memory DB
+            pool_size: Maximum number of reader connections checked out at once
+            query_timeout: Seconds to wait for a connection or a query; running
+                queries are interrupted when it expires
+            version: Optional version string for infrastructure tracking
+        """
+        super().__init__(version)
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.file_path = file_path
+        self.pool_size = pool_size
+        self.query_timeout = query_timeout
+
+        self._owner: Any = None
+        self._owner_lock = threading.Lock()
+        self._writer: Optional[_Worker] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._idle: list[_Worker] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._workers_created = 0
+        self._in_use = 0
+        self._is_started = False
+        self._metrics = {"timeouts": 0, "cancelled": 0, "interrupted": 0}
+
+    def _new_worker(self, role: str) -> _Worker:
+        with self._owner_lock:
+            conn = self._owner.cursor()
+            self._workers_created += 1
+            name = f"duckdb-{role}-{self._workers_created}"
+        return _Worker(conn, name)
+
+    def _record_abort(self, timed_out: bool, interrupted: bool) -> None:
+        self._metrics["timeouts" if timed_out else "cancelled"] += 1
+        if interrupted:
+            self._metrics["interrupted"] += 1
+            self.logger.warning("Interrupted running query on %s", self.file_path)
+
+    async def startup(self) -> None:
+        """Open the database and start the writer worker."""
+        await super().startup()
+        import duckdb
+
+        if self.file_path != ":memory:":
+            Path(self.file_path).parent.mkdir(parents=True, exist_ok=True)
+        self._owner = await asyncio.to_thread(duckdb.connect, self.file_path)
+        self._writer = self._new_worker("writer")
+        self._write_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.pool_size)
+        self._is_started = True
+        self.logger.info(
+            "Async DuckDB infrastructure ready: %s (pool_size=%d, timeout=%.1fs)",
+            self.file_path,
+            self.pool_size,
+            self.query_timeout,
+        )
+
+    async def shutdown(self) -> None:
+        """Stop every worker and close the database."""
+        await super().shutdown()
+        self._is_started = False
+        workers = self._idle + ([self._writer] if self._writer else [])
+        self._idle = []
+        self._writer = None
+        for worker in workers:
+            await asyncio.to_thread(worker.stop, self.query_timeout)
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+        self.logger.info("Async DuckDB infrastructure shut down")
+
+    async def _acquire(self) -> _Worker:
+        if not self._is_started:
+            raise RuntimeError("Infrastructure not started. Call startup() first.")
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.query_timeout)
+        except asyncio.TimeoutError:
+            self._metrics["timeouts"] += 1
+            raise
+        self._in_use += 1
+        if self._idle:
+            return self._idle.pop()
+        try:
+            return self._new_worker("reader")
+        except BaseException:
+            self._in_use -= 1
+            self._semaphore.release()
+            raise
+
+    def _release(self, worker: _Worker) -> None:
+        self._in_use -= 1
+        if self._is_started:
+            self._idle.append(worker)
+        else:
+            worker.stop(timeout=0)
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def connect(
+        self, write: bool = False
+    ) -> AsyncGenerator[AsyncDuckDBConnection, None]:
+        """Yield an async connection backed by a worker thread.
+
+        Args:
+            write: Use the dedicated writer instead of a pooled reader.
+                Writers are serialized so only one runs at a time.
+
+        Examples:
+            >>> async with infrastructure.connect() as conn:
+            ...     cursor = await conn.execute("SELECT * FROM table")
+            ...     rows = await cursor.fetchall()
+        """
+        if write:
+            if not self._is_started:
+                raise RuntimeError("Infrastructure not started. Call startup() first.")
+            async with self._write_lock:
+                yield AsyncDuckDBConnection(self, self._writer)
+            return
+
+        worker = await self._acquire()
+        try:
+            yield AsyncDuckDBConnection(self, worker)
+        finally:
+            self._release(worker)
+
+    async def execute_async(
+        self,
+        query: str,
+        parameters: tuple = (),
+        fetch_one: bool = False,
+        fetch_all: bool = False,
+    ) -> Any:
+        """Execute a query with automatic connection management.
+
+        Args:
+            query: SQL query string to execute
+            parameters: Query parameters as a tuple
+            fetch_one: If True, return only the first row
+            fetch_all: If True, return all rows as a list
+
+        Returns:
+            Query result based on fetch options, or a buffered cursor if no
+            fetch is specified
+        """
+        async with self.connect(write=not _is_read_only(query)) as conn:
+            try:
+                cursor = await conn.execute(query, parameters, materialize=True)
+            except asyncio.TimeoutError:
+                self.logger.error(
+                    "Query timeout after %.1fs: %s", self.query_timeout, query[:100]
+                )
+                raise
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(
+                    "Query execution error: %s - Query: %s", e, query[:100]
+                )
+                raise
+
+        if fetch_one:
+            return await cursor.fetchone()
+        if fetch_all:
+            return await cursor.fetchall()
+        return cursor
+
+    async def execute_script(self, script: str) -> None:
+        """Execute a multi-statement SQL script on the writer."""
+        async with self.connect(write=True) as conn:
+            await conn.executescript(script, timeout=self.query_timeout * 2)
+
+    async def execute_many(self, query: str, parameters_list: list[tuple]) -> None:
+        """Execute a query for every parameter tuple in a single transaction."""
+        if not parameters_list:
+            return
+        async with self.connect(write=True) as conn:
+            await conn.executemany(query, parameters_list)
+
+    async def bulk_insert(
+        self,
+        table: str,
+        rows: RowSource,
+        columns: Optional[list[str]] = None,
+        chunker: Optional[AdaptiveChunker] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> BulkLoadStats:
+        """Insert rows from any iterable or async iterable in chunks.
+
+        With ``pyarrow`` installed each chunk is converted to an Arrow table
+        and ingested by DuckDB in a single columnar ``INSERT ... SELECT``;
+        otherwise chunks fall back to ``executemany``. Every chunk commits
+        in its own transaction on the writer and gets the full
+        ``query_timeout``.
+
+        Args:
+            table: Target table name
+            rows: Iterable or async iterable of row tuples
+            columns: Optional column names matching each row's values
+            chunker: Chunk sizing policy; a default ``AdaptiveChunker`` if omitted
+            on_progress: Called with the running statistics after each chunk
+
+        Returns:
+            Final statistics with row count, chunk count and throughput
+        """
+        target = insert_target(table, columns)
+
+        async def write_arrow(chunk: list[tuple]) -> None:
+            names = columns or [f"c{i}" for i in range(len(chunk[0]))]
+            arrow_table = pyarrow.table(
+                {name: list(values) for name, values in zip(names, zip(*chunk))}
+            )
+            async with self.connect(write=True) as conn:
+                await conn.insert_arrow(target, arrow_table)
+
+        async def write_rows(chunk: list[tuple]) -> None:
+            query = insert_statement(table, columns, len(chunk[0]))
+            async with self.connect(write=True) as conn:
+                await conn.executemany(query, chunk)
+
+        if PYARROW_AVAILABLE:
+            write_chunk, method = write_arrow, "arrow"
+        else:
+            write_chunk, method = write_rows, "executemany"
+        stats = await bulk_load(
+            rows, write_chunk, chunker or AdaptiveChunker(), on_progress, method
+        )
+        self.logger.info(
+            "Bulk inserted %d rows into %s in %d chunks via %s (%.0f rows/s)",
+            stats.rows,
+            table,
+            stats.chunks,
+            method,
+            stats.rows_per_second,
+        )
+        return stats
+
+    async def health_check(self) -> bool:
+        """Return ``True`` if a pooled connection can run a query."""
+        try:
+            result = await self.execute_async("SELECT 1", fetch_one=True)
+            return bool(result and result[0] == 1)
+        except Exception as exc:
+            self.logger.warning("Health check failed for %s: %s", self.file_path, exc)
+            return False
+
+    def health_check_sync(self) -> bool:
+        """Synchronous health check that bypasses the worker threads."""
+        if self._owner is None:
+            return False
+        try:
+            with self._owner_lock:
+                cursor = self._owner.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    async def get_connection_stats(self) -> dict[str, Any]:
+        """Return pool, worker and abort statistics for monitoring."""
+        return {
+            "pool_size": self.pool_size,
+            "active_connections": len(self._idle),
+            "in_use": self._in_use,
+            "workers_created": self._workers_created,
+            "file_path": self.file_path,
+            "query_timeout": self.query_timeout,
+            "is_started": self._is_started,
+            "timeouts": self._metrics["timeouts"],
+            "cancelled": self._metrics["cancelled"],
+            "interrupted": self._metrics["interrupted"],
+        }
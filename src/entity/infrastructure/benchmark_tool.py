@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from .adaptive_llm_infra import AdaptiveLLMInfrastructure, PerformanceBenchmark
+from .token_counter import TokenCounter, default_token_counter
 
 
 @dataclass
@@ -45,12 +46,18 @@ class BenchmarkResult:
 class LLMBenchmarkTool:
     """Tool for benchmarking LLM infrastructure performance."""
 
-    def __init__(self, output_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        output_dir: Optional[Path] = None,
+        token_counter: Optional[TokenCounter] = None,
+    ):
         """Initialize benchmark tool.
 
         Args:
             output_dir: Directory to save benchmark results (default: ./benchmark_results)
+            token_counter: Counts generated tokens (default: tiktoken or an estimate)
         """
+        self.token_counter = token_counter or default_token_counter()
         self.output_dir = output_dir or Path("./benchmark_results")
         self.output_dir.mkdir(exist_ok=True)
 
@@ -222,7 +229,7 @@ class LLMBenchmarkTool:
             end_time = time.time()
             elapsed_time = end_time - start_time
 
-            token_count = len(response.split())
+            token_count = self.token_counter.count(response)
             tokens_per_second = token_count / elapsed_time if elapsed_time > 0 else 0
             latency_ms = elapsed_time * 1000
             memory_usage_mb = 512
@@ -336,6 +343,14 @@ async def run_benchmark_cli():
         help="Specific suites to run",
         choices=["quick_qa", "reasoning_tasks", "code_generation", "creative_writing"],
     )
+    parser.add_argument(
+        "--rebenchmark",
+        action="store_true",
+        help="Re-run backend selection benchmarks instead of using stored results",
+    )
+    parser.add_argument(
+        "--benchmark-cache", type=Path, help="File of stored backend benchmarks"
+    )
 
     args = parser.parse_args()
 
@@ -347,7 +362,9 @@ async def run_benchmark_cli():
         ]
 
     print("Initializing adaptive LLM infrastructure...")
-    infrastructure = AdaptiveLLMInfrastructure()
+    infrastructure = AdaptiveLLMInfrastructure(
+        benchmark_cache=args.benchmark_cache, force_benchmark=args.rebenchmark
+    )
     await infrastructure.startup()
 
     try:
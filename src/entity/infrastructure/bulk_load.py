@@ -0,0 +1,139 @@
+"""Helpers for chunked bulk loading into database infrastructures."""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Optional
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+RowSource = Iterable[tuple] | AsyncIterable[tuple]
+
+
+@dataclass
+class BulkLoadStats:
+    """Progress of a bulk load, updated after every committed chunk."""
+
+    rows: int = 0
+    chunks: int = 0
+    chunk_size: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed: float = 0.0
+    method: str = "executemany"
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "chunk_size": self.chunk_size,
+            "elapsed": self.elapsed,
+            "rows_per_second": self.rows_per_second,
+            "method": self.method,
+        }
+
+
+ProgressCallback = Callable[[BulkLoadStats], None]
+
+
+class AdaptiveChunker:
+    """Size chunks so each one takes roughly ``target_seconds`` to commit.
+
+    The chunk size doubles while chunks finish in under half the target and
+    halves when one takes more than twice the target, staying within
+    ``[min_size, max_size]``.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 1000,
+        target_seconds: float = 0.5,
+        min_size: int = 100,
+        max_size: int = 100_000,
+    ) -> None:
+        if not 1 <= min_size <= max_size:
+            raise ValueError("chunk sizes must satisfy 1 <= min_size <= max_size")
+        self.size = min(max(initial_size, min_size), max_size)
+        self.target_seconds = target_seconds
+        self.min_size = min_size
+        self.max_size = max_size
+
+    def record(self, rows: int, seconds: float) -> None:
+        """Adjust the chunk size after ``rows`` rows took ``seconds`` to write."""
+        if rows < self.size:
+            return
+        if seconds < self.target_seconds / 2:
+            self.size = min(self.size * 2, self.max_size)
+        elif seconds > self.target_seconds * 2:
+            self.size = max(self.size // 2, self.min_size)
+
+
+async def iter_chunks(
+    rows: RowSource, chunker: AdaptiveChunker
+) -> AsyncIterator[list[tuple]]:
+    """Yield lists of rows from a sync or async iterable, sized by ``chunker``.
+
+    The chunk size is read each time a chunk starts, so adjustments made by
+    the consumer between chunks take effect immediately.
+    """
+    chunk: list[tuple] = []
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            chunk.append(tuple(row))
+            if len(chunk) >= chunker.size:
+                yield chunk
+                chunk = []
+    else:
+        for row in rows:
+            chunk.append(tuple(row))
+            if len(chunk) >= chunker.size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def insert_target(table: str, columns: Optional[list[str]] = None) -> str:
+    """Return ``table`` with its optional column list, validating identifiers."""
+    names = columns or []
+    for name in [table, *names]:
+        if not _IDENTIFIER.match(name):
+            raise ValueError(f"Invalid identifier: {name!r}")
+    return f"{table} ({', '.join(names)})" if names else table
+
+
+def insert_statement(table: str, columns: Optional[list[str]], width: int) -> str:
+    """Build a parameterized INSERT of ``width`` values into ``table``."""
+    placeholders = ", ".join("?" * width)
+    return f"INSERT INTO {insert_target(table, columns)} VALUES ({placeholders})"
+
+
+async def bulk_load(
+    rows: RowSource,
+    write_chunk: Callable[[list[tuple]], Any],
+    chunker: AdaptiveChunker,
+    on_progress: Optional[ProgressCallback] = None,
+    method: str = "executemany",
+) -> BulkLoadStats:
+    """Drive ``write_chunk`` over ``rows`` and return the final statistics.
+
+    ``write_chunk`` is awaited once per chunk and must commit it atomically.
+    """
+    stats = BulkLoadStats(chunk_size=chunker.size, method=method)
+    async for chunk in iter_chunks(rows, chunker):
+        start = time.perf_counter()
+        await write_chunk(chunk)
+        chunker.record(len(chunk), time.perf_counter() - start)
+        stats.rows += len(chunk)
+        stats.chunks += 1
+        stats.chunk_size = chunker.size
+        stats.elapsed = time.perf_counter() - stats.started_at
+        if on_progress is not None:
+            on_progress(stats)
+    stats.elapsed = time.perf_counter() - stats.started_at
+    return stats
@@ -12,6 +12,15 @@ class DuckDBConfig(BaseModel):
         default=":memory:", description="Path to DuckDB file or ':memory:'"
     )
     pool_size: int = Field(default=5, ge=1, le=100, description="Connection pool size")
+    acquire_timeout: float = Field(
+        default=30.0, gt=0, description="Seconds to wait for a pooled connection"
+    )
+    max_lifetime: Optional[float] = Field(
+        default=3600.0, gt=0, description="Seconds before a connection is recycled"
+    )
+    max_idle: Optional[float] = Field(
+        default=300.0, gt=0, description="Idle seconds before a connection is recycled"
+    )
     version: Optional[str] = None
 
     @validator("file_path")
@@ -26,6 +35,17 @@ class OllamaConfig(BaseModel):
 
     base_url: str = Field(..., description="Ollama server URL")
     model: str = Field(..., description="Model name to use")
+    max_connections: int = Field(
+        default=10, ge=1, description="Maximum concurrent HTTP connections"
+    )
+    max_keepalive_connections: int = Field(
+        default=5, ge=0, description="Idle connections kept open for reuse"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, gt=0, description="Seconds an idle connection is kept open"
+    )
+    timeout: float = Field(default=120.0, gt=0, description="Response timeout")
+    connect_timeout: float = Field(default=5.0, gt=0, description="Connection timeout")
     version: Optional[str] = None
 
     @validator("base_url")
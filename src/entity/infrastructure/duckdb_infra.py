@@ -1,64 +1,239 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import deque
 from contextlib import contextmanager
-from queue import Empty, Full, Queue
-from typing import Generator
+from dataclasses import dataclass, field
+from typing import Any, Generator
 
 from .base import BaseInfrastructure
 
+_READ_ONLY_KEYWORDS = frozenset(
+    {"SELECT", "WITH", "FROM", "VALUES", "SHOW", "DESCRIBE", "EXPLAIN", "SUMMARIZE"}
+)
+
+
+def _is_read_only(query: str) -> bool:
+    """Return ``True`` if ``query`` starts with a read-only keyword."""
+
+    words = query.lstrip(" \t\r\n(").split(None, 1)
+    return bool(words) and words[0].upper() in _READ_ONLY_KEYWORDS
+
+
+@dataclass
+class _PooledConnection:
+    """A pooled reader cursor with the timestamps used for recycling."""
+
+    conn: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
 
 class DuckDBInfrastructure(BaseInfrastructure):
-    """Layer 1 infrastructure for managing a DuckDB database file."""
+    """Layer 1 infrastructure for managing a DuckDB database file.
+
+    A single long-lived writer connection owns the database instance. Reader
+    connections are cursors created from it, so they share one buffer cache
+    instead of each opening the file. Readers are handed out from a bounded
+    pool; callers wait up to ``acquire_timeout`` when every slot is busy.
+    Writes go through the writer connection one at a time because DuckDB
+    allows only one writing process per database file.
+    """
 
     def __init__(
-        self, file_path: str, pool_size: int = 5, version: str | None = None
+        self,
+        file_path: str,
+        pool_size: int = 5,
+        version: str | None = None,
+        acquire_timeout: float = 30.0,
+        max_lifetime: float | None = 3600.0,
+        max_idle: float | None = 300.0,
     ) -> None:
-        """Create the infrastructure with a simple connection pool."""
+        """Create the infrastructure with a bounded connection pool.
+
+        Args:
+            file_path: Path to the database file, or ":memory:"
+            pool_size: Maximum number of reader connections checked out at once
+            version: Optional version string for infrastructure tracking
+            acquire_timeout: Seconds to wait for a free connection before failing
+            max_lifetime: Seconds after which a connection is recycled (None = never)
+            max_idle: Seconds a connection may sit idle before it is recycled
+                (None = never)
+        """
 
         super().__init__(version)
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
         self.file_path = file_path
-        if file_path == ":memory:":
-            self._pool = Queue(maxsize=1)
-            import duckdb
+        self.pool_size = pool_size
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
 
-            self._pool.put_nowait(duckdb.connect(file_path))
-        else:
-            self._pool = Queue(maxsize=pool_size)
+        self._writer: Any = None
+        self._writer_open_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._idle: deque[_PooledConnection] = deque()
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self._metrics = {
+            "acquisitions": 0,
+            "created": 0,
+            "recycled": 0,
+            "discarded": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "timeouts": 0,
+        }
 
-    def _acquire(self):
-        import duckdb
+    def _get_writer(self) -> Any:
+        """Return the writer connection, opening the database on first use."""
+        if self._writer is None:
+            with self._writer_open_lock:
+                if self._writer is None:
+                    import duckdb
 
+                    self._writer = duckdb.connect(self.file_path)
+        return self._writer
+
+    def _is_expired(self, entry: _PooledConnection, now: float) -> bool:
+        if self.max_lifetime is not None and now - entry.created_at > self.max_lifetime:
+            return True
+        if self.max_idle is not None and now - entry.last_used > self.max_idle:
+            return True
+        return False
+
+    def _close(self, entry: _PooledConnection) -> None:
         try:
-            return self._pool.get_nowait()
-        except Empty:
-            if self.file_path == ":memory:":
-                return self._pool.get()
-            return duckdb.connect(self.file_path)
+            entry.conn.close()
+        except Exception as exc:
+            self.logger.debug("Error closing pooled connection: %s", exc)
+
+    def _take_idle(self) -> _PooledConnection | None:
+        """Pop the most recently used idle connection, dropping expired ones."""
+        now = time.monotonic()
+        while self._idle:
+            entry = self._idle.pop()
+            if self._is_expired(entry, now):
+                self._metrics["recycled"] += 1
+                self._close(entry)
+                continue
+            return entry
+        return None
+
+    def _acquire(self) -> _PooledConnection:
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            if self._in_use >= self.pool_size:
+                self._metrics["waits"] += 1
+                wait_start = time.monotonic()
+                while self._in_use >= self.pool_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._metrics["timeouts"] += 1
+                        self._metrics["wait_time"] += time.monotonic() - wait_start
+                        raise TimeoutError(
+                            f"Timed out after {self.acquire_timeout:.1f}s waiting "
+                            f"for a connection to {self.file_path}"
+                        )
+                    self._condition.wait(remaining)
+                self._metrics["wait_time"] += time.monotonic() - wait_start
+            self._in_use += 1
+            self._metrics["acquisitions"] += 1
+            entry = self._take_idle()
+
+        if entry is not None:
+            return entry
 
-    def _release(self, conn) -> None:
         try:
-            self._pool.put_nowait(conn)
-        except Full:
-            conn.close()
+            conn = self._get_writer().cursor()
+        except Exception:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._metrics["created"] += 1
+        return _PooledConnection(conn)
+
+    def _release(self, entry: _PooledConnection, discard: bool = False) -> None:
+        now = time.monotonic()
+        entry.last_used = now
+        with self._condition:
+            self._in_use -= 1
+            if discard:
+                self._metrics["discarded"] += 1
+                self._close(entry)
+            elif self._is_expired(entry, now) or len(self._idle) >= self.pool_size:
+                self._metrics["recycled"] += 1
+                self._close(entry)
+            else:
+                self._idle.append(entry)
+            self._condition.notify()
 
     @contextmanager
-    def connect(self) -> Generator:
-        """Yield a database connection from the pool."""
+    def connect(self, write: bool = False) -> Generator:
+        """Yield a database connection from the pool.
+
+        Args:
+            write: Yield the dedicated writer connection instead of a pooled
+                reader. Writers are serialized so only one runs at a time.
+        """
 
-        conn = self._acquire()
+        if write:
+            with self._write_lock:
+                yield self._get_writer()
+            return
+
+        entry = self._acquire()
+        failed = False
         try:
-            yield conn
+            yield entry.conn
+        except BaseException:
+            failed = True
+            raise
         finally:
-            self._release(conn)
+            self._release(entry, discard=failed)
+
+    def get_connection_stats(self) -> dict[str, Any]:
+        """Return connection pool statistics for monitoring."""
+        with self._condition:
+            acquisitions = self._metrics["acquisitions"]
+            waits = self._metrics["waits"]
+            return {
+                "file_path": self.file_path,
+                "pool_size": self.pool_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "writer_open": self._writer is not None,
+                "acquisitions": acquisitions,
+                "created": self._metrics["created"],
+                "recycled": self._metrics["recycled"],
+                "discarded": self._metrics["discarded"],
+                "waits": waits,
+                "timeouts": self._metrics["timeouts"],
+                "total_wait_time": self._metrics["wait_time"],
+                "average_wait_time": (
+                    self._metrics["wait_time"] / waits if waits else 0.0
+                ),
+            }
 
     async def startup(self) -> None:
         await super().startup()
-        self.logger.info("DuckDB file %s ready", self.file_path)
+        self.logger.info(
+            "DuckDB file %s ready (pool_size=%d)", self.file_path, self.pool_size
+        )
 
     async def shutdown(self) -> None:
         await super().shutdown()
-        while not self._pool.empty():
-            self._pool.get_nowait().close()
+        with self._condition:
+            while self._idle:
+                self._close(self._idle.pop())
+        with self._write_lock, self._writer_open_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
 
     async def health_check(self) -> bool:
         """Return ``True`` if the database can be opened."""
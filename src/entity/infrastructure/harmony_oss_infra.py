@@ -8,10 +8,22 @@ and advanced reasoning capabilities.
 from __future__ import annotations
 
 import json
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
 
 from .base import BaseInfrastructure
+from .token_counter import TokenCounter, default_token_counter
 
 
 class ReasoningEffort(Enum):
@@ -58,6 +70,195 @@ class HarmonyMessage:
         return msg
 
 
+def _serialize(role: Role, content: str, channel: Optional[HarmonyChannel]) -> str:
+    return json.dumps(HarmonyMessage(role, content, channel).to_dict())
+
+
+class ConversationHistory:
+    """Bounded message history for one conversation.
+
+    Each message is serialized once when added; prompts are assembled from
+    those cached segments. The oldest turns are dropped once the history
+    exceeds ``max_messages`` or ``token_budget`` tokens as measured by
+    ``token_counter``.
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 50,
+        token_budget: int = 4000,
+        token_counter: Optional[TokenCounter] = None,
+    ) -> None:
+        self.max_messages = max_messages
+        self.token_budget = token_budget
+        self.token_counter = token_counter or default_token_counter()
+        self.tokens = 0
+        self._entries: deque[tuple[HarmonyMessage, str, int]] = deque()
+        self._serialized: Optional[str] = ""
+
+    def append(self, message: HarmonyMessage) -> None:
+        """Add ``message`` and trim the oldest turns past the limits."""
+        segment = _serialize(message.role, message.content, message.channel)
+        tokens = max(1, self.token_counter.count(segment))
+        self._entries.append((message, segment, tokens))
+        self.tokens += tokens
+        if self._serialized is not None:
+            self._serialized = (
+                f"{self._serialized}\n{segment}" if self._serialized else segment
+            )
+        self._trim()
+
+    def _trim(self) -> None:
+        trimmed = False
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_messages or self.tokens > self.token_budget
+        ):
+            self.tokens -= self._entries.popleft()[2]
+            trimmed = True
+            # Never start the history with a reply whose question was dropped.
+            while len(self._entries) > 1 and self._entries[0][0].role != Role.USER:
+                self.tokens -= self._entries.popleft()[2]
+        if trimmed:
+            self._serialized = None
+
+    @property
+    def serialized(self) -> str:
+        """The history as newline-separated harmony JSON segments."""
+        if self._serialized is None:
+            self._serialized = "\n".join(segment for _, segment, _ in self._entries)
+        return self._serialized
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.tokens = 0
+        self._serialized = ""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[HarmonyMessage]:
+        return (message for message, _, _ in self._entries)
+
+    def __getitem__(self, index: int) -> HarmonyMessage:
+        return self._entries[index][0]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, ConversationHistory)):
+            return list(self) == list(other)
+        return NotImplemented
+
+
+_CHANNEL_MARKERS = {
+    "<<ANALYSIS>>": HarmonyChannel.ANALYSIS,
+    "<<COMMENTARY>>": HarmonyChannel.COMMENTARY,
+    "<<FINAL>>": HarmonyChannel.FINAL,
+}
+
+
+@dataclass(frozen=True)
+class HarmonyDelta:
+    """A piece of streamed output and the channel it belongs to."""
+
+    channel: HarmonyChannel
+    text: str
+
+
+class HarmonyStreamParser:
+    """Split a streamed harmony response into channel-tagged deltas.
+
+    Chunks may end anywhere, including inside a channel marker; only a
+    possible partial marker is carried over to the next chunk. Text before
+    the first marker belongs to the final channel. Whitespace around
+    markers is dropped, so concatenating a channel's deltas gives its
+    content without leading or trailing whitespace.
+
+    Deltas for channels outside ``channels`` are passed to ``on_discard``
+    (if given) and otherwise dropped; nothing is buffered for them.
+    """
+
+    def __init__(
+        self,
+        channels: Optional[Iterable[HarmonyChannel | str]] = None,
+        on_discard: Optional[Callable[[HarmonyDelta], None]] = None,
+    ) -> None:
+        """Create a parser.
+
+        Args:
+            channels: Channels to emit; ``None`` emits all of them
+            on_discard: Called with each delta of an unsubscribed channel
+        """
+        self.channels = (
+            None
+            if channels is None
+            else frozenset(HarmonyChannel(channel) for channel in channels)
+        )
+        self.on_discard = on_discard
+        self.channel = HarmonyChannel.FINAL
+        self._pending = ""
+        self._whitespace = ""
+        self._at_channel_start = True
+
+    def feed(self, chunk: str) -> List[HarmonyDelta]:
+        """Consume ``chunk`` and return the deltas it completes."""
+        deltas: List[HarmonyDelta] = []
+        text = self._pending + chunk
+        self._pending = ""
+        while text:
+            index = text.find("<<")
+            if index == -1:
+                # A trailing "<" may be the start of the next marker.
+                keep = 1 if text.endswith("<") else 0
+                self._emit(text[: len(text) - keep], deltas)
+                self._pending = text[len(text) - keep :]
+                break
+            self._emit(text[:index], deltas)
+            text = text[index:]
+            for marker, channel in _CHANNEL_MARKERS.items():
+                if text.startswith(marker):
+                    self._switch(channel)
+                    text = text[len(marker) :]
+                    break
+                if marker.startswith(text):
+                    self._pending = text
+                    text = ""
+                    break
+            else:
+                self._emit("<<", deltas)
+                text = text[2:]
+        return deltas
+
+    def close(self) -> List[HarmonyDelta]:
+        """Flush text held back as a possible marker at the end of the stream."""
+        deltas: List[HarmonyDelta] = []
+        self._emit(self._pending, deltas)
+        self._pending = ""
+        self._whitespace = ""
+        return deltas
+
+    def _switch(self, channel: HarmonyChannel) -> None:
+        self.channel = channel
+        self._whitespace = ""
+        self._at_channel_start = True
+
+    def _emit(self, text: str, deltas: List[HarmonyDelta]) -> None:
+        if self._at_channel_start:
+            text = text.lstrip()
+            if not text:
+                return
+            self._at_channel_start = False
+        body = text.rstrip()
+        if not body:
+            # Hold whitespace until we know whether the channel continues.
+            self._whitespace += text
+            return
+        delta = HarmonyDelta(self.channel, self._whitespace + body)
+        self._whitespace = text[len(body) :]
+        if self.channels is None or self.channel in self.channels:
+            deltas.append(delta)
+        elif self.on_discard is not None:
+            self.on_discard(delta)
+
+
 class HarmonyOSSInfrastructure(BaseInfrastructure):
     """Infrastructure adapter for GPT-OSS models using harmony format.
 
@@ -68,12 +269,19 @@ class HarmonyOSSInfrastructure(BaseInfrastructure):
     - Integrates with Entity's LLM infrastructure protocol
     """
 
+    # Responses depend on conversation history, not just the prompt.
+    stateful = True
+
     def __init__(
         self,
         model_path: str,
         reasoning_level: str = "medium",
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        history_max_messages: int = 50,
+        history_token_budget: int = 4000,
+        max_conversations: int = 1000,
+        token_counter: Optional[TokenCounter] = None,
     ) -> None:
         """Initialize the Harmony OSS Infrastructure.
 
@@ -82,13 +290,47 @@ class HarmonyOSSInfrastructure(BaseInfrastructure):
             reasoning_level: Reasoning effort level (low, medium, high)
             temperature: Sampling temperature for generation
             max_tokens: Maximum tokens to generate
+            history_max_messages: Messages kept per conversation
+            history_token_budget: Tokens of history kept per conversation
+            max_conversations: Conversations kept before the least recently
+                used one is dropped
+            token_counter: Measures history against ``history_token_budget``
         """
         super().__init__()
         self.model_path = model_path
         self.reasoning_effort = ReasoningEffort(reasoning_level.lower())
         self.temperature = temperature
         self.max_tokens = max_tokens
-        self.conversation_history: List[HarmonyMessage] = []
+        self.history_max_messages = history_max_messages
+        self.history_token_budget = history_token_budget
+        self.max_conversations = max_conversations
+        self.token_counter = token_counter or default_token_counter()
+        self._conversations: OrderedDict[str, ConversationHistory] = OrderedDict()
+
+    @property
+    def conversation_history(self) -> ConversationHistory:
+        """History of the default conversation."""
+        return self.get_history("default")
+
+    def get_history(self, conversation_id: str) -> ConversationHistory:
+        """Return (creating if needed) the history of ``conversation_id``."""
+        history = self._conversations.get(conversation_id)
+        if history is None:
+            history = ConversationHistory(
+                self.history_max_messages,
+                self.history_token_budget,
+                self.token_counter,
+            )
+            self._conversations[conversation_id] = history
+            if len(self._conversations) > self.max_conversations:
+                self._conversations.popitem(last=False)
+        else:
+            self._conversations.move_to_end(conversation_id)
+        return history
+
+    def clear_history(self, conversation_id: str) -> None:
+        """Forget everything said in ``conversation_id``."""
+        self._conversations.pop(conversation_id, None)
 
     def _format_prompt_harmony(self, messages: List[HarmonyMessage]) -> str:
         """Format messages into harmony prompt structure.
@@ -114,6 +356,28 @@ class HarmonyOSSInfrastructure(BaseInfrastructure):
 
         return "\n".join(formatted)
 
+    def _assemble_prompt(
+        self,
+        instructions: List[HarmonyMessage],
+        history: ConversationHistory,
+        prompt: str,
+    ) -> str:
+        """Build the prompt from cached segments.
+
+        Instructions come first in role-hierarchy order, followed by the
+        conversation so far in chronological order and the new user turn.
+        History segments were serialized when added and are reused; only
+        the instructions and the new turn are serialized here.
+        """
+        segments = [
+            _serialize(message.role, message.content, message.channel)
+            for message in instructions
+        ]
+        if len(history):
+            segments.append(history.serialized)
+        segments.append(_serialize(Role.USER, prompt, None))
+        return "\n".join(segments)
+
     def _parse_harmony_response(self, response: str) -> Dict[str, str]:
         """Parse multi-channel harmony response.
 
@@ -146,12 +410,18 @@ class HarmonyOSSInfrastructure(BaseInfrastructure):
 
         return {k: v.strip() for k, v in channels.items() if v.strip()}
 
-    async def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        conversation_id: str = "default",
+    ) -> str:
         """Generate a response using harmony format.
 
         Args:
             prompt: User input prompt
             system_prompt: Optional system-level instructions
+            conversation_id: Conversation whose history provides context
 
         Returns:
             Generated text response (final channel by default)
@@ -169,16 +439,15 @@ class HarmonyOSSInfrastructure(BaseInfrastructure):
             )
         )
 
-        messages.append(HarmonyMessage(Role.USER, prompt))
-
-        harmony_prompt = self._format_prompt_harmony(messages)
+        history = self.get_history(conversation_id)
+        harmony_prompt = self._assemble_prompt(messages, history, prompt)
 
         response = await self._call_model(harmony_prompt)
 
         channels = self._parse_harmony_response(response)
 
-        self.conversation_history.append(HarmonyMessage(Role.USER, prompt))
-        self.conversation_history.append(
+        history.append(HarmonyMessage(Role.USER, prompt))
+        history.append(
             HarmonyMessage(
                 Role.ASSISTANT, channels.get("final", ""), HarmonyChannel.FINAL
             )
@@ -186,6 +455,75 @@ class HarmonyOSSInfrastructure(BaseInfrastructure):
 
         return channels.get("final", "")
 
+    async def stream_channels(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        conversation_id: str = "default",
+        channels: Optional[Iterable[HarmonyChannel | str]] = None,
+    ) -> AsyncIterator[HarmonyDelta]:
+        """Stream a response as channel-tagged deltas while it is generated.
+
+        Deltas of channels not in ``channels`` are logged at debug level and
+        dropped. Once the response completes, the user turn and the final
+        channel are added to the conversation history.
+        """
+        messages = []
+        if system_prompt:
+            messages.append(HarmonyMessage(Role.SYSTEM, system_prompt))
+        messages.append(
+            HarmonyMessage(
+                Role.DEVELOPER,
+                f"Use {self.reasoning_effort.value} reasoning effort. "
+                f"Provide analysis and commentary channels when appropriate.",
+            )
+        )
+        history = self.get_history(conversation_id)
+        harmony_prompt = self._assemble_prompt(messages, history, prompt)
+
+        final: List[str] = []
+
+        def discard(delta: HarmonyDelta) -> None:
+            if delta.channel is HarmonyChannel.FINAL:
+                final.append(delta.text)
+            self.logger.debug(f"Discarded {delta.channel.value} delta: {delta.text!r}")
+
+        parser = HarmonyStreamParser(channels, on_discard=discard)
+        chunks = self._stream_model(harmony_prompt)
+        try:
+            async for chunk in chunks:
+                for delta in parser.feed(chunk):
+                    if delta.channel is HarmonyChannel.FINAL:
+                        final.append(delta.text)
+                    yield delta
+            for delta in parser.close():
+                if delta.channel is HarmonyChannel.FINAL:
+                    final.append(delta.text)
+                yield delta
+        finally:
+            await chunks.aclose()
+
+        history.append(HarmonyMessage(Role.USER, prompt))
+        history.append(
+            HarmonyMessage(Role.ASSISTANT, "".join(final), HarmonyChannel.FINAL)
+        )
+
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        conversation_id: str = "default",
+    ) -> AsyncIterator[str]:
+        """Stream only the final channel of a response as text chunks."""
+        deltas = self.stream_channels(
+            prompt, system_prompt, conversation_id, channels=[HarmonyChannel.FINAL]
+        )
+        try:
+            async for delta in deltas:
+                yield delta.text
+        finally:
+            await deltas.aclose()
+
     async def generate_with_channels(self, prompt: str) -> Dict[str, str]:
         """Generate response and return all channels.
 
@@ -225,10 +563,28 @@ class HarmonyOSSInfrastructure(BaseInfrastructure):
         <<FINAL>>
         I understand your request and will process it accordingly."""
 
+    async def _stream_model(self, prompt: str) -> AsyncIterator[str]:
+        """Stream the model's raw harmony output for ``prompt``.
+
+        Until a streaming model API is integrated this yields the whole
+        simulated response as one chunk.
+        """
+        yield await self._call_model(prompt)
+
     async def health_check(self) -> bool:
-        """Check if the GPT-OSS model is accessible and responsive."""
+        """Check if the GPT-OSS model is accessible and responsive.
+
+        The probe goes straight to the model so no conversation history is
+        touched.
+        """
         try:
-            response = await self.generate("test", "You are a test assistant")
+            probe = self._format_prompt_harmony(
+                [
+                    HarmonyMessage(Role.SYSTEM, "You are a test assistant"),
+                    HarmonyMessage(Role.USER, "test"),
+                ]
+            )
+            response = await self._call_model(probe)
             return bool(response)
         except Exception as e:
             self.logger.error(f"Health check failed: {e}")
@@ -244,7 +600,7 @@ class HarmonyOSSInfrastructure(BaseInfrastructure):
 
     async def shutdown(self) -> None:
         """Clean up resources."""
-        self.conversation_history.clear()
+        self._conversations.clear()
         await super().shutdown()
 
     def set_reasoning_effort(self, level: str) -> None:
@@ -0,0 +1,546 @@
+"""Spread LLM requests over several backends with passive health checking."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Sequence
+
+from .base import BaseInfrastructure
+from .ollama_infra import OllamaInfrastructure
+from .token_counter import TokenUsage, count_usage
+
+
+@dataclass
+class _Endpoint:
+    """Routing state for one backend."""
+
+    name: str
+    infra: Any
+    outstanding: int = 0
+    latency: float | None = None
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    ejections: int = 0
+
+    def available(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+
+class LoadBalancedLLMInfrastructure(BaseInfrastructure):
+    """Route generations across several LLM endpoints.
+
+    ``strategy="least_outstanding"`` sends each request to the endpoint with
+    the fewest requests in flight. ``strategy="p2c"`` samples two endpoints
+    and picks the one with the lower ``(outstanding + 1) * latency`` score,
+    using an exponentially weighted latency average per endpoint.
+
+    Endpoints are ejected after ``max_failures`` consecutive errors or
+    responses slower than ``slow_threshold`` and stay out for
+    ``ejection_time`` seconds, or until a background probe finds them
+    healthy again. If every endpoint is ejected, requests go to all of them
+    rather than failing outright.
+
+    Hedging is off unless ``hedge_percentile`` is set. Then a request that
+    is still running after that percentile of recent latencies (time to
+    first chunk for streams) is sent to a second endpoint as well, and the
+    slower of the two is cancelled. ``hedge_budget`` caps hedges as a
+    fraction of all requests so a slow cluster is not hit with twice the
+    load.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str | BaseInfrastructure],
+        model: str | None = None,
+        strategy: str = "least_outstanding",
+        max_failures: int = 3,
+        ejection_time: float = 30.0,
+        slow_threshold: float | None = None,
+        probe_interval: float | None = 5.0,
+        max_attempts: int = 2,
+        latency_decay: float = 0.3,
+        hedge_percentile: float | None = None,
+        hedge_budget: float = 0.1,
+        hedge_min_samples: int = 20,
+        hedge_min_delay: float = 0.0,
+        hedge_window: int = 200,
+        version: str | None = None,
+        **client_options: Any,
+    ) -> None:
+        """Configure the endpoint pool.
+
+        Args:
+            endpoints: Ollama base URLs, or infrastructure objects with
+                ``generate`` and ``health_check``
+            model: Model name used when building endpoints from URLs;
+                defaults to the endpoints' own model names
+            strategy: ``"least_outstanding"`` or ``"p2c"``
+            max_failures: Consecutive failures that eject an endpoint
+            ejection_time: Seconds an ejected endpoint is skipped
+            slow_threshold: Seconds after which a response counts as a failure
+            probe_interval: Seconds between re-probes of ejected endpoints;
+                ``None`` disables probing
+            max_attempts: Endpoints tried for one ``generate`` call
+            latency_decay: Weight of the newest sample in the latency average
+            hedge_percentile: Latency percentile (0-100) after which a request
+                is hedged; ``None`` disables hedging
+            hedge_budget: Maximum hedged requests as a fraction of all requests
+            hedge_min_samples: Latency samples needed before hedging starts
+            hedge_min_delay: Lower bound on the hedge delay in seconds
+            hedge_window: Recent latency samples used for the percentile
+            version: Optional infrastructure version
+            **client_options: Passed to each ``OllamaInfrastructure``
+        """
+
+        super().__init__(version)
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if strategy not in ("least_outstanding", "p2c"):
+            raise ValueError(f"Unknown strategy: {strategy}")
+        if hedge_percentile is not None and not 0 < hedge_percentile < 100:
+            raise ValueError("hedge_percentile must be between 0 and 100")
+        self.model = model
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.slow_threshold = slow_threshold
+        self.probe_interval = probe_interval
+        self.max_attempts = max(1, max_attempts)
+        self.latency_decay = latency_decay
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self._latencies: deque[float] = deque(maxlen=hedge_window)
+        self._ttfts: deque[float] = deque(maxlen=hedge_window)
+        self._hedge_metrics = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "budget_exhausted": 0,
+        }
+        client_options.setdefault("health_check_attempts", 1)
+        self.endpoints: list[_Endpoint] = []
+        for endpoint in endpoints:
+            if isinstance(endpoint, str):
+                if model is None:
+                    raise ValueError("model is required for URL endpoints")
+                infra = OllamaInfrastructure(endpoint, model, **client_options)
+                self.endpoints.append(_Endpoint(infra.base_url, infra))
+            else:
+                name = getattr(endpoint, "base_url", None) or repr(endpoint)
+                self.endpoints.append(_Endpoint(name, endpoint))
+        if model is None:
+            # Identifies what this pool generates with, for response caches.
+            self.model = "+".join(
+                sorted(
+                    {
+                        str(
+                            getattr(e.infra, "model", None)
+                            or getattr(e.infra, "model_path", None)
+                            or e.name
+                        )
+                        for e in self.endpoints
+                    }
+                )
+            )
+        self._probe_task: asyncio.Task | None = None
+
+    @property
+    def stateful(self) -> bool:
+        """Whether any endpoint's answers depend on conversation state."""
+        return any(getattr(e.infra, "stateful", False) for e in self.endpoints)
+
+    def _choose(self, exclude: set[int] = frozenset()) -> _Endpoint:
+        now = time.monotonic()
+        candidates = [
+            endpoint
+            for index, endpoint in enumerate(self.endpoints)
+            if index not in exclude and endpoint.available(now)
+        ]
+        if not candidates:
+            # Everything is ejected (or already tried): better to try a
+            # possibly-bad endpoint than to fail without sending anything.
+            candidates = [
+                endpoint
+                for index, endpoint in enumerate(self.endpoints)
+                if index not in exclude
+            ] or self.endpoints
+        if self.strategy == "p2c" and len(candidates) > 2:
+            candidates = random.sample(candidates, 2)
+        if self.strategy == "p2c":
+            known = [e.latency for e in self.endpoints if e.latency is not None]
+            default = sum(known) / len(known) if known else 1.0
+            return min(
+                candidates,
+                key=lambda e: (e.outstanding + 1)
+                * (e.latency if e.latency is not None else default),
+            )
+        fewest = min(endpoint.outstanding for endpoint in candidates)
+        return random.choice([e for e in candidates if e.outstanding == fewest])
+
+    def _record(self, endpoint: _Endpoint, latency: float, failed: bool) -> None:
+        if not failed:
+            endpoint.latency = (
+                latency
+                if endpoint.latency is None
+                else endpoint.latency
+                + self.latency_decay * (latency - endpoint.latency)
+            )
+            if self.slow_threshold is not None and latency > self.slow_threshold:
+                failed = True
+        if not failed:
+            endpoint.consecutive_failures = 0
+            return
+        endpoint.errors += 1
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures >= self.max_failures:
+            self._eject(endpoint)
+
+    def _eject(self, endpoint: _Endpoint) -> None:
+        if endpoint.available(time.monotonic()):
+            endpoint.ejections += 1
+            self.logger.warning(
+                "Ejecting LLM endpoint %s after %d failures",
+                endpoint.name,
+                endpoint.consecutive_failures,
+            )
+        endpoint.ejected_until = time.monotonic() + self.ejection_time
+
+    async def _call(self, endpoint: _Endpoint, prompt: str) -> tuple[str, TokenUsage]:
+        """Run one generation on ``endpoint`` and record its outcome."""
+
+        endpoint.outstanding += 1
+        endpoint.requests += 1
+        start = time.perf_counter()
+        try:
+            generate_with_usage = getattr(endpoint.infra, "generate_with_usage", None)
+            if generate_with_usage is not None:
+                result = await generate_with_usage(prompt)
+            else:
+                text = await endpoint.infra.generate(prompt)
+                result = text, count_usage(prompt, text)
+        except asyncio.CancelledError:
+            # A cancelled hedge loser took at least this long; dropping it
+            # would leave only the fast samples and pull the percentile down.
+            self._latencies.append(time.perf_counter() - start)
+            raise
+        except Exception:
+            self._record(endpoint, time.perf_counter() - start, failed=True)
+            raise
+        finally:
+            endpoint.outstanding -= 1
+        latency = time.perf_counter() - start
+        self._record(endpoint, latency, failed=False)
+        self._latencies.append(latency)
+        return result
+
+    async def _generate_with_retry(
+        self, prompt: str, tried: set[int]
+    ) -> tuple[str, TokenUsage]:
+        while True:
+            endpoint = self._choose(tried)
+            tried.add(self.endpoints.index(endpoint))
+            try:
+                return await self._call(endpoint, prompt)
+            except Exception as exc:
+                if len(tried) >= min(self.max_attempts, len(self.endpoints)):
+                    raise
+                self.logger.debug("Retrying after %s failed: %s", endpoint.name, exc)
+
+    async def generate(self, prompt: str) -> str:
+        """Generate on the best endpoint, retrying another one on failure.
+
+        With hedging enabled, a request still running after the configured
+        latency percentile is duplicated to a second endpoint; the first
+        successful answer wins and the other request is cancelled.
+        """
+
+        text, _ = await self.generate_with_usage(prompt)
+        return text
+
+    async def generate_with_usage(self, prompt: str) -> tuple[str, TokenUsage]:
+        """Like :meth:`generate`, also returning the winning call's token usage."""
+
+        self._hedge_metrics["requests"] += 1
+        delay = self._hedge_delay(self._latencies)
+        if delay is None:
+            return await self._generate_with_retry(prompt, set())
+
+        primary_endpoint = self._choose()
+        primary_index = self.endpoints.index(primary_endpoint)
+        primary = asyncio.ensure_future(self._call(primary_endpoint, prompt))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            if primary.exception() is None:
+                return primary.result()
+            if self.max_attempts < 2:
+                return primary.result()
+            return await self._generate_with_retry(prompt, {primary_index})
+        hedge_endpoint = self._hedge_endpoint(primary_index)
+        if hedge_endpoint is None:
+            return await primary
+
+        hedge = asyncio.ensure_future(self._call(hedge_endpoint, prompt))
+        pending = {primary, hedge}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._hedge_metrics["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _endpoint_stream(
+        self, endpoint: _Endpoint, prompt: str
+    ) -> AsyncIterator[str]:
+        """Stream from one endpoint; its TTFT feeds the latency average."""
+
+        endpoint.outstanding += 1
+        endpoint.requests += 1
+        start = time.perf_counter()
+        first = True
+        try:
+            stream = getattr(endpoint.infra, "stream", None)
+            if stream is None:
+                yield await endpoint.infra.generate(prompt)
+                self._record(endpoint, time.perf_counter() - start, failed=False)
+                return
+            async with aclosing(stream(prompt)) as chunks:
+                async for chunk in chunks:
+                    if first:
+                        first = False
+                        ttft = time.perf_counter() - start
+                        self._record(endpoint, ttft, failed=False)
+                        self._ttfts.append(ttft)
+                    yield chunk
+        except (asyncio.CancelledError, GeneratorExit):
+            if first:
+                # Closed before its first chunk: a lower bound on its TTFT.
+                self._ttfts.append(time.perf_counter() - start)
+            raise
+        except Exception:
+            self._record(endpoint, time.perf_counter() - start, failed=True)
+            raise
+        finally:
+            endpoint.outstanding -= 1
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream from the best endpoint.
+
+        With hedging enabled, a stream that has not produced its first chunk
+        within the configured TTFT percentile is duplicated to a second
+        endpoint; whichever yields first is streamed and the other closed.
+        """
+
+        self._hedge_metrics["requests"] += 1
+        primary_endpoint = self._choose()
+        chunks = self._endpoint_stream(primary_endpoint, prompt)
+        first: str | None = None
+        delay = self._hedge_delay(self._ttfts)
+        if delay is not None:
+            chunks, first = await self._race_first_chunk(
+                primary_endpoint, chunks, prompt, delay
+            )
+            if chunks is None:
+                return
+        async with aclosing(chunks):
+            if first is not None:
+                yield first
+            async for chunk in chunks:
+                yield chunk
+
+    async def _race_first_chunk(
+        self,
+        primary_endpoint: _Endpoint,
+        primary: AsyncIterator[str],
+        prompt: str,
+        delay: float,
+    ) -> tuple[AsyncIterator[str] | None, str | None]:
+        """Return the stream that produced a first chunk, and that chunk."""
+
+        async def first_chunk(chunks: AsyncIterator[str]) -> str | None:
+            try:
+                return await anext(chunks)
+            except StopAsyncIteration:
+                return None
+
+        racers = {asyncio.ensure_future(first_chunk(primary)): primary}
+        try:
+            done, _ = await asyncio.wait(set(racers), timeout=delay)
+            if not done:
+                hedge_endpoint = self._hedge_endpoint(
+                    self.endpoints.index(primary_endpoint)
+                )
+                if hedge_endpoint is not None:
+                    hedge = self._endpoint_stream(hedge_endpoint, prompt)
+                    racers[asyncio.ensure_future(first_chunk(hedge))] = hedge
+            pending = set(racers)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        winner = racers.pop(task)
+                        if winner is not primary:
+                            self._hedge_metrics["hedge_wins"] += 1
+                        result = task.result()
+                        if result is None:
+                            await winner.aclose()
+                            return None, None
+                        return winner, result
+                    error = task.exception()
+                    await racers.pop(task).aclose()
+            raise error
+        finally:
+            for task, chunks in racers.items():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                await chunks.aclose()
+
+    def _hedge_delay(self, samples: deque[float]) -> float | None:
+        """Return how long to wait before hedging, or ``None`` to not hedge."""
+
+        if self.hedge_percentile is None or len(samples) < self.hedge_min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile / 100))
+        return max(self.hedge_min_delay, ordered[index])
+
+    def _hedge_endpoint(self, primary_index: int) -> _Endpoint | None:
+        """Pick a different endpoint for a hedge if the budget allows one."""
+
+        metrics = self._hedge_metrics
+        if metrics["hedged"] + 1 > self.hedge_budget * metrics["requests"]:
+            metrics["budget_exhausted"] += 1
+            return None
+        now = time.monotonic()
+        others = {
+            index
+            for index, endpoint in enumerate(self.endpoints)
+            if index != primary_index and endpoint.available(now)
+        }
+        if not others:
+            return None
+        metrics["hedged"] += 1
+        return self._choose(set(range(len(self.endpoints))) - others)
+
+    def get_hedge_stats(self) -> dict[str, Any]:
+        """Return hedging counters and the current hedge delays."""
+
+        return {
+            **self._hedge_metrics,
+            "generate_delay": self._hedge_delay(self._latencies),
+            "first_chunk_delay": self._hedge_delay(self._ttfts),
+        }
+
+    async def _probe(self, endpoint: _Endpoint) -> None:
+        try:
+            healthy = await endpoint.infra.health_check()
+        except Exception:
+            healthy = False
+        if healthy:
+            if not endpoint.available(time.monotonic()):
+                self.logger.info("LLM endpoint %s is healthy again", endpoint.name)
+            endpoint.ejected_until = 0.0
+            endpoint.consecutive_failures = 0
+            return
+        endpoint.consecutive_failures += 1
+        if (
+            not endpoint.available(time.monotonic())
+            or endpoint.consecutive_failures >= self.max_failures
+        ):
+            self._eject(endpoint)
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            now = time.monotonic()
+            ejected = [e for e in self.endpoints if not e.available(now)]
+            if ejected:
+                await asyncio.gather(*(self._probe(e) for e in ejected))
+
+    async def startup(self) -> None:
+        await super().startup()
+        await asyncio.gather(
+            *(
+                endpoint.infra.startup()
+                for endpoint in self.endpoints
+                if hasattr(endpoint.infra, "startup")
+            )
+        )
+        if self.probe_interval is not None:
+            self._probe_task = asyncio.create_task(self._probe_loop())
+        self.logger.info(
+            "Balancing LLM requests over %d endpoints (%s)",
+            len(self.endpoints),
+            self.strategy,
+        )
+
+    async def shutdown(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            await asyncio.gather(self._probe_task, return_exceptions=True)
+            self._probe_task = None
+        await asyncio.gather(
+            *(
+                endpoint.infra.shutdown()
+                for endpoint in self.endpoints
+                if hasattr(endpoint.infra, "shutdown")
+            ),
+            return_exceptions=True,
+        )
+        await super().shutdown()
+
+    async def health_check(self) -> bool:
+        """Probe every endpoint; healthy if at least one responds.
+
+        A failed probe counts towards ``max_failures`` like a failed request,
+        so one missed probe does not eject an otherwise healthy endpoint.
+        """
+
+        await asyncio.gather(*(self._probe(endpoint) for endpoint in self.endpoints))
+        now = time.monotonic()
+        return any(endpoint.available(now) for endpoint in self.endpoints)
+
+    def get_endpoint_stats(self) -> list[dict[str, Any]]:
+        """Return routing state per endpoint for monitoring."""
+
+        now = time.monotonic()
+        return [
+            {
+                "endpoint": endpoint.name,
+                "available": endpoint.available(now),
+                "outstanding": endpoint.outstanding,
+                "latency": endpoint.latency,
+                "requests": endpoint.requests,
+                "errors": endpoint.errors,
+                "ejections": endpoint.ejections,
+                "consecutive_failures": endpoint.consecutive_failures,
+            }
+            for endpoint in self.endpoints
+        ]
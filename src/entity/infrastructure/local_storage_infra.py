@@ -20,6 +20,10 @@ class LocalStorageInfrastructure(BaseInfrastructure):
 
     async def health_check(self) -> bool:
         """Return ``True`` if the base path is writable."""
+        return self.is_writable()
+
+    def is_writable(self) -> bool:
+        """Return ``True`` if a file can be written under the base path."""
         try:
             test_file = self.base_path / ".health_check"
             test_file.write_text("ok")
@@ -0,0 +1,516 @@
+"""In-process vector index backed by NumPy matrices."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Generator
+
+from .base import BaseInfrastructure
+from .quantization import make_quantizer
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+_METRICS = frozenset({"cosine", "l2", "ip"})
+# Rows copied or encoded at a time, bounding temporaries for large tables.
+_BLOCK_ROWS = 65_536
+
+
+def _to_distances(dots: Any, q_norms: Any, norms: Any, metric: str) -> Any:
+    """Convert ``q . x / |x|`` products into distances for ``metric``.
+
+    ``q_norms`` has one entry per query row of ``dots``; ``norms`` holds the
+    stored vectors' norms and broadcasts against ``dots``.
+    """
+
+    if metric == "cosine":
+        return 1.0 - dots / np.where(q_norms > 0, q_norms, 1.0)[:, None]
+    if metric == "ip":
+        return -dots * norms
+    squared = q_norms[:, None] ** 2 + norms**2 - 2.0 * dots * norms
+    return np.sqrt(np.maximum(squared, 0.0))
+
+
+class _VectorTable:
+    """Rows of one collection: unit-length embeddings plus their norms.
+
+    ``matrix`` and ``norms`` are over-allocated and grown by doubling so
+    appends are amortized O(1); only the first ``count`` rows are live.
+    After loading from disk they are read-only memory maps until the first
+    write copies them into memory.
+
+    When a quantizer factory is given, ``codes`` holds a compact encoding
+    of every row. The quantizer is trained on first search and retrained
+    whenever the table has doubled since, and rows written in between are
+    encoded with the current quantizer. Once trained, ``matrix`` moves to a
+    writable memory map at ``spill_path`` instead of process memory; it is
+    only read to re-rank shortlisted rows and to retrain.
+
+    ``partitions`` maps each ``user_id`` to its row numbers so user-scoped
+    searches only touch that user's rows.
+    """
+
+    def __init__(
+        self, dim: int, quantizer_factory: Any = None, spill_path: Path | None = None
+    ) -> None:
+        self.dim = dim
+        self.quantizer_factory = quantizer_factory
+        self.spill_path = spill_path
+        self.spilled = False
+        self.quantizer: Any = None
+        self.codes: Any = None
+        self.trained_count = 0
+        self.count = 0
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+        self.norms = np.zeros(0, dtype=np.float32)
+        self.ids: list[str] = []
+        self.metadata: list[dict[str, Any]] = []
+        self.user_ids: list[str | None] = []
+        self.rows: dict[str, int] = {}
+        self.partitions: dict[str | None, list[int]] = {}
+        self.dirty = False
+
+    def _reserve(self, count: int) -> None:
+        capacity = self.matrix.shape[0]
+        spill = self.codes is not None and self.spill_path is not None
+        if count <= capacity and self.matrix.flags.writeable and spill == self.spilled:
+            return
+        capacity = max(count, capacity * 2, 64)
+        if spill:
+            matrix = self._spill(capacity)
+        else:
+            matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+            matrix[: self.count] = self.matrix[: self.count]
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[: self.count] = self.norms[: self.count]
+        self.matrix, self.norms = matrix, norms
+        if self.codes is not None:
+            codes = np.zeros((capacity, *self.codes.shape[1:]), self.codes.dtype)
+            codes[: self.count] = self.codes[: self.count]
+            self.codes = codes
+
+    def _spill(self, capacity: int) -> "np.memmap":
+        """Return a writable ``capacity``-row memory map holding the live rows.
+
+        Growing an existing spill file only extends it; otherwise the rows
+        are copied over in blocks so they never all sit in memory at once.
+        """
+
+        size = capacity * self.dim * np.dtype(np.float32).itemsize
+        if self.spilled:
+            self.matrix.flush()
+            with open(self.spill_path, "r+b") as handle:
+                handle.truncate(size)
+            return np.memmap(
+                self.spill_path, np.float32, "r+", shape=(capacity, self.dim)
+            )
+        with open(self.spill_path, "wb") as handle:
+            handle.truncate(size)
+        matrix = np.memmap(
+            self.spill_path, np.float32, "r+", shape=(capacity, self.dim)
+        )
+        for start in range(0, self.count, _BLOCK_ROWS):
+            stop = min(start + _BLOCK_ROWS, self.count)
+            matrix[start:stop] = self.matrix[start:stop]
+        self.spilled = True
+        return matrix
+
+    def upsert(
+        self,
+        ids: list[str],
+        vectors: "np.ndarray",
+        metadata: list[dict[str, Any] | None],
+        user_ids: list[str | None],
+    ) -> None:
+        norms = np.linalg.norm(vectors, axis=1).astype(np.float32)
+        unit = vectors / np.where(norms > 0, norms, 1.0)[:, None]
+        self._reserve(self.count + len(ids))
+        written = []
+        for i, vector_id in enumerate(ids):
+            row = self.rows.get(vector_id)
+            if row is None:
+                row = self.count
+                self.count += 1
+                self.rows[vector_id] = row
+                self.ids.append(vector_id)
+                self.metadata.append(metadata[i] or {})
+                self.user_ids.append(user_ids[i])
+                self.partitions.setdefault(user_ids[i], []).append(row)
+            else:
+                self.metadata[row] = metadata[i] or {}
+                if self.user_ids[row] != user_ids[i]:
+                    self.partitions[self.user_ids[row]].remove(row)
+                    self.partitions.setdefault(user_ids[i], []).append(row)
+                    self.user_ids[row] = user_ids[i]
+            self.matrix[row] = unit[i]
+            self.norms[row] = norms[i]
+            written.append(row)
+        if self.codes is not None:
+            self.codes[written] = self.quantizer.encode(unit)
+        self.dirty = True
+
+    def quantized(self, min_rows: int) -> tuple[Any, Any]:
+        """Return the current ``(quantizer, codes)``, training if due."""
+
+        if self.quantizer_factory is None or self.count < min_rows:
+            return None, None
+        if self.codes is None or self.count >= 2 * self.trained_count:
+            live = self.matrix[: self.count]
+            quantizer = self.quantizer_factory().fit(live)
+            codes = None
+            for start in range(0, self.count, _BLOCK_ROWS):
+                encoded = quantizer.encode(live[start : start + _BLOCK_ROWS])
+                if codes is None:
+                    shape = (self.matrix.shape[0], *encoded.shape[1:])
+                    codes = np.zeros(shape, encoded.dtype)
+                codes[start : start + len(encoded)] = encoded
+            self.quantizer, self.codes = quantizer, codes
+            self.trained_count = self.count
+            if self.spill_path is not None and not self.spilled:
+                self.matrix = self._spill(self.matrix.shape[0])
+        return self.quantizer, self.codes[: self.count]
+
+    def resident_bytes(self) -> int:
+        """Return bytes of process memory held by this table's arrays."""
+
+        arrays = [self.norms, self.codes]
+        if not isinstance(self.matrix, np.memmap):
+            arrays.append(self.matrix)
+        return sum(int(a.nbytes) for a in arrays if a is not None)
+
+    def select(
+        self, user_id: str | None, filter: dict[str, Any] | None
+    ) -> "np.ndarray | None":
+        """Return the rows matching ``user_id`` and ``filter``, or ``None`` for all.
+
+        The user's partition is looked up first, so metadata is only checked
+        for that user's rows.
+        """
+
+        if user_id is None and not filter:
+            return None
+        candidates = (
+            self.partitions.get(user_id, [])
+            if user_id is not None
+            else range(self.count)
+        )
+        if filter:
+            candidates = [
+                row
+                for row in candidates
+                if all(self.metadata[row].get(k) == v for k, v in filter.items())
+            ]
+        return np.array(candidates, dtype=np.intp)
+
+
+class NumPyVectorInfrastructure(BaseInfrastructure):
+    """Layer 1 infrastructure keeping embeddings in memory as NumPy arrays.
+
+    Each collection is a contiguous ``float32`` matrix of unit-length rows
+    and a vector of the original norms, so a batch of queries is answered
+    with one matrix multiply followed by ``argpartition``. Cosine, Euclidean
+    and inner-product distances are all derived from the same product.
+
+    With ``storage_path`` set, collections are written there as ``.npy``
+    files on ``flush()`` or shutdown and opened as memory maps on first
+    use, so startup cost does not grow with the number of vectors.
+
+    ``quantization="int8"`` (4x smaller) or ``"pq"`` (product quantization,
+    ``dim / 8`` bytes per vector by default) keeps only a compact code per
+    row in memory once a search has trained the quantizer. The float32
+    rows then move to a memory-mapped spill file, under ``storage_path``
+    or a temporary directory, and searches score
+    the codes, keep the ``k * rerank_factor`` best candidates and page in
+    only those rows to re-rank them exactly.
+    """
+
+    def __init__(
+        self,
+        storage_path: str | None = None,
+        version: str | None = None,
+        quantization: str | None = None,
+        rerank_factor: int = 10,
+        quantize_min_rows: int = 1024,
+        pq_subspaces: int | None = None,
+    ) -> None:
+        """Create the index.
+
+        Args:
+            storage_path: Directory for persisted collections; in-memory if omitted
+            version: Infrastructure version string
+            quantization: ``None``, ``"int8"`` or ``"pq"``
+            rerank_factor: Candidates re-ranked exactly per requested result
+            quantize_min_rows: Tables smaller than this are always searched exactly
+            pq_subspaces: Bytes per vector for product quantization
+        """
+
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "NumPyVectorInfrastructure requires numpy; install it with "
+                "`pip install entity-core[vector]`"
+            )
+        super().__init__(version)
+        self.storage_path = Path(storage_path) if storage_path else None
+        if self.storage_path is not None:
+            self.storage_path.mkdir(parents=True, exist_ok=True)
+        self._tables: dict[str, _VectorTable] = {}
+        self._spill_dir: tempfile.TemporaryDirectory | None = None
+        self._lock = threading.RLock()
+        options = {"subspaces": pq_subspaces} if quantization == "pq" else {}
+        make_quantizer(quantization, **options)  # validate early
+        self.quantization = quantization
+        self._quantizer_factory = (
+            (lambda: make_quantizer(quantization, **options)) if quantization else None
+        )
+        self.rerank_factor = max(1, rerank_factor)
+        self.quantize_min_rows = quantize_min_rows
+
+    async def startup(self) -> None:
+        await super().startup()
+        self.logger.info(
+            "NumPy vector index ready (storage: %s)", self.storage_path or "memory"
+        )
+
+    async def shutdown(self) -> None:
+        self.flush()
+        await super().shutdown()
+
+    async def health_check(self) -> bool:
+        """Return ``True``; the index lives in process memory."""
+
+        return True
+
+    @contextmanager
+    def connect(self, write: bool = False) -> Generator[Any, None, None]:
+        """Raise ``RuntimeError``; this backend has no SQL interface."""
+
+        raise RuntimeError("NumPyVectorInfrastructure does not support SQL queries")
+        yield  # pragma: no cover
+
+    def _paths(self, table: str) -> tuple[Path, Path, Path]:
+        base = self.storage_path / table
+        return (
+            base.with_suffix(".npy"),
+            base.with_suffix(".norms.npy"),
+            base.with_suffix(".json"),
+        )
+
+    def _new_table(self, table: str, dim: int) -> _VectorTable:
+        spill_path = None
+        if self._quantizer_factory is not None:
+            if self.storage_path is not None:
+                spill_path = self.storage_path / f"{table}.spill"
+            else:
+                if self._spill_dir is None:
+                    self._spill_dir = tempfile.TemporaryDirectory(prefix="entity-vec-")
+                spill_path = Path(self._spill_dir.name) / f"{table}.spill"
+        return _VectorTable(dim, self._quantizer_factory, spill_path)
+
+    def _load(self, table: str) -> _VectorTable | None:
+        if self.storage_path is None:
+            return None
+        matrix_path, norms_path, meta_path = self._paths(table)
+        if not meta_path.exists():
+            return None
+        info = json.loads(meta_path.read_text())
+        loaded = self._new_table(table, info["dim"])
+        loaded.matrix = np.load(matrix_path, mmap_mode="r")
+        loaded.norms = np.load(norms_path, mmap_mode="r")
+        loaded.ids = info["ids"]
+        loaded.metadata = info["metadata"]
+        loaded.user_ids = info["user_ids"]
+        loaded.count = len(loaded.ids)
+        loaded.rows = {vector_id: row for row, vector_id in enumerate(loaded.ids)}
+        for row, user_id in enumerate(loaded.user_ids):
+            loaded.partitions.setdefault(user_id, []).append(row)
+        return loaded
+
+    def _table(self, table: str) -> _VectorTable | None:
+        with self._lock:
+            if table not in self._tables:
+                loaded = self._load(table)
+                if loaded is None:
+                    return None
+                self._tables[table] = loaded
+            return self._tables[table]
+
+    def create_table(self, table: str, dim: int) -> None:
+        """Create an empty collection of ``dim``-dimensional vectors if missing."""
+
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        if dim < 1:
+            raise ValueError("dim must be at least 1")
+        with self._lock:
+            existing = self._table(table)
+            if existing is None:
+                self._tables[table] = self._new_table(table, dim)
+            elif existing.dim != dim:
+                raise ValueError(
+                    f"Table {table} stores {existing.dim}-dimensional vectors, "
+                    f"got {dim}"
+                )
+
+    def upsert_vectors(
+        self,
+        table: str,
+        ids: list[str],
+        vectors: Any,
+        metadata: list[dict[str, Any] | None],
+        user_ids: list[str | None],
+    ) -> None:
+        """Insert or replace vectors by id, creating the table if needed."""
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or len(matrix) != len(ids):
+            raise ValueError("vectors must be a 2-D array with one row per id")
+        with self._lock:
+            self.create_table(table, matrix.shape[1])
+            self._tables[table].upsert(list(ids), matrix, metadata, user_ids)
+
+    def search_vectors(
+        self,
+        table: str,
+        queries: Any,
+        k: int,
+        filter: dict[str, Any] | None = None,
+        metric: str = "cosine",
+        user_id: str | None = None,
+    ) -> list[list[tuple[str, float, dict[str, Any], str | None]]]:
+        """Return the ``k`` nearest rows for each query, closest first.
+
+        ``user_id`` and ``filter`` select rows before any distance is
+        computed, so a scoped search costs time proportional to the rows
+        it can return rather than to the whole table.
+        """
+
+        if metric not in _METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        q = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        with self._lock:
+            data = self._table(table)
+            if data is None:
+                raise ValueError(f"Table {table} does not exist")
+            if q.shape[1] != data.dim:
+                raise ValueError(
+                    f"Query dimension {q.shape[1]} does not match {data.dim}"
+                )
+            n = data.count
+            matrix, norms = data.matrix[:n], data.norms[:n]
+            selected = data.select(user_id, filter)
+            ids, metadata, user_ids = data.ids, data.metadata, data.user_ids
+            quantizer, codes = data.quantized(self.quantize_min_rows)
+
+        if selected is not None:
+            norms, n = norms[selected], len(selected)
+            codes = codes[selected] if codes is not None else None
+        if n == 0 or k < 1:
+            return [[] for _ in range(len(q))]
+
+        q_norms = np.linalg.norm(q, axis=1)
+        k = min(k, n)
+        pool = k * self.rerank_factor
+        if quantizer is not None and pool < n:
+            # Shortlist on approximate distances, then read and score only
+            # the shortlisted rows exactly.
+            approx = _to_distances(
+                quantizer.inner_products(q, codes), q_norms, norms, metric
+            )
+            rows = np.argpartition(approx, pool - 1, axis=1)[:, :pool]
+            stored = rows if selected is None else selected[rows]
+            dots = np.einsum("bd,bcd->bc", q, matrix[stored])
+            distances = _to_distances(dots, q_norms, norms[rows], metric)
+        else:
+            if selected is not None:
+                matrix = matrix[selected]
+            dots = q @ matrix.T  # q . x / |x| for every stored row x
+            distances = _to_distances(dots, q_norms, norms, metric)
+            rows = None
+
+        top = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        results = []
+        for row, candidates in enumerate(top):
+            candidates = candidates[np.argsort(distances[row, candidates])]
+            positions = candidates if rows is None else rows[row, candidates]
+            if selected is not None:
+                positions = selected[positions]
+            results.append(
+                [
+                    (ids[i], float(distance), metadata[i], user_ids[i])
+                    for i, distance in zip(positions, distances[row, candidates])
+                ]
+            )
+        return results
+
+    def get_table_stats(self, table: str) -> dict[str, Any]:
+        """Return row count and memory footprint of ``table``.
+
+        Reports the table as it stands; the quantizer is only trained by
+        searches. ``resident_bytes`` counts the arrays held in process
+        memory; rows in a memory map are excluded, since the OS pages them
+        in and out.
+        """
+
+        with self._lock:
+            data = self._table(table)
+            if data is None:
+                raise ValueError(f"Table {table} does not exist")
+            codes = data.codes[: data.count] if data.codes is not None else None
+            return {
+                "rows": data.count,
+                "dim": data.dim,
+                "quantization": self.quantization,
+                "quantized": codes is not None,
+                "vector_bytes": int(data.matrix[: data.count].nbytes),
+                "code_bytes": int(codes.nbytes) if codes is not None else 0,
+                "vectors_in_memory": not isinstance(data.matrix, np.memmap),
+                "resident_bytes": data.resident_bytes(),
+            }
+
+    def flush(self) -> None:
+        """Write modified collections to ``storage_path``."""
+
+        if self.storage_path is None:
+            return
+        with self._lock:
+            for table, data in self._tables.items():
+                if data.dirty:
+                    self._save(table, data)
+                    data.dirty = False
+
+    def _save(self, table: str, data: _VectorTable) -> None:
+        for path, array in zip(
+            self._paths(table)[:2],
+            (data.matrix[: data.count], data.norms[: data.count]),
+        ):
+            tmp = path.with_name(path.name + ".tmp")
+            out = np.lib.format.open_memmap(
+                tmp, mode="w+", dtype=np.float32, shape=array.shape
+            )
+            out[:] = array
+            out.flush()
+            del out
+            os.replace(tmp, path)
+        meta_path = self._paths(table)[2]
+        tmp = meta_path.with_name(meta_path.name + ".tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "dim": data.dim,
+                    "ids": data.ids,
+                    "metadata": data.metadata,
+                    "user_ids": data.user_ids,
+                }
+            )
+        )
+        os.replace(tmp, meta_path)
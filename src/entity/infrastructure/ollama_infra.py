@@ -1,51 +1,266 @@
 import asyncio
+import json
+import time
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 
 import httpx
 
 from .base import BaseInfrastructure
+from .token_counter import TokenUsage, usage_from_ollama
 
 
 class OllamaInfrastructure(BaseInfrastructure):
-    """Layer 1 infrastructure for communicating with an Ollama server."""
+    """Layer 1 infrastructure for communicating with an Ollama server.
+
+    A single pooled ``httpx.AsyncClient`` is created in :meth:`startup` and
+    closed in :meth:`shutdown` so requests reuse keep-alive connections.
+    """
 
     def __init__(
         self,
         base_url: str,
         model: str,
         version: str | None = None,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 120.0,
+        connect_timeout: float = 5.0,
+        health_check_attempts: int = 3,
+        health_check_timeout: float = 2.0,
+        health_check_retry_delay: float = 1.0,
     ) -> None:
-        """Configure the client base URL, model, and installer settings."""
+        """Configure the client base URL, model, and connection pool.
+
+        Args:
+            base_url: Ollama server URL
+            model: Model name to use
+            version: Optional infrastructure version
+            max_connections: Maximum concurrent connections to the server
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            timeout: Seconds to wait for a response (generation can be slow)
+            connect_timeout: Seconds to wait for a TCP connection
+            health_check_attempts: Tries before ``health_check`` gives up
+            health_check_timeout: Seconds allowed for each health check try
+            health_check_retry_delay: Seconds between health check tries
+        """
 
         super().__init__(version)
         self.base_url = base_url.rstrip("/")
         self.model = model
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.health_check_attempts = health_check_attempts
+        self.health_check_timeout = health_check_timeout
+        self.health_check_retry_delay = health_check_retry_delay
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._client_guard: AsyncIterator[None] | None = None
+        self._stream_metrics = {
+            "streams": 0,
+            "completed": 0,
+            "cancelled": 0,
+            "errors": 0,
+            "chunks": 0,
+            "ttft_total": 0.0,
+            "ttft_count": 0,
+            "last_ttft": 0.0,
+            "gap_total": 0.0,
+            "gap_count": 0,
+            "max_gap": 0.0,
+        }
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url, limits=self.limits, timeout=self.timeout
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it if ``startup`` was skipped.
+
+        Pooled connections belong to the loop that opened them, so a new
+        loop gets a new client and the previous one is retired.
+        """
+
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is not None and not client.is_closed:
+            if self._client_loop is loop:
+                return client
+            self._retire_client(client, self._client_loop)
+        self._client = self._create_client()
+        self._client_loop = loop
+        # Starting the guard registers it with the loop, whose
+        # ``shutdown_asyncgens`` (run by ``asyncio.run``) then closes the
+        # client before the loop goes away.
+        self._client_guard = self._close_with_loop(self._client)
+        asyncio.ensure_future(self._client_guard.asend(None))
+        return self._client
+
+    @staticmethod
+    async def _close_with_loop(client: httpx.AsyncClient) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            if not client.is_closed:
+                await client.aclose()
+
+    def _retire_client(
+        self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+    ) -> None:
+        """Close ``client`` on its own loop before it is replaced."""
+
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        elif loop is not None and not loop.is_closed():
+            raise RuntimeError(
+                "OllamaInfrastructure client is bound to another event loop; "
+                "call shutdown() on that loop before using it from this one"
+            )
+        else:
+            self.logger.warning(
+                "Dropping HTTP client of a closed event loop for %s", self.base_url
+            )
 
     async def generate(self, prompt: str) -> str:
         """Send a prompt to Ollama and return the generated text."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/generate",
-                json={"model": self.model, "prompt": prompt},
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("response", "")
+        text, _ = await self.generate_with_usage(prompt)
+        return text
+
+    async def generate_with_usage(self, prompt: str) -> tuple[str, TokenUsage]:
+        """Generate text and return it with the token counts Ollama reports."""
+        response = await self._get_client().post(
+            "/api/generate",
+            json={"model": self.model, "prompt": prompt, "stream": False},
+        )
+        response.raise_for_status()
+        data = response.json()
+        text = data.get("response", "")
+        return text, usage_from_ollama(data, prompt, text)
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Yield response text as Ollama generates it.
+
+        The NDJSON body is parsed line by line as it arrives. Time to first
+        token and the gaps between chunks are recorded (see
+        :meth:`get_stream_stats`). Closing the iterator early, or cancelling
+        the consuming task, closes the upstream HTTP response so the server
+        stops generating for this request.
+        """
+
+        async with aclosing(self.stream_with_usage(prompt)) as chunks:
+            async for chunk in chunks:
+                if isinstance(chunk, str):
+                    yield chunk
+
+    async def stream_with_usage(self, prompt: str) -> AsyncIterator[str | TokenUsage]:
+        """Like :meth:`stream`, ending with the token counts Ollama reports.
+
+        Ollama's closing ``done`` chunk carries the counts for the whole
+        generation; they are yielded as a final :class:`TokenUsage`.
+        """
+
+        metrics = self._stream_metrics
+        metrics["streams"] += 1
+        start = time.perf_counter()
+        last: float | None = None
+        received: list[str] = []
+        try:
+            async with self._get_client().stream(
+                "POST",
+                "/api/generate",
+                json={"model": self.model, "prompt": prompt, "stream": True},
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    chunk = json.loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(f"Ollama error: {chunk['error']}")
+                    text = chunk.get("response", "")
+                    if text:
+                        now = time.perf_counter()
+                        if last is None:
+                            metrics["last_ttft"] = now - start
+                            metrics["ttft_total"] += now - start
+                            metrics["ttft_count"] += 1
+                        else:
+                            metrics["gap_total"] += now - last
+                            metrics["gap_count"] += 1
+                            metrics["max_gap"] = max(metrics["max_gap"], now - last)
+                        last = now
+                        metrics["chunks"] += 1
+                        received.append(text)
+                        yield text
+                    if chunk.get("done"):
+                        yield usage_from_ollama(chunk, prompt, "".join(received))
+                        break
+            metrics["completed"] += 1
+        except (GeneratorExit, asyncio.CancelledError):
+            metrics["cancelled"] += 1
+            raise
+        except Exception:
+            metrics["errors"] += 1
+            raise
+
+    def get_stream_stats(self) -> dict[str, Any]:
+        """Return streaming latency statistics for monitoring."""
+        metrics = self._stream_metrics
+        ttft_count = metrics["ttft_count"]
+        gap_count = metrics["gap_count"]
+        return {
+            "streams": metrics["streams"],
+            "completed": metrics["completed"],
+            "cancelled": metrics["cancelled"],
+            "errors": metrics["errors"],
+            "chunks": metrics["chunks"],
+            "last_ttft": metrics["last_ttft"],
+            "average_ttft": (metrics["ttft_total"] / ttft_count if ttft_count else 0.0),
+            "average_inter_token": (
+                metrics["gap_total"] / gap_count if gap_count else 0.0
+            ),
+            "max_inter_token": metrics["max_gap"],
+        }
 
     async def startup(self) -> None:
         await super().startup()
+        self._get_client()
         self.logger.info("Ollama endpoint %s", self.base_url)
 
     async def shutdown(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+        if self._client_guard is not None:
+            await self._client_guard.aclose()
+            self._client_guard = None
         await super().shutdown()
 
     async def health_check(self) -> bool:
         """Return ``True`` if the Ollama server responds."""
 
-        for attempt in range(3):
+        for attempt in range(self.health_check_attempts):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(f"{self.base_url}/api/tags", timeout=2)
-                    response.raise_for_status()
+                if self._client is None:
+                    # Probes run before startup (often on a throwaway loop via
+                    # ``health_check_sync``) should not leave a pool behind.
+                    async with self._create_client() as client:
+                        response = await client.get(
+                            "/api/tags", timeout=self.health_check_timeout
+                        )
+                else:
+                    response = await self._get_client().get(
+                        "/api/tags", timeout=self.health_check_timeout
+                    )
+                response.raise_for_status()
                 self.logger.debug(
                     "Health check succeeded for %s on attempt %s",
                     self.base_url,
@@ -59,7 +274,8 @@ class OllamaInfrastructure(BaseInfrastructure):
                     self.base_url,
                     exc,
                 )
-                await asyncio.sleep(1)
+                if attempt + 1 < self.health_check_attempts:
+                    await asyncio.sleep(self.health_check_retry_delay)
 
         self.logger.warning("Health check failed for %s", self.base_url)
         return False
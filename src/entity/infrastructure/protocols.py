@@ -19,8 +19,12 @@ class DatabaseInfrastructure(Protocol):
         """Return True if the infrastructure is healthy."""
         ...
 
-    def connect(self) -> Any:
-        """Return a database connection context manager."""
+    def connect(self, write: bool = False) -> Any:
+        """Return a database connection context manager.
+
+        ``write=True`` requests the connection used for data-modifying
+        statements; implementations may serialize those.
+        """
         ...
 
 
@@ -40,7 +44,7 @@ class VectorStoreInfrastructure(Protocol):
         """Return True if the infrastructure is healthy."""
         ...
 
-    def connect(self) -> Any:
+    def connect(self, write: bool = False) -> Any:
         """Return a vector store connection context manager."""
         ...
 
@@ -84,3 +88,43 @@ class StorageInfrastructure(Protocol):
     async def list_files(self, prefix: str = "") -> list[str]:
         """List files with optional prefix."""
         ...
+
+
+@runtime_checkable
+class VectorIndexInfrastructure(Protocol):
+    """Protocol for vector stores that search embeddings natively.
+
+    ``VectorStoreResource`` delegates to these methods instead of issuing SQL
+    when its infrastructure implements them.
+    """
+
+    def create_table(self, table: str, dim: int) -> None:
+        """Create an empty collection of ``dim``-dimensional vectors."""
+        ...
+
+    def upsert_vectors(
+        self,
+        table: str,
+        ids: list[str],
+        vectors: Any,
+        metadata: list[dict[str, Any] | None],
+        user_ids: list[str | None],
+    ) -> None:
+        """Insert or replace vectors by id."""
+        ...
+
+    def search_vectors(
+        self,
+        table: str,
+        queries: Any,
+        k: int,
+        filter: dict[str, Any] | None = None,
+        metric: str = "cosine",
+        user_id: str | None = None,
+    ) -> list[list[tuple[str, float, dict[str, Any], str | None]]]:
+        """Return ``(id, distance, metadata, user_id)`` matches per query.
+
+        Rows outside ``user_id`` or not matching ``filter`` are excluded
+        before distances are computed.
+        """
+        ...
@@ -0,0 +1,192 @@
+"""Vector quantizers used to shrink in-memory embedding indexes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Rows per block when assigning points to centroids, bounding temporaries.
+_BLOCK_ROWS = 65_536
+# Rows of int8 codes converted to float32 at a time. Small blocks keep the
+# converted copy in cache, which matters more than BLAS call overhead.
+_DECODE_BLOCK_ROWS = 512
+
+
+class ScalarQuantizer:
+    """Per-dimension int8 quantization (4x smaller than float32).
+
+    Each dimension is mapped linearly from the ``[low, high]`` range seen
+    during ``fit`` onto 256 levels. Inner products are computed straight
+    from the codes: ``q . x ~= q . low + (q * scale) . (code + 128)``.
+    """
+
+    kind = "int8"
+
+    def __init__(self) -> None:
+        self.low: Any = None
+        self.scale: Any = None
+
+    @property
+    def trained(self) -> bool:
+        return self.low is not None
+
+    def fit(self, vectors: Any) -> "ScalarQuantizer":
+        """Learn the value range of each dimension from ``vectors``."""
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self.low = vectors.min(axis=0)
+        span = vectors.max(axis=0) - self.low
+        self.scale = np.where(span > 0, span / 255.0, 1.0).astype(np.float32)
+        return self
+
+    def encode(self, vectors: Any) -> Any:
+        """Return int8 codes of shape ``(n, dim)``."""
+
+        levels = np.rint((np.asarray(vectors) - self.low) / self.scale)
+        return (np.clip(levels, 0, 255) - 128).astype(np.int8)
+
+    def decode(self, codes: Any) -> Any:
+        """Reconstruct approximate float32 vectors from ``codes``."""
+
+        return (codes.astype(np.float32) + 128.0) * self.scale + self.low
+
+    def inner_products(self, queries: Any, codes: Any) -> Any:
+        """Approximate ``queries @ vectors.T`` from ``codes``."""
+
+        weighted = queries * self.scale
+        bias = queries @ self.low + 128.0 * weighted.sum(axis=1)
+        out = np.empty((len(queries), len(codes)), dtype=np.float32)
+        for start in range(0, len(codes), _DECODE_BLOCK_ROWS):
+            block = codes[start : start + _DECODE_BLOCK_ROWS].astype(np.float32)
+            out[:, start : start + len(block)] = weighted @ block.T
+        out += bias[:, None]
+        return out
+
+
+class ProductQuantizer:
+    """Product quantization with 256-centroid codebooks per subspace.
+
+    Vectors are split into ``subspaces`` contiguous chunks and each chunk is
+    replaced by the index of its nearest k-means centroid, so a vector costs
+    ``subspaces`` bytes. Inner products use per-query lookup tables
+    (asymmetric distance computation): the query is never quantized.
+    """
+
+    kind = "pq"
+
+    def __init__(
+        self,
+        subspaces: int | None = None,
+        iterations: int = 10,
+        sample_size: int = 10_000,
+        seed: int = 0,
+    ) -> None:
+        """Create an untrained quantizer.
+
+        Args:
+            subspaces: Number of chunks (bytes per vector); defaults to
+                ``dim // 8``
+            iterations: Lloyd iterations per codebook
+            sample_size: Maximum number of rows used for training
+            seed: Random seed for sampling and centroid initialization
+        """
+        self.subspaces = subspaces
+        self.iterations = iterations
+        self.sample_size = sample_size
+        self.seed = seed
+        self.bounds: list[tuple[int, int]] = []
+        self.codebooks: list[Any] = []
+
+    @property
+    def trained(self) -> bool:
+        return bool(self.codebooks)
+
+    def fit(self, vectors: Any) -> "ProductQuantizer":
+        """Train one k-means codebook per subspace on a sample of ``vectors``."""
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        rng = np.random.default_rng(self.seed)
+        if len(vectors) > self.sample_size:
+            vectors = vectors[rng.choice(len(vectors), self.sample_size, replace=False)]
+        dim = vectors.shape[1]
+        count = min(max(self.subspaces or dim // 8, 1), dim)
+        edges = np.linspace(0, dim, count + 1).astype(int)
+        self.bounds = list(zip(edges[:-1], edges[1:]))
+        centroids = min(256, len(vectors))
+        self.codebooks = [
+            _kmeans(vectors[:, lo:hi], centroids, self.iterations, rng)
+            for lo, hi in self.bounds
+        ]
+        return self
+
+    def encode(self, vectors: Any) -> Any:
+        """Return uint8 codes of shape ``(n, subspaces)``."""
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        codes = np.empty((len(vectors), len(self.bounds)), dtype=np.uint8)
+        for j, ((lo, hi), codebook) in enumerate(zip(self.bounds, self.codebooks)):
+            codes[:, j] = _nearest(vectors[:, lo:hi], codebook)
+        return codes
+
+    def decode(self, codes: Any) -> Any:
+        """Reconstruct approximate float32 vectors from ``codes``."""
+
+        return np.hstack(
+            [codebook[codes[:, j]] for j, codebook in enumerate(self.codebooks)]
+        )
+
+    def inner_products(self, queries: Any, codes: Any) -> Any:
+        """Approximate ``queries @ vectors.T`` with per-subspace lookup tables."""
+
+        out = np.zeros((len(queries), len(codes)), dtype=np.float32)
+        columns = np.ascontiguousarray(codes.T)
+        for j, ((lo, hi), codebook) in enumerate(zip(self.bounds, self.codebooks)):
+            table = queries[:, lo:hi] @ codebook.T
+            out += table[:, columns[j]]
+        return out
+
+
+def _nearest(vectors: Any, centroids: Any) -> Any:
+    """Return the index of the closest centroid for every row of ``vectors``."""
+
+    c_norms = (centroids**2).sum(axis=1)
+    labels = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _BLOCK_ROWS):
+        block = vectors[start : start + _BLOCK_ROWS]
+        labels[start : start + len(block)] = np.argmin(
+            c_norms - 2.0 * block @ centroids.T, axis=1
+        )
+    return labels
+
+
+def _kmeans(vectors: Any, k: int, iterations: int, rng: Any) -> Any:
+    centroids = vectors[rng.choice(len(vectors), k, replace=False)].copy()
+    for _ in range(iterations):
+        labels = _nearest(vectors, centroids)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.stack(
+            [np.bincount(labels, weights=column, minlength=k) for column in vectors.T],
+            axis=1,
+        )
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids
+
+
+def make_quantizer(kind: str | None, **options: Any) -> Any:
+    """Return a quantizer for ``kind`` (``"int8"``, ``"pq"`` or ``None``)."""
+
+    if kind is None:
+        return None
+    if kind == "int8":
+        return ScalarQuantizer()
+    if kind == "pq":
+        return ProductQuantizer(**options)
+    raise ValueError(f"Unknown quantization: {kind}")
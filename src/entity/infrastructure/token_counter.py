@@ -0,0 +1,162 @@
+"""Token counting for LLM prompts and completions.
+
+Backends that report token counts (Ollama's ``prompt_eval_count`` and
+``eval_count``) give exact figures; everything else goes through a
+:class:`TokenCounter`. ``tiktoken`` is used when installed, otherwise a
+character-based estimate that is much closer to real tokenizers than
+counting whitespace-separated words.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Protocol, runtime_checkable
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """Tokens consumed by one generation.
+
+    ``exact`` is ``True`` when the backend reported the counts itself.
+    """
+
+    prompt_tokens: int
+    completion_tokens: int
+    exact: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+@runtime_checkable
+class TokenCounter(Protocol):
+    """Anything that can count the tokens in a piece of text."""
+
+    def count(self, text: str) -> int: ...
+
+
+class EstimatingTokenCounter:
+    """Estimate tokens from text length.
+
+    BPE tokenizers average about four characters of English per token.
+    Text with many short words or symbols tokenizes more densely, so the
+    estimate is never below one token per word.
+    """
+
+    def __init__(self, chars_per_token: float = 4.0) -> None:
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive")
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return max(math.ceil(len(text) / self.chars_per_token), len(text.split()))
+
+
+class TiktokenTokenCounter:
+    """Count tokens exactly with a ``tiktoken`` encoding."""
+
+    def __init__(self, encoding: str = "o200k_base") -> None:
+        if not TIKTOKEN_AVAILABLE:
+            raise ImportError("tiktoken is required for TiktokenTokenCounter")
+        self.encoding = tiktoken.get_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+class _DefaultTokenCounter:
+    """Count with ``tiktoken`` once its encoding is loaded, estimate until then.
+
+    ``tiktoken.get_encoding`` may download the encoding on first use, so it
+    is never called on a running event loop: the first count there starts
+    loading it in a worker thread and returns an estimate meanwhile.
+    """
+
+    def __init__(self, encoding: str = "o200k_base") -> None:
+        self.encoding = encoding
+        self.fallback = EstimatingTokenCounter()
+        self._counter: Optional[TokenCounter] = None
+        self._loading: Optional[asyncio.Future] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> TokenCounter:
+        """Load the encoding, blocking until it is available."""
+
+        with self._lock:
+            if self._counter is None:
+                try:
+                    self._counter = TiktokenTokenCounter(self.encoding)
+                except Exception:
+                    # Missing package, or an encoding that cannot be downloaded.
+                    self._counter = self.fallback
+            return self._counter
+
+    def count(self, text: str) -> int:
+        if self._counter is not None:
+            return self._counter.count(text)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self.load().count(text)
+        if self._loading is None:
+            self._loading = loop.run_in_executor(None, self.load)
+        return self.fallback.count(text)
+
+
+_default_counter: Optional[_DefaultTokenCounter] = None
+
+
+def default_token_counter() -> TokenCounter:
+    """Return the shared counter: ``tiktoken`` if available, else an estimate."""
+
+    global _default_counter
+    if _default_counter is None:
+        _default_counter = _DefaultTokenCounter()
+    return _default_counter
+
+
+def count_usage(
+    prompt: str, completion: str, counter: Optional[TokenCounter] = None
+) -> TokenUsage:
+    """Count a prompt and completion with ``counter``."""
+
+    counter = counter or default_token_counter()
+    return TokenUsage(counter.count(prompt), counter.count(completion))
+
+
+def usage_from_ollama(
+    data: Mapping[str, Any],
+    prompt: str,
+    completion: str,
+    counter: Optional[TokenCounter] = None,
+) -> TokenUsage:
+    """Read Ollama's token counts, counting whatever it did not report.
+
+    Ollama omits ``prompt_eval_count`` when the prompt was served from its
+    KV cache, so each side falls back to ``counter`` independently.
+    """
+
+    prompt_tokens = data.get("prompt_eval_count")
+    completion_tokens = data.get("eval_count")
+    exact = prompt_tokens is not None and completion_tokens is not None
+    if prompt_tokens is None or completion_tokens is None:
+        counter = counter or default_token_counter()
+        if prompt_tokens is None:
+            prompt_tokens = counter.count(prompt)
+        if completion_tokens is None:
+            completion_tokens = counter.count(completion)
+    return TokenUsage(int(prompt_tokens), int(completion_tokens), exact)
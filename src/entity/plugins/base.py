@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List
 from pydantic import BaseModel, ValidationError
 
 from entity.plugins.validation import ValidationResult
+from entity.resources.token_usage import token_attribution
 
 if TYPE_CHECKING:
     from entity.plugins.context import PluginContext
@@ -68,7 +69,10 @@ class Plugin(ABC):
 
         context._current_plugin_name = self.__class__.__name__
 
-        return await self._execute_impl(context)
+        with token_attribution(
+            getattr(context, "user_id", None), self.__class__.__name__
+        ):
+            return await self._execute_impl(context)
 
     def _validate_dependencies(self) -> None:
         missing = [dep for dep in self.dependencies if dep not in self.resources]
@@ -19,6 +19,7 @@ from typing import (
 from pydantic import BaseModel, ValidationError
 
 from entity.plugins.validation import ValidationResult
+from entity.resources.token_usage import token_attribution
 
 if TYPE_CHECKING:
     from entity.plugins.context import PluginContext
@@ -262,7 +263,11 @@ class TypedPlugin(ABC, Generic[T]):
             raise RuntimeError(f"Plugin cannot run in {context.current_stage}")
 
         context._current_plugin_name = self.__class__.__name__
-        return await self._execute_impl(context)
+
+        with token_attribution(
+            getattr(context, "user_id", None), self.__class__.__name__
+        ):
+            return await self._execute_impl(context)
 
     @abstractmethod
     async def _execute_impl(self, context: Any) -> Any:
@@ -9,10 +9,15 @@ from entity.resources.argument_parsing import (
     EntityArgumentParsingResource,
     create_argument_parsing_resource,
 )
+from entity.resources.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    LimitAlgorithm,
+)
 from entity.resources.database import DatabaseResource
 from entity.resources.exceptions import ResourceInitializationError
 from entity.resources.file_storage_wrapper import FileStorage
 from entity.resources.llm import LLMResource
+from entity.resources.llm_cache import LLMResponseCache
 from entity.resources.llm_wrapper import LLM
 from entity.resources.local_storage import LocalStorageResource
 from entity.resources.logging import (
@@ -34,14 +39,21 @@ from entity.resources.memory_factories import (
 )
 from entity.resources.metrics import MetricsCollectorResource
 from entity.resources.storage import StorageResource
-from entity.resources.vector_store import VectorStoreResource
+from entity.resources.token_usage import TokenUsageRecorder, token_attribution
+from entity.resources.vector_store import VectorSearchResult, VectorStoreResource
 
 from .exceptions import InfrastructureError
 
 __all__ = [
     "DatabaseResource",
     "VectorStoreResource",
+    "VectorSearchResult",
     "LLMResource",
+    "LLMResponseCache",
+    "AdaptiveConcurrencyLimiter",
+    "LimitAlgorithm",
+    "TokenUsageRecorder",
+    "token_attribution",
     "StorageResource",
     "LocalStorageResource",
     "ResourceInitializationError",
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterable, Iterable
 
 from entity.infrastructure.async_duckdb_infra import AsyncDuckDBInfrastructure
+from entity.infrastructure.async_duckdb_worker_infra import (
+    AsyncDuckDBWorkerInfrastructure,
+)
+from entity.infrastructure.bulk_load import (
+    AdaptiveChunker,
+    BulkLoadStats,
+    ProgressCallback,
+)
 from entity.resources.exceptions import ResourceInitializationError
 
 
@@ -16,11 +24,17 @@ class AsyncDatabaseResource:
     better performance and proper async patterns.
     """
 
-    def __init__(self, infrastructure: AsyncDuckDBInfrastructure | None) -> None:
+    def __init__(
+        self,
+        infrastructure: (
+            AsyncDuckDBInfrastructure | AsyncDuckDBWorkerInfrastructure | None
+        ),
+    ) -> None:
         """Initialize with an async database infrastructure.
 
         Args:
-            infrastructure: Async database infrastructure instance
+            infrastructure: Async database infrastructure instance, either the
+                aiosqlite-backed one or the DuckDB worker-thread backend
 
         Raises:
             ResourceInitializationError: If infrastructure is None
@@ -108,9 +122,7 @@ class AsyncDatabaseResource:
             >>> for user in users:
             ...     print(f"User: {user[1]}")
         """
-        return await self.infrastructure.execute_fetch_all(
-            query, params, fetch_all=True
-        )
+        return await self.infrastructure.execute_async(query, params, fetch_all=True)
 
     async def execute_script(self, script: str) -> None:
         """Execute a multi-statement SQL script asynchronously.
@@ -148,6 +160,36 @@ class AsyncDatabaseResource:
         """
         await self.infrastructure.execute_many(query, parameters_list)
 
+    async def bulk_insert(
+        self,
+        table: str,
+        rows: Iterable[tuple] | AsyncIterable[tuple],
+        columns: list[str] | None = None,
+        chunker: AdaptiveChunker | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> BulkLoadStats:
+        """Stream rows into ``table`` in adaptively sized, committed chunks.
+
+        Args:
+            table: Target table name
+            rows: Iterable or async iterable of row tuples
+            columns: Optional column names matching each row's values
+            chunker: Chunk sizing policy
+            on_progress: Called with the running statistics after each chunk
+
+        Returns:
+            Final statistics with row count, chunk count and throughput
+
+        Examples:
+            >>> stats = await db.bulk_insert(
+            ...     "users", read_csv_rows("users.csv"), columns=["name", "age"],
+            ...     on_progress=lambda s: print(f"{s.rows} rows"),
+            ... )
+        """
+        return await self.infrastructure.bulk_insert(
+            table, rows, columns=columns, chunker=chunker, on_progress=on_progress
+        )
+
     async def get_connection_stats(self) -> dict[str, Any]:
         """Get connection pool statistics for monitoring and debugging.
 
@@ -6,11 +6,21 @@ import asyncio
 import fcntl
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 from entity.resources.async_database import AsyncDatabaseResource
 from entity.resources.exceptions import ResourceInitializationError
 from entity.resources.vector_store import VectorStoreResource
+from entity.resources.write_coalescer import WriteCoalescer
+
+_UPSERT_QUERY = "INSERT OR REPLACE INTO memory (key, value) VALUES (?, ?)"
+# Keys per IN (...) query in batch_load; stays below SQLite's variable limit.
+_BATCH_LOAD_PAGE = 500
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so ``text`` matches literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class _InterProcessLock:
@@ -19,19 +29,35 @@ class _InterProcessLock:
     def __init__(self, path: str) -> None:
         self._path = path
         self._file = None
+        self._local = asyncio.Lock()
 
     async def __aenter__(self) -> "_InterProcessLock":
-        """Acquire the file lock asynchronously."""
-        self._file = await asyncio.to_thread(open, self._path, "w")
-        await asyncio.to_thread(fcntl.flock, self._file, fcntl.LOCK_EX)
+        """Acquire the file lock asynchronously.
+
+        Coroutines in this process queue on an asyncio lock first, since
+        they share one file handle.
+        """
+        await self._local.acquire()
+        try:
+            self._file = await asyncio.to_thread(open, self._path, "w")
+            await asyncio.to_thread(fcntl.flock, self._file, fcntl.LOCK_EX)
+        except BaseException:
+            if self._file:
+                self._file.close()
+                self._file = None
+            self._local.release()
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
         """Release the file lock asynchronously."""
-        if self._file:
-            await asyncio.to_thread(fcntl.flock, self._file, fcntl.LOCK_UN)
-            self._file.close()
-            self._file = None
+        try:
+            if self._file:
+                await asyncio.to_thread(fcntl.flock, self._file, fcntl.LOCK_UN)
+                self._file.close()
+                self._file = None
+        finally:
+            self._local.release()
 
 
 class AsyncMemory:
@@ -54,12 +80,19 @@ class AsyncMemory:
         self,
         database: AsyncDatabaseResource | None,
         vector_store: VectorStoreResource | None,
+        coalesce_writes: bool = False,
+        write_window: float = 0.002,
+        max_write_batch: int = 256,
     ) -> None:
         """Initialize AsyncMemory with async database and vector store resources.
 
         Args:
             database: Async database resource for structured data storage
             vector_store: Vector store resource for semantic search
+            coalesce_writes: Group concurrent ``store`` calls into one
+                transaction instead of committing each separately
+            write_window: Seconds a write waits for others to join its batch
+            max_write_batch: Number of queued writes that flushes immediately
 
         Raises:
             ResourceInitializationError: If database or vector_store is None
@@ -80,6 +113,11 @@ class AsyncMemory:
             _InterProcessLock(str(lock_file)) if lock_file is not None else None
         )
         self._table_ready = False
+        self._coalescer = (
+            WriteCoalescer(self._write_batch, write_window, max_write_batch)
+            if coalesce_writes
+            else None
+        )
 
     def health_check(self) -> bool:
         """Check if both database and vector store are healthy.
@@ -134,17 +172,20 @@ class AsyncMemory:
         """
         return await self.database.execute(query, *params)
 
-    def add_vector(self, table: str, vector: object) -> None:
+    def add_vector(
+        self, table: str, vector: object, user_id: str | None = None
+    ) -> None:
         """Add a vector to the vector store.
 
         Args:
             table: Name of the table/collection to store the vector in
             vector: Vector data to store (typically embeddings)
+            user_id: Owner of the vector, used to scope searches
 
         Examples:
             >>> memory.add_vector("embeddings", [0.1, 0.2, 0.3, ...])
         """
-        self.vector_store.add_vector(table, vector)
+        self.vector_store.add_vector(table, vector, user_id=user_id)
 
     def query(self, query: str) -> object:
         """Execute a vector store query."""
@@ -200,11 +241,15 @@ class AsyncMemory:
             >>> await memory.store("user_preferences", {"theme": "dark"})
         """
         serialized = json.dumps(value)
-        await self._execute_with_locks(
-            "INSERT OR REPLACE INTO memory (key, value) VALUES (?, ?)",
-            key,
-            serialized,
-        )
+        if self._coalescer is not None:
+            await self._coalescer.submit((key, serialized))
+            return
+        await self._execute_with_locks(_UPSERT_QUERY, key, serialized)
+
+    async def flush(self) -> None:
+        """Commit any writes still waiting in the write coalescer."""
+        if self._coalescer is not None:
+            await self._coalescer.flush()
 
     async def load(self, key: str, default: Any | None = None) -> Any:
         """Retrieve the stored value for key or default if missing.
@@ -269,33 +314,111 @@ class AsyncMemory:
         )
         return row is not None
 
-    async def keys(self, pattern: str | None = None) -> list[str]:
+    async def _iter_rows(
+        self,
+        columns: str,
+        pattern: str | None,
+        user_id: str | None,
+        page_size: int,
+    ) -> AsyncIterator[tuple]:
+        """Yield matching rows ordered by key using keyset pagination.
+
+        Each page is its own short query resuming after the last key seen,
+        so locks and pooled connections are released between pages and
+        memory use does not grow with the number of keys.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        filters: list[str] = []
+        params: list[Any] = []
+        if user_id is not None:
+            filters.append("key LIKE ? ESCAPE '\\'")
+            params.append(_escape_like(f"{user_id}:") + "%")
+        if pattern is not None:
+            filters.append("key LIKE ?")
+            params.append(f"{user_id}:{pattern}" if user_id is not None else pattern)
+
+        last_key: str | None = None
+        while True:
+            page_filters = filters + (["key > ?"] if last_key is not None else [])
+            page_params = params + ([last_key] if last_key is not None else [])
+            where = f" WHERE {' AND '.join(page_filters)}" if page_filters else ""
+            cursor = await self._execute_with_locks(
+                f"SELECT {columns} FROM memory{where} "
+                f"ORDER BY key LIMIT {int(page_size)}",
+                *page_params,
+            )
+            rows = await cursor.fetchall() if hasattr(cursor, "fetchall") else cursor
+            if not rows:
+                return
+            for row in rows:
+                yield row
+            if len(rows) < page_size:
+                return
+            last_key = rows[-1][0]
+
+    async def iter_keys(
+        self,
+        pattern: str | None = None,
+        user_id: str | None = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """Iterate over keys in key order without loading them all at once.
+
+        Args:
+            pattern: Optional SQL LIKE pattern to filter keys
+            user_id: Only yield keys stored as ``"{user_id}:<key>"``, with the
+                prefix removed
+            page_size: Number of keys fetched per query
+
+        Examples:
+            >>> async for key in memory.iter_keys("session_%"):
+            ...     await archive(key)
+        """
+        prefix = f"{user_id}:" if user_id is not None else ""
+        async for row in self._iter_rows("key", pattern, user_id, page_size):
+            yield row[0][len(prefix) :]
+
+    async def iter_items(
+        self,
+        pattern: str | None = None,
+        user_id: str | None = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Iterate over ``(key, value)`` pairs in key order, one page at a time.
+
+        Args:
+            pattern: Optional SQL LIKE pattern to filter keys
+            user_id: Only yield keys stored as ``"{user_id}:<key>"``, with the
+                prefix removed
+            page_size: Number of items fetched per query
+
+        Examples:
+            >>> async for key, value in memory.iter_items(page_size=500):
+            ...     export(key, value)
+        """
+        prefix = f"{user_id}:" if user_id is not None else ""
+        async for row in self._iter_rows("key, value", pattern, user_id, page_size):
+            yield row[0][len(prefix) :], json.loads(row[1])
+
+    async def keys(
+        self, pattern: str | None = None, user_id: str | None = None
+    ) -> list[str]:
         """Get all keys in memory storage, optionally filtered by pattern.
 
         Args:
             pattern: Optional SQL LIKE pattern to filter keys
+            user_id: Optional user scope, see :meth:`iter_keys`
 
         Returns:
-            List of keys matching the pattern
+            List of keys matching the pattern, in key order
 
         Examples:
             >>> all_keys = await memory.keys()
             >>> user_keys = await memory.keys("user_%")
         """
-        if pattern is None:
-            cursor = await self._execute_with_locks("SELECT key FROM memory")
-        else:
-            cursor = await self._execute_with_locks(
-                "SELECT key FROM memory WHERE key LIKE ?",
-                pattern,
-            )
-
-        if hasattr(cursor, "fetchall"):
-            rows = await cursor.fetchall()
-        else:
-            rows = cursor
-
-        return [row[0] for row in rows] if rows else []
+        return [key async for key in self.iter_keys(pattern, user_id)]
 
     async def clear(self, pattern: str | None = None) -> int:
         """Clear keys from memory storage, optionally filtered by pattern.
@@ -363,6 +486,9 @@ class AsyncMemory:
             "has_process_lock": self._process_lock is not None,
             "health_status": health_status,
             "db_stats": db_stats,
+            "write_coalescing": (
+                self._coalescer.get_stats() if self._coalescer is not None else None
+            ),
         }
 
     async def batch_store(self, items: dict[str, Any]) -> None:
@@ -382,25 +508,22 @@ class AsyncMemory:
             return
 
         batch_data = [(key, json.dumps(value)) for key, value in items.items()]
+        await self._write_batch(batch_data)
 
+    async def _write_batch(self, batch_data: list[tuple]) -> None:
+        """Upsert ``(key, serialized_value)`` rows in a single transaction."""
         if self._process_lock is not None:
             async with self._process_lock:
                 await self._ensure_table()
                 async with self._lock:
-                    await self.database.execute_many(
-                        "INSERT OR REPLACE INTO memory (key, value) VALUES (?, ?)",
-                        batch_data,
-                    )
+                    await self.database.execute_many(_UPSERT_QUERY, batch_data)
         else:
             async with self._lock:
                 await self._ensure_table()
-                await self.database.execute_many(
-                    "INSERT OR REPLACE INTO memory (key, value) VALUES (?, ?)",
-                    batch_data,
-                )
+                await self.database.execute_many(_UPSERT_QUERY, batch_data)
 
     async def batch_load(self, keys: list[str]) -> dict[str, Any]:
-        """Load multiple keys in a single query.
+        """Load multiple keys with one query per page of keys.
 
         Args:
             keys: List of keys to load
@@ -415,19 +538,21 @@ class AsyncMemory:
         if not keys:
             return {}
 
-        placeholders = ",".join("?" * len(keys))
-        query = f"SELECT key, value FROM memory WHERE key IN ({placeholders})"
+        result = {}
+        for start in range(0, len(keys), _BATCH_LOAD_PAGE):
+            page = keys[start : start + _BATCH_LOAD_PAGE]
+            placeholders = ",".join("?" * len(page))
+            query = f"SELECT key, value FROM memory WHERE key IN ({placeholders})"
 
-        cursor = await self._execute_with_locks(query, *keys)
+            cursor = await self._execute_with_locks(query, *page)
 
-        if hasattr(cursor, "fetchall"):
-            rows = await cursor.fetchall()
-        else:
-            rows = cursor
+            if hasattr(cursor, "fetchall"):
+                rows = await cursor.fetchall()
+            else:
+                rows = cursor
 
-        result = {}
-        for row in rows or []:
-            key, value = row
-            result[key] = json.loads(value)
+            for row in rows or []:
+                key, value = row
+                result[key] = json.loads(value)
 
         return result
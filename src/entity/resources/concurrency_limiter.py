@@ -0,0 +1,205 @@
+"""Adaptive concurrency limit for calls to a latency-sensitive backend."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LimitAlgorithm(Enum):
+    """How the concurrency limit reacts to measured latency."""
+
+    AIMD = "aimd"
+    GRADIENT = "gradient"
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bound in-flight requests with a limit that follows observed latency.
+
+    Callers beyond the current limit wait in a priority queue; lower
+    ``priority`` values are admitted first, ties in arrival order.
+
+    ``GRADIENT``, the default, compares each sample with a slow-moving
+    latency baseline, shrinking the limit as latency rises above
+    ``tolerance`` times the baseline and growing it by ``sqrt(limit)`` while
+    latency stays flat, like Netflix's Gradient2 limiter. ``AIMD`` grows the
+    limit by about one per window of successful requests and multiplies it
+    by ``backoff_ratio`` on an error or a response slower than
+    ``latency_threshold``; without a threshold it reacts to errors only.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        algorithm: LimitAlgorithm | str = LimitAlgorithm.GRADIENT,
+        latency_threshold: Optional[float] = None,
+        backoff_ratio: float = 0.9,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        baseline_window: int = 100,
+        max_queue: Optional[int] = None,
+    ) -> None:
+        """Create a limiter.
+
+        Args:
+            initial_limit: Concurrent requests allowed before any measurement
+            min_limit: Lowest the limit may shrink to
+            max_limit: Highest the limit may grow to
+            algorithm: ``LimitAlgorithm`` or its value
+            latency_threshold: AIMD only; slower responses count as overload
+            backoff_ratio: AIMD only; factor applied to the limit on overload
+            tolerance: Gradient only; latency growth accepted before shrinking
+            smoothing: Gradient only; weight of each new limit estimate
+            baseline_window: Gradient only; samples averaged into the baseline
+            max_queue: Waiting callers allowed before new ones are rejected
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Require 1 <= min_limit <= initial_limit <= max_limit")
+        self.algorithm = LimitAlgorithm(algorithm)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.baseline_window = baseline_window
+        self.max_queue = max_queue
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._queue: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._baseline: Optional[float] = None
+        self._metrics = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected": 0,
+            "dropped": 0,
+            "max_queue_depth": 0,
+        }
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._queue if not future.done())
+
+    async def _acquire(self, priority: int) -> None:
+        if self._in_flight < self.limit and not self.queue_depth:
+            self._in_flight += 1
+            self._metrics["admitted"] += 1
+            return
+        if self.max_queue is not None and self.queue_depth >= self.max_queue:
+            self._metrics["rejected"] += 1
+            raise RuntimeError(
+                f"Concurrency limit {self.limit} reached and "
+                f"{self.queue_depth} requests already queued"
+            )
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), future))
+        self._metrics["queued"] += 1
+        self._metrics["max_queue_depth"] = max(
+            self._metrics["max_queue_depth"], self.queue_depth
+        )
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just as we were cancelled: hand the slot on.
+                self._release()
+            raise
+        self._metrics["admitted"] += 1
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._admit_waiters()
+
+    def _admit_waiters(self) -> None:
+        while self._queue and self._in_flight < self.limit:
+            _, _, future = heapq.heappop(self._queue)
+            if future.done():
+                continue
+            self._in_flight += 1
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def acquire(self, priority: int = 0) -> AsyncIterator[None]:
+        """Hold a concurrency slot for the duration of the block.
+
+        The block's latency updates the limit. Exceptions and timeouts raised
+        inside it count as overload signals.
+        """
+        await self._acquire(priority)
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except (asyncio.CancelledError, GeneratorExit):
+            outcome = "cancelled"
+            raise
+        except BaseException:
+            outcome = "dropped"
+            raise
+        finally:
+            if outcome != "cancelled":
+                # A call abandoned by its caller says nothing about latency.
+                self._update(time.perf_counter() - start, outcome == "dropped")
+            self._release()
+
+    async def run(self, call: Callable[[], Awaitable[T]], priority: int = 0) -> T:
+        """Await ``call()`` inside a concurrency slot."""
+        async with self.acquire(priority):
+            return await call()
+
+    def _update(self, latency: float, dropped: bool) -> None:
+        if self.algorithm is LimitAlgorithm.AIMD:
+            overloaded = dropped or (
+                self.latency_threshold is not None and latency > self.latency_threshold
+            )
+            if overloaded:
+                self._metrics["dropped"] += 1
+                limit = self._limit * self.backoff_ratio
+            elif self._in_flight * 2 >= self._limit:
+                # Only grow while the limit is actually being used.
+                limit = self._limit + 1.0 / self._limit
+            else:
+                limit = self._limit
+        else:
+            if dropped:
+                self._metrics["dropped"] += 1
+                latency = max(latency, self._baseline or latency) * 2
+            if self._baseline is None:
+                self._baseline = latency
+            gradient = max(0.5, min(1.0, self.tolerance * self._baseline / latency))
+            growth = math.sqrt(self._limit) if self._in_flight * 2 >= self._limit else 0
+            target = self._limit * gradient + growth
+            limit = (1 - self.smoothing) * self._limit + self.smoothing * target
+            self._baseline += (latency - self._baseline) / self.baseline_window
+        self._limit = min(self.max_limit, max(self.min_limit, limit))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return limiter state and counters for monitoring."""
+        return {
+            "algorithm": self.algorithm.value,
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "baseline_latency": self._baseline,
+            **self._metrics,
+        }
@@ -1,5 +1,8 @@
 """Database resource that executes queries using a DuckDB backend."""
 
+from typing import Any, Callable
+
+from entity.infrastructure.duckdb_infra import _is_read_only
 from entity.infrastructure.protocols import DatabaseInfrastructure
 from entity.resources.exceptions import ResourceInitializationError
 
@@ -24,7 +27,46 @@ class DatabaseResource:
         return self.infrastructure.health_check_sync()
 
     def execute(self, query: str, *params: object) -> object:
-        """Execute a SQL query and return the result cursor."""
+        """Execute a SQL query and return the result cursor.
+
+        Statements that modify data are sent over the infrastructure's writer
+        connection; read-only queries use a pooled reader. The connection is
+        back in the pool by the time this returns, so use one of the
+        ``fetch_*`` methods when the rows are needed.
+        """
 
-        with self.infrastructure.connect() as conn:
+        with self.infrastructure.connect(write=not _is_read_only(query)) as conn:
             return conn.execute(query, params)
+
+    def _fetch(self, query: str, params: tuple, fetch: Callable[[Any], Any]) -> Any:
+        """Run ``query`` and materialize its result before releasing the connection."""
+
+        with self.infrastructure.connect(write=not _is_read_only(query)) as conn:
+            return fetch(conn.execute(query, params))
+
+    def fetch_one(self, query: str, *params: object) -> tuple | None:
+        """Execute a query and return its first row, or ``None`` if empty."""
+
+        return self._fetch(query, params, lambda cursor: cursor.fetchone())
+
+    def fetch_all(self, query: str, *params: object) -> list[tuple]:
+        """Execute a query and return every row as a list of tuples."""
+
+        return self._fetch(query, params, lambda cursor: cursor.fetchall())
+
+    def fetch_arrow(self, query: str, *params: object) -> Any:
+        """Execute a query and return the result as a ``pyarrow.Table``.
+
+        Uses DuckDB's native Arrow export, so rows are never converted to
+        Python tuples. Requires ``pyarrow``.
+        """
+
+        return self._fetch(query, params, lambda cursor: cursor.fetch_arrow_table())
+
+    def fetch_numpy(self, query: str, *params: object) -> dict[str, Any]:
+        """Execute a query and return a mapping of column name to NumPy array.
+
+        Uses DuckDB's native NumPy export. Requires ``numpy``.
+        """
+
+        return self._fetch(query, params, lambda cursor: cursor.fetchnumpy())
@@ -1,19 +1,109 @@
 """Resource wrapper around an LLM infrastructure."""
 
+import asyncio
+import json
+import time
+from contextlib import aclosing, nullcontext
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from entity.infrastructure.token_counter import TokenCounter, TokenUsage, count_usage
+from entity.resources.concurrency_limiter import AdaptiveConcurrencyLimiter
 from entity.resources.exceptions import ResourceInitializationError
+from entity.resources.token_usage import TokenUsageRecorder
 
 from .llm_protocol import LLMInfrastructure
 
+# Infrastructure attributes that change the completion for a given prompt.
+_SAMPLING_ATTRIBUTES = (
+    "temperature",
+    "top_p",
+    "top_k",
+    "max_tokens",
+    "seed",
+    "reasoning_level",
+)
+
+
+def generation_identity(infrastructure: Any) -> tuple[str, dict[str, Any]]:
+    """Return the model name and sampling settings that shape a completion."""
+
+    model = getattr(infrastructure, "model", None) or getattr(
+        infrastructure, "model_path", type(infrastructure).__name__
+    )
+    params = {
+        name: getattr(infrastructure, name)
+        for name in _SAMPLING_ATTRIBUTES
+        if getattr(infrastructure, name, None) is not None
+    }
+    return str(model), params
+
+
+def is_stateful(infrastructure: Any) -> bool:
+    """Return ``True`` if a completion depends on more than the prompt.
+
+    Infrastructures that keep conversation state set ``stateful = True``;
+    their calls must not be shared or served from a cache. Wrappers such
+    as the adaptive infrastructure report their active backend's value,
+    which can change at runtime.
+    """
+
+    return bool(getattr(infrastructure, "stateful", False))
+
+
+@dataclass
+class _Flight:
+    """One upstream generation shared by every caller waiting on it."""
+
+    task: asyncio.Task
+    waiters: int = 0
+
 
 class LLMResource:
-    """Layer 2 resource that wraps an LLM infrastructure."""
+    """Layer 2 resource that wraps an LLM infrastructure.
+
+    Concurrent ``generate`` calls for the same prompt, model and sampling
+    settings are coalesced: the first caller starts the upstream request
+    and later callers wait on it, all receiving the same result or
+    exception. Stateful infrastructures are never coalesced. An optional
+    :class:`AdaptiveConcurrencyLimiter` bounds how many upstream calls run
+    at once.
+
+    Every upstream call's prompt and completion tokens are recorded in
+    ``usage``, charged to the current :func:`token_attribution`. Counts
+    reported by the infrastructure are used when available. A coalesced
+    call is charged once, to the caller that started it; callers that
+    joined it add no tokens, because none were generated for them.
+    """
 
-    def __init__(self, infrastructure: LLMInfrastructure | None) -> None:
-        """Initialize with the infrastructure instance."""
+    def __init__(
+        self,
+        infrastructure: LLMInfrastructure | None,
+        coalesce: bool = True,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        token_counter: TokenCounter | None = None,
+        usage: TokenUsageRecorder | None = None,
+    ) -> None:
+        """Initialize with the infrastructure instance.
+
+        Args:
+            infrastructure: LLM backend to call
+            coalesce: Share one upstream call between identical in-flight
+                requests; ignored for stateful infrastructures
+            limiter: Concurrency limiter applied to upstream calls
+            token_counter: Counts tokens the infrastructure does not report
+            usage: Recorder for token usage; a new one if not given
+        """
 
         if infrastructure is None:
             raise ResourceInitializationError("LLM infrastructure is required")
         self.infrastructure = infrastructure
+        self.coalesce = coalesce and not is_stateful(infrastructure)
+        self.limiter = limiter
+        self.token_counter = token_counter
+        self.usage = usage if usage is not None else TokenUsageRecorder()
+        self._inflight: dict[tuple[str, str, str], _Flight] = {}
+        self._metrics = {"requests": 0, "upstream_calls": 0, "coalesced": 0}
 
     def health_check(self) -> bool:
         """Return ``True`` if the underlying infrastructure is healthy."""
@@ -24,7 +114,97 @@ class LLMResource:
         """Synchronous wrapper for health_check for compatibility."""
         return self.health_check()
 
-    async def generate(self, prompt: str) -> str:
-        """Return the model output for a given prompt."""
+    async def generate(self, prompt: str, priority: int = 0) -> str:
+        """Return the model output for a given prompt.
+
+        ``priority`` orders calls waiting for the limiter; lower goes first.
+        """
+
+        self._metrics["requests"] += 1
+        if not self.coalesce or is_stateful(self.infrastructure):
+            self._metrics["upstream_calls"] += 1
+            return await self._call(prompt, priority)
+
+        model, params = generation_identity(self.infrastructure)
+        key = (model, json.dumps(params, sort_keys=True, default=str), prompt)
+        flight = self._inflight.get(key)
+        if flight is None:
+            self._metrics["upstream_calls"] += 1
+            flight = _Flight(asyncio.ensure_future(self._call(prompt, priority)))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+        else:
+            self._metrics["coalesced"] += 1
+
+        flight.waiters += 1
+        try:
+            # Shielded so one caller being cancelled does not cancel the
+            # request for everyone else waiting on it.
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    async def _call(self, prompt: str, priority: int) -> str:
+        if self.limiter is None:
+            return await self._generate(prompt)
+        return await self.limiter.run(lambda: self._generate(prompt), priority)
+
+    async def _generate(self, prompt: str) -> str:
+        start = time.perf_counter()
+        generate_with_usage = getattr(self.infrastructure, "generate_with_usage", None)
+        if generate_with_usage is not None:
+            text, usage = await generate_with_usage(prompt)
+        else:
+            text = await self.infrastructure.generate(prompt)
+            usage = count_usage(prompt, text, self.token_counter)
+        self.usage.record(usage, time.perf_counter() - start)
+        return text
+
+    def _land(self, key: tuple[str, str, str], flight: _Flight) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return request coalescing statistics for monitoring.
+
+        ``coalesced`` counts the upstream calls saved by sharing a request.
+        """
+
+        return {**self._metrics, "in_flight": len(self._inflight)}
+
+    async def stream(self, prompt: str, priority: int = 0) -> AsyncIterator[str]:
+        """Yield the model output for ``prompt`` as it is generated.
+
+        Infrastructures without a ``stream`` method produce a single chunk
+        holding the full :meth:`generate` result. Those with
+        ``stream_with_usage`` end the stream with the token counts they
+        report; other streams are counted. A limiter slot, if any, is held
+        until the stream finishes.
+        """
 
-        return await self.infrastructure.generate(prompt)
+        slot = self.limiter.acquire(priority) if self.limiter else nullcontext()
+        async with slot:
+            stream = getattr(self.infrastructure, "stream_with_usage", None) or getattr(
+                self.infrastructure, "stream", None
+            )
+            if stream is None:
+                yield await self._generate(prompt)
+                return
+            start = time.perf_counter()
+            received: list[str] = []
+            usage: TokenUsage | None = None
+            try:
+                async with aclosing(stream(prompt)) as chunks:
+                    async for chunk in chunks:
+                        if isinstance(chunk, TokenUsage):
+                            usage = chunk
+                            continue
+                        received.append(chunk)
+                        yield chunk
+            finally:
+                # Tokens of an abandoned stream were still generated.
+                if usage is None:
+                    usage = count_usage(prompt, "".join(received), self.token_counter)
+                self.usage.record(usage, time.perf_counter() - start)
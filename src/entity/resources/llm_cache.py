@@ -0,0 +1,325 @@
+"""Two-tier cache of LLM completions keyed by model, prompt and sampling."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Mapping
+
+from entity.resources.database import DatabaseResource
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Return ``prompt`` with Unicode and whitespace differences removed.
+
+    Case and punctuation are kept, since they can change what a model says.
+    """
+
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", prompt)).strip()
+
+
+def _digest(model: str, prompt: str, params: Mapping[str, Any]) -> str:
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "params": dict(params)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """In-memory LRU in front of an optional DuckDB table of completions.
+
+    Every entry is stored under two keys: a hash of the exact prompt and a
+    hash of its normalized form. A lookup tries the exact key first and
+    falls back to the normalized one, so prompts that differ only in
+    whitespace share an entry. Entries expire ``ttl`` seconds after they
+    were written. Both tiers are bounded; the memory tier evicts the least
+    recently used entry, the persistent tier drops the oldest rows.
+
+    Coroutines should use :meth:`get_async` and :meth:`put_async`, which
+    run the persistent tier's queries off the event loop. The persistent
+    table is created on first use, so constructing the cache runs no
+    queries.
+    """
+
+    def __init__(
+        self,
+        database: DatabaseResource | None = None,
+        max_entries: int = 1024,
+        ttl: float | None = 86_400.0,
+        max_persistent_entries: int = 100_000,
+        table: str = "llm_response_cache",
+        normalize: Callable[[str], str] | None = normalize_prompt,
+    ) -> None:
+        """Create the cache.
+
+        Args:
+            database: Resource holding the persistent tier; memory only if ``None``
+            max_entries: Entries kept in the in-memory LRU
+            ttl: Seconds an entry stays valid; ``None`` never expires
+            max_persistent_entries: Rows kept in the persistent table
+            table: Name of the persistent table
+            normalize: Prompt normalizer for the fallback key; ``None`` disables it
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.database = database
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_persistent_entries = max_persistent_entries
+        self.table = table
+        self.normalize = normalize
+        # exact key -> (response, expires_at, normalized key)
+        self._entries: OrderedDict[str, tuple[str, float, str | None]] = OrderedDict()
+        self._normalized: dict[str, str] = {}
+        self._writes_since_prune = 0
+        self._table_ready = False
+        # Guards both tiers; the async methods call in from worker threads.
+        self._lock = threading.RLock()
+        self._metrics = {
+            "memory_hits": 0,
+            "persistent_hits": 0,
+            "normalized_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "bypassed": 0,
+        }
+
+    def _ensure_table(self) -> None:
+        """Create the persistent table on first use, not at construction."""
+
+        if self._table_ready:
+            return
+        with self._lock:
+            if self._table_ready:
+                return
+            self.database.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key VARCHAR PRIMARY KEY, normalized_key VARCHAR, model VARCHAR, "
+                "response VARCHAR, created_at DOUBLE, expires_at DOUBLE)"
+            )
+            self.database.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_normalized "
+                f"ON {self.table}(normalized_key)"
+            )
+            self._table_ready = True
+
+    def keys(
+        self, model: str, prompt: str, params: Mapping[str, Any] | None = None
+    ) -> tuple[str, str | None]:
+        """Return the exact and normalized cache keys for a request."""
+
+        params = params or {}
+        exact = _digest(model, prompt, params)
+        if self.normalize is None:
+            return exact, None
+        return exact, _digest(model, self.normalize(prompt), params)
+
+    def get(
+        self, model: str, prompt: str, params: Mapping[str, Any] | None = None
+    ) -> str | None:
+        """Return the cached response for a request, or ``None`` on a miss."""
+
+        exact, normalized = self.keys(model, prompt, params)
+        response = self._lookup_memory(exact, normalized)
+        if response is None:
+            response = self._lookup_persistent(exact, normalized)
+        return response
+
+    async def get_async(
+        self, model: str, prompt: str, params: Mapping[str, Any] | None = None
+    ) -> str | None:
+        """Like :meth:`get`, querying the persistent tier in a worker thread."""
+
+        exact, normalized = self.keys(model, prompt, params)
+        response = self._lookup_memory(exact, normalized)
+        if response is None:
+            if self.database is None:
+                response = self._lookup_persistent(exact, normalized)
+            else:
+                response = await asyncio.to_thread(
+                    self._lookup_persistent, exact, normalized
+                )
+        return response
+
+    def put(
+        self,
+        model: str,
+        prompt: str,
+        response: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Store ``response`` for a request in both tiers."""
+
+        self._store_persistent(*self._store_memory(model, prompt, response, params))
+
+    async def put_async(
+        self,
+        model: str,
+        prompt: str,
+        response: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Like :meth:`put`, writing the persistent tier in a worker thread."""
+
+        row = self._store_memory(model, prompt, response, params)
+        if self.database is not None:
+            await asyncio.to_thread(self._store_persistent, *row)
+
+    def _lookup_memory(self, exact: str, normalized: str | None) -> str | None:
+        with self._lock:
+            now = time.time()
+            response = self._memory_get(exact, now)
+            if response is None and normalized is not None:
+                alias = self._normalized.get(normalized)
+                if alias is not None:
+                    response = self._memory_get(alias, now)
+                    if response is not None:
+                        self._metrics["normalized_hits"] += 1
+            if response is not None:
+                self._metrics["memory_hits"] += 1
+            return response
+
+    def _lookup_persistent(self, exact: str, normalized: str | None) -> str | None:
+        row = None
+        normalized_hit = False
+        if self.database is not None:
+            self._ensure_table()
+            now = time.time()
+            row = self.database.fetch_one(
+                f"SELECT response, expires_at, normalized_key FROM {self.table} "
+                "WHERE key = ? AND expires_at > ?",
+                exact,
+                now,
+            )
+            if row is None and normalized is not None:
+                row = self.database.fetch_one(
+                    f"SELECT response, expires_at, normalized_key FROM {self.table} "
+                    "WHERE normalized_key = ? AND expires_at > ? "
+                    "ORDER BY created_at DESC LIMIT 1",
+                    normalized,
+                    now,
+                )
+                normalized_hit = row is not None
+        with self._lock:
+            if row is None:
+                self._metrics["misses"] += 1
+                return None
+            if normalized_hit:
+                self._metrics["normalized_hits"] += 1
+            self._metrics["persistent_hits"] += 1
+            self._memory_put(exact, row[0], row[1], row[2])
+            return row[0]
+
+    def _store_memory(
+        self,
+        model: str,
+        prompt: str,
+        response: str,
+        params: Mapping[str, Any] | None,
+    ) -> tuple[str, str | None, str, str, float, float]:
+        exact, normalized = self.keys(model, prompt, params)
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._memory_put(exact, response, expires_at, normalized)
+            self._metrics["stores"] += 1
+        return exact, normalized, model, response, now, expires_at
+
+    def _store_persistent(self, *row: Any) -> None:
+        if self.database is None:
+            return
+        self._ensure_table()
+        self.database.execute(
+            f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?, ?, ?)", *row
+        )
+        with self._lock:
+            self._writes_since_prune += 1
+            # Pruning scans the table, so only do it once per ~1% of capacity.
+            due = self._writes_since_prune >= max(1, self.max_persistent_entries // 100)
+            if due:
+                self._writes_since_prune = 0
+        if due:
+            self.prune()
+
+    def record_bypass(self) -> None:
+        """Count a request that skipped the cache."""
+
+        with self._lock:
+            self._metrics["bypassed"] += 1
+
+    def prune(self) -> None:
+        """Drop expired rows and trim the persistent tier to its size limit."""
+
+        with self._lock:
+            self._writes_since_prune = 0
+        if self.database is None:
+            return
+        self._ensure_table()
+        self.database.execute(
+            f"DELETE FROM {self.table} WHERE expires_at <= ?", time.time()
+        )
+        self.database.execute(
+            f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} "
+            "ORDER BY created_at DESC OFFSET ?)",
+            self.max_persistent_entries,
+        )
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+
+        with self._lock:
+            self._entries.clear()
+            self._normalized.clear()
+        if self.database is not None:
+            self._ensure_table()
+            self.database.execute(f"DELETE FROM {self.table}")
+
+    def _memory_get(self, key: str, now: float) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= now:
+            self._memory_remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _memory_put(
+        self, key: str, response: str, expires_at: float, normalized: str | None
+    ) -> None:
+        if key in self._entries:
+            self._memory_remove(key)
+        self._entries[key] = (response, expires_at, normalized)
+        if normalized is not None:
+            self._normalized[normalized] = key
+        while len(self._entries) > self.max_entries:
+            self._memory_remove(next(iter(self._entries)))
+            self._metrics["evictions"] += 1
+
+    def _memory_remove(self, key: str) -> None:
+        _, _, normalized = self._entries.pop(key)
+        if normalized is not None and self._normalized.get(normalized) == key:
+            del self._normalized[normalized]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return hit-rate statistics for monitoring."""
+
+        hits = self._metrics["memory_hits"] + self._metrics["persistent_hits"]
+        lookups = hits + self._metrics["misses"]
+        return {
+            **self._metrics,
+            "hits": hits,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._entries),
+        }
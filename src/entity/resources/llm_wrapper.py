@@ -1,16 +1,23 @@
+from contextlib import aclosing
+from typing import Any, AsyncIterator
+
 from entity.resources.exceptions import ResourceInitializationError
-from entity.resources.llm import LLMResource
+from entity.resources.llm import LLMResource, generation_identity, is_stateful
+from entity.resources.llm_cache import LLMResponseCache
 
 
 class LLM:
     """Layer 3 wrapper around an LLM resource."""
 
-    def __init__(self, resource: LLMResource | None) -> None:
-        """Wrap the provided :class:`LLMResource`."""
+    def __init__(
+        self, resource: LLMResource | None, cache: LLMResponseCache | None = None
+    ) -> None:
+        """Wrap the provided :class:`LLMResource`, optionally caching responses."""
 
         if resource is None:
             raise ResourceInitializationError("LLMResource is required")
         self.resource = resource
+        self.cache = cache
 
     def health_check(self) -> bool:
         """Return ``True`` if the underlying resource is healthy."""
@@ -21,7 +28,38 @@ class LLM:
         """Synchronous wrapper for health_check for compatibility."""
         return self.health_check()
 
-    async def generate(self, prompt: str) -> str:
-        """Generate a completion using the underlying resource."""
+    async def generate(self, prompt: str, cache: bool = True, priority: int = 0) -> str:
+        """Generate a completion using the underlying resource.
+
+        With a response cache configured, repeated requests for the same
+        model, prompt and sampling parameters are answered from it. Pass
+        ``cache=False`` for prompts whose answer must be freshly sampled.
+        Stateful infrastructures, whose answers depend on conversation
+        history, always bypass the cache. ``priority`` orders requests queued by a concurrency limiter.
+        """
+
+        if self.cache is None:
+            return await self.resource.generate(prompt, priority=priority)
+        if not cache or is_stateful(self.resource.infrastructure):
+            self.cache.record_bypass()
+            return await self.resource.generate(prompt, priority=priority)
+        model, params = self._cache_identity()
+        response = await self.cache.get_async(model, prompt, params)
+        if response is None:
+            response = await self.resource.generate(prompt, priority=priority)
+            await self.cache.put_async(model, prompt, response, params)
+        return response
+
+    def _cache_identity(self) -> tuple[str, dict[str, Any]]:
+        return generation_identity(self.resource.infrastructure)
+
+    async def stream(self, prompt: str, priority: int = 0) -> AsyncIterator[str]:
+        """Stream a completion chunk by chunk.
+
+        Stop early with ``contextlib.aclosing`` (or by cancelling the task)
+        to abort the upstream generation.
+        """
 
-        return await self.resource.generate(prompt)
+        async with aclosing(self.resource.stream(prompt, priority=priority)) as chunks:
+            async for chunk in chunks:
+                yield chunk
@@ -122,18 +122,21 @@ class Memory:
 
         return self.database.execute(query, *params)
 
-    def add_vector(self, table: str, vector: object) -> None:
+    def add_vector(
+        self, table: str, vector: object, user_id: str | None = None
+    ) -> None:
         """Add a vector to the vector store.
 
         Args:
             table: Name of the table/collection to store the vector in.
             vector: Vector data to store (typically embeddings).
+            user_id: Owner of the vector, used to scope searches.
 
         Examples:
             >>> memory.add_vector("embeddings", [0.1, 0.2, 0.3, ...])
         """
 
-        self.vector_store.add_vector(table, vector)
+        self.vector_store.add_vector(table, vector, user_id=user_id)
 
     def query(self, query: str) -> object:
         """Execute a vector store query."""
@@ -159,25 +162,21 @@ class Memory:
             async with self._process_lock:
                 await self._ensure_table()
                 async with self._lock:
-                    result = await asyncio.to_thread(
-                        self.database.execute,
-                        query,
-                        *params,
-                    )
                     if fetch_one:
-                        return result.fetchone() if result else None
-                    return result
+                        return await asyncio.to_thread(
+                            self.database.fetch_one, query, *params
+                        )
+                    return await asyncio.to_thread(
+                        self.database.execute, query, *params
+                    )
         else:
             async with self._lock:
                 await self._ensure_table()
-                result = await asyncio.to_thread(
-                    self.database.execute,
-                    query,
-                    *params,
-                )
                 if fetch_one:
-                    return result.fetchone() if result else None
-                return result
+                    return await asyncio.to_thread(
+                        self.database.fetch_one, query, *params
+                    )
+                return await asyncio.to_thread(self.database.execute, query, *params)
 
     async def store(self, key: str, value: Any) -> None:
         """Persist ``value`` for ``key`` asynchronously."""
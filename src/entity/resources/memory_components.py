@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 from abc import ABC
-from typing import Any, List, Optional, Protocol
+from typing import Any, AsyncIterator, List, Optional, Protocol
 
 from entity.resources.database import DatabaseResource
 from entity.resources.vector_store import VectorStoreResource
@@ -81,6 +81,42 @@ class IMemory(Protocol):
         """
         ...
 
+    def iter_keys(
+        self,
+        pattern: Optional[str] = None,
+        user_id: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """Iterate over matching keys one page at a time.
+
+        Args:
+            pattern: Optional glob pattern to filter keys
+            user_id: Optional user ID for user-scoped storage
+            page_size: Number of keys fetched per query
+
+        Returns:
+            Async iterator of matching keys in key order
+        """
+        ...
+
+    def iter_items(
+        self,
+        pattern: Optional[str] = None,
+        user_id: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Iterate over matching ``(key, value)`` pairs one page at a time.
+
+        Args:
+            pattern: Optional glob pattern to filter keys
+            user_id: Optional user ID for user-scoped storage
+            page_size: Number of items fetched per query
+
+        Returns:
+            Async iterator of ``(key, value)`` pairs in key order
+        """
+        ...
+
     async def clear(
         self, pattern: Optional[str] = None, user_id: Optional[str] = None
     ) -> int:
@@ -202,10 +238,10 @@ class BaseMemory:
         scoped_key = self._make_key(key, user_id)
 
         query = f"SELECT value FROM {self.table_name} WHERE key = ?"
-        result = await asyncio.to_thread(self.database.execute, query, scoped_key)
+        row = await asyncio.to_thread(self.database.fetch_one, query, scoped_key)
 
-        if result and len(result) > 0:
-            return json.loads(result[0][0])
+        if row is not None:
+            return json.loads(row[0])
         return default
 
     async def delete(self, key: str, user_id: Optional[str] = None) -> bool:
@@ -215,11 +251,8 @@ class BaseMemory:
         scoped_key = self._make_key(key, user_id)
 
         query = f"DELETE FROM {self.table_name} WHERE key = ?"
-        await asyncio.to_thread(self.database.execute, query, scoped_key)
-
-        changes_query = "SELECT changes()"
-        changes = await asyncio.to_thread(self.database.execute, changes_query)
-        return changes[0][0] > 0 if changes else False
+        deleted = await asyncio.to_thread(self.database.fetch_one, query, scoped_key)
+        return bool(deleted and deleted[0] > 0)
 
     async def exists(self, key: str, user_id: Optional[str] = None) -> bool:
         """Check if a key exists in memory."""
@@ -228,43 +261,86 @@ class BaseMemory:
         scoped_key = self._make_key(key, user_id)
 
         query = f"SELECT 1 FROM {self.table_name} WHERE key = ? LIMIT 1"
-        result = await asyncio.to_thread(self.database.execute, query, scoped_key)
+        row = await asyncio.to_thread(self.database.fetch_one, query, scoped_key)
 
-        return bool(result and len(result) > 0)
+        return row is not None
 
-    async def keys(
-        self, pattern: Optional[str] = None, user_id: Optional[str] = None
-    ) -> List[str]:
-        """Get all keys matching an optional pattern."""
+    async def _iter_rows(
+        self,
+        columns: str,
+        pattern: Optional[str],
+        user_id: Optional[str],
+        page_size: int,
+    ) -> AsyncIterator[tuple]:
+        """Yield matching rows ordered by key, one keyset-paginated query per page.
+
+        Each page is a separate query that resumes after the last key seen,
+        so no cursor or connection is held while the caller consumes rows.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
         await self._ensure_initialized()
 
+        filters: list[str] = []
+        params: list[Any] = []
         if user_id:
+            filters.append("user_id = ?")
+            params.append(user_id)
             if pattern:
-                query = f"SELECT key FROM {self.table_name} WHERE user_id = ? AND key GLOB ?"
-                glob_pattern = f"{user_id}:{pattern}"
-                result = await asyncio.to_thread(
-                    self.database.execute, query, user_id, glob_pattern
-                )
-            else:
-                query = f"SELECT key FROM {self.table_name} WHERE user_id = ?"
-                result = await asyncio.to_thread(self.database.execute, query, user_id)
-        else:
-            if pattern:
-                query = f"SELECT key FROM {self.table_name} WHERE key GLOB ?"
-                result = await asyncio.to_thread(self.database.execute, query, pattern)
-            else:
-                query = f"SELECT key FROM {self.table_name}"
-                result = await asyncio.to_thread(self.database.execute, query)
-
-        if result:
-            keys = []
-            for row in result:
-                key = row[0]
-                if user_id and key.startswith(f"{user_id}:"):
-                    key = key[len(f"{user_id}:") :]
-                keys.append(key)
-            return keys
-        return []
+                filters.append("key GLOB ?")
+                params.append(f"{user_id}:{pattern}")
+        elif pattern:
+            filters.append("key GLOB ?")
+            params.append(pattern)
+
+        last_key: Optional[str] = None
+        while True:
+            page_filters = filters + (["key > ?"] if last_key is not None else [])
+            page_params = params + ([last_key] if last_key is not None else [])
+            where = f" WHERE {' AND '.join(page_filters)}" if page_filters else ""
+            query = (
+                f"SELECT {columns} FROM {self.table_name}{where} "
+                f"ORDER BY key LIMIT {int(page_size)}"
+            )
+            rows = await asyncio.to_thread(self.database.fetch_all, query, *page_params)
+            if not rows:
+                return
+            for row in rows:
+                yield row
+            if len(rows) < page_size:
+                return
+            last_key = rows[-1][0]
+
+    def _strip_user(self, key: str, user_id: Optional[str]) -> str:
+        if user_id and key.startswith(f"{user_id}:"):
+            return key[len(f"{user_id}:") :]
+        return key
+
+    async def iter_keys(
+        self,
+        pattern: Optional[str] = None,
+        user_id: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """Iterate over keys matching an optional pattern, page by page."""
+        async for row in self._iter_rows("key", pattern, user_id, page_size):
+            yield self._strip_user(row[0], user_id)
+
+    async def iter_items(
+        self,
+        pattern: Optional[str] = None,
+        user_id: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Iterate over ``(key, value)`` pairs matching an optional pattern."""
+        async for row in self._iter_rows("key, value", pattern, user_id, page_size):
+            yield self._strip_user(row[0], user_id), json.loads(row[1])
+
+    async def keys(
+        self, pattern: Optional[str] = None, user_id: Optional[str] = None
+    ) -> List[str]:
+        """Get all keys matching an optional pattern."""
+        return [key async for key in self.iter_keys(pattern, user_id)]
 
     async def clear(
         self, pattern: Optional[str] = None, user_id: Optional[str] = None
@@ -272,29 +348,32 @@ class BaseMemory:
         """Clear all keys matching an optional pattern."""
         await self._ensure_initialized()
 
+        # DuckDB answers a DELETE with the number of rows it removed.
         if user_id:
             if pattern:
                 query = (
                     f"DELETE FROM {self.table_name} WHERE user_id = ? AND key GLOB ?"
                 )
                 glob_pattern = f"{user_id}:{pattern}"
-                await asyncio.to_thread(
-                    self.database.execute, query, user_id, glob_pattern
+                deleted = await asyncio.to_thread(
+                    self.database.fetch_one, query, user_id, glob_pattern
                 )
             else:
                 query = f"DELETE FROM {self.table_name} WHERE user_id = ?"
-                await asyncio.to_thread(self.database.execute, query, user_id)
+                deleted = await asyncio.to_thread(
+                    self.database.fetch_one, query, user_id
+                )
         else:
             if pattern:
                 query = f"DELETE FROM {self.table_name} WHERE key GLOB ?"
-                await asyncio.to_thread(self.database.execute, query, pattern)
+                deleted = await asyncio.to_thread(
+                    self.database.fetch_one, query, pattern
+                )
             else:
                 query = f"DELETE FROM {self.table_name}"
-                await asyncio.to_thread(self.database.execute, query)
+                deleted = await asyncio.to_thread(self.database.fetch_one, query)
 
-        changes_query = "SELECT changes()"
-        changes = await asyncio.to_thread(self.database.execute, changes_query)
-        return changes[0][0] if changes else 0
+        return deleted[0] if deleted else 0
 
     async def size(self, user_id: Optional[str] = None) -> int:
         """Get the number of keys in memory."""
@@ -302,12 +381,12 @@ class BaseMemory:
 
         if user_id:
             query = f"SELECT COUNT(*) FROM {self.table_name} WHERE user_id = ?"
-            result = await asyncio.to_thread(self.database.execute, query, user_id)
+            row = await asyncio.to_thread(self.database.fetch_one, query, user_id)
         else:
             query = f"SELECT COUNT(*) FROM {self.table_name}"
-            result = await asyncio.to_thread(self.database.execute, query)
+            row = await asyncio.to_thread(self.database.fetch_one, query)
 
-        return result[0][0] if result else 0
+        return row[0] if row else 0
 
     def health_check(self) -> bool:
         """Check if the memory system is healthy."""
@@ -362,6 +441,26 @@ class MemoryDecorator(ABC):
         """Get all keys matching an optional pattern."""
         return await self._memory.keys(pattern, user_id)
 
+    async def iter_keys(
+        self,
+        pattern: Optional[str] = None,
+        user_id: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """Iterate over keys matching an optional pattern, page by page."""
+        async for key in self._memory.iter_keys(pattern, user_id, page_size):
+            yield key
+
+    async def iter_items(
+        self,
+        pattern: Optional[str] = None,
+        user_id: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Iterate over ``(key, value)`` pairs matching an optional pattern."""
+        async for item in self._memory.iter_items(pattern, user_id, page_size):
+            yield item
+
     async def clear(
         self, pattern: Optional[str] = None, user_id: Optional[str] = None
     ) -> int:
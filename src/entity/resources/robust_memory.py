@@ -334,25 +334,21 @@ class RobustMemory(Memory):
             async with self._acquire_lock(timeout=lock_timeout):
                 await self._ensure_table()
                 async with self._lock:
-                    result = await asyncio.to_thread(
-                        self.database.execute,
-                        query,
-                        *params,
-                    )
                     if fetch_one:
-                        return result.fetchone() if result else None
-                    return result
+                        return await asyncio.to_thread(
+                            self.database.fetch_one, query, *params
+                        )
+                    return await asyncio.to_thread(
+                        self.database.execute, query, *params
+                    )
         else:
             async with self._lock:
                 await self._ensure_table()
-                result = await asyncio.to_thread(
-                    self.database.execute,
-                    query,
-                    *params,
-                )
                 if fetch_one:
-                    return result.fetchone() if result else None
-                return result
+                    return await asyncio.to_thread(
+                        self.database.fetch_one, query, *params
+                    )
+                return await asyncio.to_thread(self.database.execute, query, *params)
 
     def get_lock_metrics(self) -> dict[str, Any]:
         """Get current lock performance metrics."""
@@ -0,0 +1,122 @@
+"""Per-user and per-plugin accounting of LLM token usage."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from entity.infrastructure.token_counter import TokenUsage
+
+UNATTRIBUTED = "unattributed"
+
+_attribution: ContextVar[tuple[str | None, str | None]] = ContextVar(
+    "llm_token_attribution", default=(None, None)
+)
+
+
+@contextmanager
+def token_attribution(
+    user_id: str | None = None, plugin_name: str | None = None
+) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to a user and plugin.
+
+    Plugins set this around their execution, so resources can charge
+    tokens without every call site passing identifiers along.
+    """
+
+    token = _attribution.set((user_id, plugin_name))
+    try:
+        yield
+    finally:
+        _attribution.reset(token)
+
+
+def current_attribution() -> tuple[str | None, str | None]:
+    """Return the ``(user_id, plugin_name)`` charged for LLM calls right now."""
+
+    return _attribution.get()
+
+
+def _empty_totals() -> dict[str, Any]:
+    return {
+        "calls": 0,
+        "exact_calls": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "generation_seconds": 0.0,
+    }
+
+
+def _summarize(totals: dict[str, Any]) -> dict[str, Any]:
+    seconds = totals["generation_seconds"]
+    return {
+        **totals,
+        "total_tokens": totals["prompt_tokens"] + totals["completion_tokens"],
+        "completion_tokens_per_second": (
+            totals["completion_tokens"] / seconds if seconds else 0.0
+        ),
+    }
+
+
+class TokenUsageRecorder:
+    """Aggregate prompt and completion tokens overall, per user and per plugin.
+
+    Calls made outside any :func:`token_attribution` block are grouped
+    under ``"unattributed"``.
+    """
+
+    def __init__(self) -> None:
+        self._totals = _empty_totals()
+        self._by_user: dict[str, dict[str, Any]] = {}
+        self._by_plugin: dict[str, dict[str, Any]] = {}
+
+    def record(
+        self,
+        usage: TokenUsage,
+        duration: float = 0.0,
+        user_id: str | None = None,
+        plugin_name: str | None = None,
+    ) -> None:
+        """Add one generation's usage, charged to the current attribution.
+
+        Args:
+            usage: Tokens consumed by the generation
+            duration: Seconds the generation took
+            user_id: User to charge instead of the current attribution
+            plugin_name: Plugin to charge instead of the current attribution
+        """
+
+        current_user, current_plugin = current_attribution()
+        user = user_id or current_user or UNATTRIBUTED
+        plugin = plugin_name or current_plugin or UNATTRIBUTED
+        for totals in (
+            self._totals,
+            self._by_user.setdefault(user, _empty_totals()),
+            self._by_plugin.setdefault(plugin, _empty_totals()),
+        ):
+            totals["calls"] += 1
+            totals["exact_calls"] += int(usage.exact)
+            totals["prompt_tokens"] += usage.prompt_tokens
+            totals["completion_tokens"] += usage.completion_tokens
+            totals["generation_seconds"] += duration
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return token totals and throughput for dashboards."""
+
+        return {
+            **_summarize(self._totals),
+            "by_user": {
+                user: _summarize(totals) for user, totals in self._by_user.items()
+            },
+            "by_plugin": {
+                plugin: _summarize(totals) for plugin, totals in self._by_plugin.items()
+            },
+        }
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+
+        self._totals = _empty_totals()
+        self._by_user.clear()
+        self._by_plugin.clear()
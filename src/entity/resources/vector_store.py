@@ -1,11 +1,113 @@
-"""Vector store resource backed by DuckDB."""
+"""Vector store resource backed by DuckDB or an in-process index."""
 
-from entity.infrastructure.protocols import VectorStoreInfrastructure
+import json
+import logging
+import math
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+from entity.infrastructure.protocols import (
+    VectorIndexInfrastructure,
+    VectorStoreInfrastructure,
+)
 from entity.resources.exceptions import ResourceInitializationError
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pyarrow = None
+    PYARROW_AVAILABLE = False
+
+_DISTANCE_FUNCTIONS = {
+    "cosine": "array_cosine_distance",
+    "l2": "array_distance",
+    "ip": "array_negative_inner_product",
+}
+
+# Names the vss extension uses for the metric that accelerates each function.
+_HNSW_METRICS = {"cosine": "cosine", "l2": "l2sq", "ip": "ip"}
+
+
+@dataclass
+class VectorSearchResult:
+    """A single nearest-neighbour match returned by ``search``.
+
+    ``distance`` is smaller for closer matches: cosine distance, Euclidean
+    distance, or the negative inner product depending on the metric.
+    """
+
+    id: str
+    distance: float
+    metadata: dict[str, Any] = field(default_factory=dict)
+    user_id: Optional[str] = None
+
+
+def _check_identifier(name: str, kind: str = "table name") -> None:
+    if not name.isidentifier():
+        raise ValueError(f"Invalid {kind}: {name}")
+
+
+def _vector_literal(values: Sequence[float]) -> str:
+    """Render ``values`` as a ``FLOAT[n]`` SQL literal.
+
+    DuckDB binds list parameters element by element, which costs tens of
+    milliseconds for a few hundred floats; a literal is parsed far faster.
+    """
+
+    floats = [float(v) for v in values]
+    if not all(math.isfinite(v) for v in floats):
+        raise ValueError("vector values must be finite")
+    return f"[{', '.join(map(repr, floats))}]::FLOAT[{len(floats)}]"
+
+
+def _matrix(vectors: Any) -> tuple[Any, int]:
+    """Return ``vectors`` as a float32 matrix (or list of rows) and its width."""
+
+    if PYARROW_AVAILABLE and isinstance(vectors, pyarrow.ChunkedArray):
+        vectors = vectors.combine_chunks()
+    if PYARROW_AVAILABLE and isinstance(vectors, pyarrow.Array):
+        if NUMPY_AVAILABLE and len(vectors):
+            flat = vectors.flatten().to_numpy(zero_copy_only=False)
+            vectors = flat.reshape(len(vectors), -1)
+        else:
+            vectors = vectors.to_pylist()
+    if NUMPY_AVAILABLE:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError("vectors must be a two-dimensional array")
+        return matrix, matrix.shape[1]
+    rows = [[float(v) for v in row] for row in vectors]
+    widths = {len(row) for row in rows}
+    if len(widths) > 1:
+        raise ValueError("all vectors must have the same dimension")
+    return rows, widths.pop() if widths else 0
+
 
 class VectorStoreResource:
-    """Layer 2 resource for storing and searching vectors."""
+    """Layer 2 resource for storing and searching vectors.
+
+    Each collection is a table with a fixed-size ``FLOAT[dim]`` embedding
+    column plus ``id``, ``user_id`` and JSON ``metadata`` columns. Searches
+    run inside DuckDB with its array distance functions, so vectors never
+    have to be pulled into Python. When DuckDB's ``vss`` extension is
+    available, ``create_index`` adds an HNSW index that DuckDB uses for
+    unfiltered top-k queries.
+
+    Infrastructures implementing ``VectorIndexInfrastructure``, such as
+    ``NumPyVectorInfrastructure``, are called directly instead of through
+    SQL; the methods below behave the same with either backend.
+    """
 
     def __init__(self, infrastructure: VectorStoreInfrastructure | None) -> None:
         """Create the resource with a vector store backend."""
@@ -13,6 +115,9 @@ class VectorStoreResource:
         if infrastructure is None:
             raise ResourceInitializationError("VectorStoreInfrastructure is required")
         self.infrastructure = infrastructure
+        self._native = isinstance(infrastructure, VectorIndexInfrastructure)
+        self._tables: dict[str, int] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
 
     async def health_check(self) -> bool:
         """Return ``True`` if the underlying infrastructure is healthy."""
@@ -23,18 +128,365 @@ class VectorStoreResource:
         """Synchronous wrapper for health_check for compatibility."""
         return self.infrastructure.health_check_sync()
 
-    def add_vector(self, table: str, vector: object) -> None:
-        """Insert a vector into the given table."""
+    def create_table(self, table: str, dim: int) -> None:
+        """Create a vector table with ``dim``-dimensional embeddings if missing.
+
+        Tables this resource has already created are remembered, so repeated
+        calls do not touch the database. Tables dropped through ``query``
+        are not tracked.
+        """
+
+        _check_identifier(table)
+        if dim < 1:
+            raise ValueError("dim must be at least 1")
+        if self._tables.get(table) == dim:
+            return
+        if self._native:
+            self.infrastructure.create_table(table, dim)
+        else:
+            self._check_schema(table)
+            with self.infrastructure.connect(write=True) as conn:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    "id VARCHAR PRIMARY KEY, "
+                    "user_id VARCHAR, "
+                    "metadata JSON, "
+                    f"embedding FLOAT[{int(dim)}])"
+                )
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_user_id ON {table} (user_id)"
+                )
+        self._tables[table] = dim
+
+    def _check_schema(self, table: str) -> None:
+        """Reject tables left in the untyped layout of older releases.
 
-        if not table.isidentifier():
-            raise ValueError(f"Invalid table name: {table}")
+        Earlier versions stored vectors in a single ``vector ANY`` column,
+        which the typed queries here cannot read.
+        """
 
         with self.infrastructure.connect() as conn:
-            conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (vector ANY)")
-            conn.execute(f"INSERT INTO {table} VALUES (?)", (vector,))
+            rows = conn.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = ?",
+                [table],
+            ).fetchall()
+        columns = {row[0] for row in rows}
+        if columns and "embedding" not in columns:
+            raise RuntimeError(
+                f"Vector table {table!r} uses the legacy (vector ANY) layout. "
+                f"Rename it (ALTER TABLE {table} RENAME TO {table}_legacy) and "
+                "re-add its vectors with add_vectors to migrate."
+            )
+
+    def add_vector(
+        self,
+        table: str,
+        vector: Sequence[float],
+        id: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        user_id: Optional[str] = None,
+    ) -> str:
+        """Insert or replace a vector and return its id.
+
+        The table is created on first use with the vector's dimension.
+
+        Args:
+            table: Collection name
+            vector: Embedding values
+            id: Identifier for the vector; a random one is generated if omitted
+            metadata: JSON-serializable attributes stored with the vector
+            user_id: Owner of the vector, for per-user filtering
+        """
+
+        values = [float(v) for v in vector]
+        vector_id = id if id is not None else uuid.uuid4().hex
+        self.create_table(table, len(values))
+        if self._native:
+            self.infrastructure.upsert_vectors(
+                table, [vector_id], [values], [metadata], [user_id]
+            )
+            return vector_id
+
+        with self.infrastructure.connect(write=True) as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {table} (id, user_id, metadata, embedding) "
+                f"VALUES (?, ?, ?, {_vector_literal(values)})",
+                (
+                    vector_id,
+                    user_id,
+                    json.dumps(metadata) if metadata is not None else None,
+                ),
+            )
+        return vector_id
+
+    def add_vectors(
+        self,
+        table: str,
+        vectors: Any,
+        ids: Optional[Sequence[str]] = None,
+        metadata: Optional[Sequence[Optional[dict[str, Any]]]] = None,
+        user_ids: Optional[Sequence[Optional[str]]] = None,
+    ) -> list[str]:
+        """Insert or replace many vectors in one statement and return their ids.
+
+        ``vectors`` may be a 2-D NumPy array, a list of equal-length
+        sequences, or a ``pyarrow.Table`` with an ``embedding`` column and
+        optional ``id``, ``metadata`` and ``user_id`` columns; explicit
+        arguments take precedence over table columns. With ``pyarrow``
+        installed the rows reach DuckDB as a single Arrow scan instead of
+        one parameter set per row.
+
+        Args:
+            table: Collection name
+            vectors: Embeddings, one per row
+            ids: Identifiers; random ones are generated if omitted
+            metadata: JSON-serializable attributes per vector
+            user_ids: Owner of each vector
+        """
+
+        if PYARROW_AVAILABLE and isinstance(vectors, pyarrow.Table):
+            columns = vectors.column_names
+            if ids is None and "id" in columns:
+                ids = vectors.column("id").to_pylist()
+            if metadata is None and "metadata" in columns:
+                metadata = [
+                    json.loads(m) if isinstance(m, str) else m
+                    for m in vectors.column("metadata").to_pylist()
+                ]
+            if user_ids is None and "user_id" in columns:
+                user_ids = vectors.column("user_id").to_pylist()
+            vectors = vectors.column("embedding")
+
+        if len(vectors) == 0:
+            return []
+        matrix, dim = _matrix(vectors)
+        count = len(matrix)
+        ids = list(ids) if ids is not None else [uuid.uuid4().hex for _ in matrix]
+        metadata = list(metadata) if metadata is not None else [None] * count
+        user_ids = list(user_ids) if user_ids is not None else [None] * count
+        if not len(ids) == len(metadata) == len(user_ids) == count:
+            raise ValueError("ids, metadata and user_ids must match the vector count")
+
+        self.create_table(table, dim)
+        if self._native:
+            self.infrastructure.upsert_vectors(table, ids, matrix, metadata, user_ids)
+            return ids
+
+        encoded = [json.dumps(m) if m is not None else None for m in metadata]
+        with self.infrastructure.connect(write=True) as conn:
+            if PYARROW_AVAILABLE:
+                flat = (
+                    matrix.reshape(-1)
+                    if NUMPY_AVAILABLE
+                    else [v for row in matrix for v in row]
+                )
+                batch = pyarrow.table(
+                    {
+                        "id": pyarrow.array(ids, pyarrow.string()),
+                        "user_id": pyarrow.array(user_ids, pyarrow.string()),
+                        "metadata": pyarrow.array(encoded, pyarrow.string()),
+                        "embedding": pyarrow.FixedSizeListArray.from_arrays(
+                            pyarrow.array(flat, pyarrow.float32()), dim
+                        ),
+                    }
+                )
+                view = f"_vectors_{uuid.uuid4().hex}"
+                conn.register(view, batch)
+                try:
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO {table} "
+                        "(id, user_id, metadata, embedding) "
+                        "SELECT id, user_id, metadata::JSON, "
+                        f"embedding::FLOAT[{dim}] FROM {view}"
+                    )
+                finally:
+                    conn.unregister(view)
+            else:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} (id, user_id, metadata, embedding) "
+                    f"VALUES (?, ?, ?, ?::FLOAT[{dim}])",
+                    [
+                        (ids[i], user_ids[i], encoded[i], [float(v) for v in row])
+                        for i, row in enumerate(matrix)
+                    ],
+                )
+        return ids
+
+    def create_index(
+        self, table: str, metric: str = "cosine", persist: bool = False
+    ) -> bool:
+        """Build an HNSW index on ``table`` using DuckDB's ``vss`` extension.
+
+        Returns ``False`` and leaves searches on exact scans if the
+        extension cannot be loaded. ``search`` only benefits from the index
+        when it is called with the same ``metric``.
+
+        DuckDB only stores HNSW indexes in database files behind its
+        experimental persistence setting, which applies to the whole
+        database and can lose the index (or worse) after a crash. For
+        file-backed databases the index is therefore only built with
+        ``persist=True``, which turns that setting on.
+        """
+
+        _check_identifier(table)
+        if metric not in _DISTANCE_FUNCTIONS:
+            raise ValueError(f"Unknown metric: {metric}")
+        if self._native:
+            return False
+        file_backed = (
+            getattr(self.infrastructure, "file_path", ":memory:") != ":memory:"
+        )
+        if file_backed and not persist:
+            self.logger.warning(
+                "Not indexing %s: HNSW indexes in database files need "
+                "create_index(..., persist=True); using exact search",
+                table,
+            )
+            return False
+        with self.infrastructure.connect(write=True) as conn:
+            try:
+                conn.execute("INSTALL vss")
+                conn.execute("LOAD vss")
+            except Exception as exc:
+                self.logger.warning(
+                    "DuckDB vss extension unavailable, using exact search: %s", exc
+                )
+                return False
+            if file_backed:
+                conn.execute("SET hnsw_enable_experimental_persistence = true")
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_hnsw_{metric} ON {table} "
+                f"USING HNSW (embedding) WITH (metric = '{_HNSW_METRICS[metric]}')"
+            )
+        return True
+
+    def search(
+        self,
+        table: str,
+        query_vector: Sequence[float],
+        k: int = 10,
+        filter: Optional[dict[str, Any]] = None,
+        metric: str = "cosine",
+        user_id: Optional[str] = None,
+    ) -> list[VectorSearchResult]:
+        """Return the ``k`` vectors in ``table`` closest to ``query_vector``.
+
+        ``user_id`` and ``filter`` restrict the candidate rows before
+        distances are computed, so a user always gets up to ``k`` of their
+        own vectors and the cost follows the size of their data.
+
+        Args:
+            table: Collection name
+            query_vector: Embedding to compare against; must match the
+                table's dimension
+            k: Number of results
+            filter: Metadata values the results must equal, e.g.
+                ``{"source": "email"}``
+            metric: ``"cosine"``, ``"l2"`` or ``"ip"`` (negative inner product)
+            user_id: Only return vectors owned by this user
+
+        Returns:
+            Matches ordered from closest to farthest
+        """
+
+        return self.search_batch(table, [query_vector], k, filter, metric, user_id)[0]
+
+    def search_batch(
+        self,
+        table: str,
+        query_vectors: Sequence[Sequence[float]],
+        k: int = 10,
+        filter: Optional[dict[str, Any]] = None,
+        metric: str = "cosine",
+        user_id: Optional[str] = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Run ``search`` for several query vectors at once.
+
+        Native index backends score the whole batch with a single matrix
+        multiply; SQL backends run one query per vector.
+
+        Returns:
+            One result list per query vector, in the same order
+        """
+
+        _check_identifier(table)
+        if metric not in _DISTANCE_FUNCTIONS:
+            raise ValueError(f"Unknown metric: {metric}")
+        for key in filter or {}:
+            _check_identifier(key, "metadata key")
+        if k < 1:
+            return [[] for _ in query_vectors]
+
+        if self._native:
+            matches = self.infrastructure.search_vectors(
+                table, query_vectors, k, filter, metric, user_id
+            )
+            return [
+                [
+                    VectorSearchResult(
+                        id=vector_id,
+                        distance=distance,
+                        metadata=metadata,
+                        user_id=user_id,
+                    )
+                    for vector_id, distance, metadata, user_id in found
+                ]
+                for found in matches
+            ]
+        return [
+            self._search_sql(table, query, k, filter, metric, user_id)
+            for query in query_vectors
+        ]
+
+    def _search_sql(
+        self,
+        table: str,
+        query_vector: Sequence[float],
+        k: int,
+        filter: Optional[dict[str, Any]],
+        metric: str,
+        user_id: Optional[str],
+    ) -> list[VectorSearchResult]:
+        # DuckDB applies the WHERE clause during the scan (or through the
+        # user_id index), so distances are only computed for matching rows.
+        conditions: list[str] = []
+        params: list[Any] = []
+        if user_id is not None:
+            conditions.append("user_id = ?")
+            params.append(user_id)
+        for key, expected in (filter or {}).items():
+            conditions.append(f"json_extract_string(metadata, '$.{key}') = ?")
+            params.append(
+                expected if isinstance(expected, str) else json.dumps(expected)
+            )
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        if table not in self._tables:
+            self._check_schema(table)
+        distance = _DISTANCE_FUNCTIONS[metric]
+        query = (
+            f"SELECT id, distance, metadata, user_id FROM ("
+            f"SELECT id, metadata, user_id, "
+            f"{distance}(embedding, {_vector_literal(query_vector)}) AS distance "
+            f"FROM {table} {where}"
+            f"ORDER BY distance LIMIT {int(k)})"
+        )
+        with self.infrastructure.connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [
+            VectorSearchResult(
+                id=row[0],
+                distance=float(row[1]),
+                metadata=json.loads(row[2]) if row[2] else {},
+                user_id=row[3],
+            )
+            for row in rows
+        ]
 
     def query(self, query: str) -> object:
-        """Run a vector search query."""
+        """Run a raw SQL query against the vector store."""
 
         with self.infrastructure.connect() as conn:
             return conn.execute(query)
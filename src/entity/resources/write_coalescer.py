@@ -0,0 +1,97 @@
+"""Group commit for concurrent writes of the same statement."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+
+class WriteCoalescer:
+    """Collect concurrent writes and commit them together.
+
+    Each ``submit`` call queues one parameter tuple and waits. Queued rows are
+    flushed as a single batch once ``window`` seconds pass after the first
+    one arrived or ``max_batch`` rows are waiting, whichever comes first.
+    The flush callback is expected to write the whole batch in one
+    transaction. Every caller in the batch is resolved after it commits, or
+    receives its exception if it fails, so an acknowledged write is as
+    durable as an individual one.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[tuple]], Awaitable[None]],
+        window: float = 0.002,
+        max_batch: int = 256,
+    ) -> None:
+        """Create a coalescer around ``flush``.
+
+        Args:
+            flush: Coroutine function that writes a list of parameter tuples
+            window: Seconds to wait for more writes before flushing
+            max_batch: Number of queued writes that triggers an immediate flush
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self._flush = flush
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: list[tuple[tuple, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._metrics = {"writes": 0, "batches": 0, "largest_batch": 0, "failures": 0}
+
+    async def submit(self, params: tuple) -> None:
+        """Queue ``params`` and wait until the batch containing it commits."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((params, future))
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._start_flush)
+        await future
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._write(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, batch: list[tuple[tuple, asyncio.Future]]) -> None:
+        self._metrics["batches"] += 1
+        self._metrics["writes"] += len(batch)
+        self._metrics["largest_batch"] = max(self._metrics["largest_batch"], len(batch))
+        try:
+            await self._flush([params for params, _ in batch])
+        except BaseException as exc:
+            self._metrics["failures"] += 1
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+    async def flush(self) -> None:
+        """Write every queued row now and wait for in-flight batches."""
+        self._start_flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return batching statistics for monitoring."""
+        batches = self._metrics["batches"]
+        return {
+            **self._metrics,
+            "pending": len(self._pending),
+            "average_batch": self._metrics["writes"] / batches if batches else 0.0,
+        }
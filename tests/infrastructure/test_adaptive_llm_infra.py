@@ -1,5 +1,7 @@
 """Tests for Adaptive LLM Infrastructure with GPU Acceleration Detection."""
 
+import asyncio
+import threading
 from typing import List
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -8,9 +10,11 @@ import pytest
 from entity.infrastructure.adaptive_llm_infra import (
     AccelerationType,
     AdaptiveLLMInfrastructure,
+    BenchmarkCache,
     ModelBackend,
     ModelConfig,
     PerformanceBenchmark,
+    StandardModelInfrastructure,
 )
 
 
@@ -18,10 +22,12 @@ class TestAdaptiveLLMInfrastructure:
     """Test suite for AdaptiveLLMInfrastructure."""
 
     @pytest.fixture
-    def infrastructure(self):
+    def infrastructure(self, tmp_path):
         """Create infrastructure instance for testing."""
         return AdaptiveLLMInfrastructure(
-            benchmark_timeout=5.0, min_tokens_per_second=10.0
+            benchmark_timeout=5.0,
+            min_tokens_per_second=10.0,
+            benchmark_cache=tmp_path / "benchmarks.json",
         )
 
     @pytest.fixture
@@ -225,14 +231,11 @@ class TestAdaptiveLLMInfrastructure:
             priority=1,
         )
 
-        with (
-            patch.object(infrastructure, "_create_test_infrastructure") as mock_create,
-            patch.object(
-                infrastructure, "_test_harmony_model", return_value="Test response"
-            ),
-        ):
-            mock_infra = Mock()
+        with patch.object(infrastructure, "_create_test_infrastructure") as mock_create:
+            mock_infra = Mock(spec=["startup", "shutdown", "generate"])
+            mock_infra.startup = AsyncMock()
             mock_infra.shutdown = AsyncMock()
+            mock_infra.generate = AsyncMock(return_value="Test response")
             mock_create.return_value = mock_infra
 
             benchmark = await infrastructure._run_performance_test(model_config)
@@ -241,6 +244,8 @@ class TestAdaptiveLLMInfrastructure:
             assert benchmark.success is True
             assert benchmark.tokens_per_second > 0
             assert benchmark.latency_ms > 0
+            mock_infra.startup.assert_awaited_once()
+            mock_infra.shutdown.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_run_performance_test_failure(self, infrastructure):
@@ -451,26 +456,36 @@ class TestAdaptiveLLMInfrastructure:
             await infrastructure._create_test_infrastructure(model_config)
 
             mock_harmony.assert_called_once_with(
-                model_name="test-model", temperature=0.7, max_tokens=100
+                model_path="test-model", temperature=0.7, max_tokens=100
             )
 
     @pytest.mark.asyncio
     async def test_harmony_model_testing(self, infrastructure):
         """Test harmony model performance testing."""
-        mock_infra = Mock()
-        result = await infrastructure._test_harmony_model(mock_infra, "test prompt")
+        config = ModelConfig(
+            backend=ModelBackend.GPT_OSS_HARMONY,
+            model_name="test-model",
+            acceleration=AccelerationType.MXFP4,
+        )
 
-        assert isinstance(result, str)
-        assert len(result) > 0
+        benchmark = await infrastructure._run_performance_test(config)
+
+        assert benchmark.success is True
+        assert benchmark.tokens_per_second > 0
+        assert 0 < benchmark.ttft_ms <= benchmark.latency_ms
 
     @pytest.mark.asyncio
     async def test_standard_model_testing(self, infrastructure):
         """Test standard model performance testing."""
-        mock_infra = Mock()
-        result = await infrastructure._test_standard_model(mock_infra, "test prompt")
+        mock_infra = Mock(spec=["generate"])
+        mock_infra.generate = AsyncMock(return_value="The capital is Paris.")
+
+        result, ttft = await infrastructure._measure_generation(
+            mock_infra, "test prompt"
+        )
 
-        assert isinstance(result, str)
-        assert len(result) > 0
+        assert result == "The capital is Paris."
+        assert ttft > 0
 
     @pytest.mark.asyncio
     async def test_initialize_backend_harmony(self, infrastructure):
@@ -594,3 +609,348 @@ class TestPerformanceBenchmark:
         )
 
         assert benchmark.error_message is None
+
+
+class TestBenchmarkMeasurement:
+    """Real timed generations and persisted benchmark results."""
+
+    @pytest.fixture
+    def config(self):
+        return ModelConfig(
+            backend=ModelBackend.CPU_FALLBACK,
+            model_name="test-cpu-model",
+            acceleration=AccelerationType.CPU_ONLY,
+        )
+
+    @pytest.fixture
+    def backend(self):
+        class StreamingBackend:
+            startup = AsyncMock()
+            shutdown = AsyncMock()
+
+            async def stream(self, prompt):
+                await asyncio.sleep(0.02)
+                yield "Paris is "
+                await asyncio.sleep(0.05)
+                yield "the capital."
+
+        return StreamingBackend()
+
+    def make_infra(self, tmp_path, **kwargs):
+        infra = AdaptiveLLMInfrastructure(
+            benchmark_cache=tmp_path / "benchmarks.json", **kwargs
+        )
+        infra.acceleration_type = AccelerationType.CPU_ONLY
+        return infra
+
+    @pytest.mark.asyncio
+    async def test_streaming_backend_reports_ttft(self, tmp_path, config, backend):
+        infra = self.make_infra(tmp_path)
+        with patch.object(infra, "_create_test_infrastructure", return_value=backend):
+            benchmark = await infra._run_performance_test(config)
+
+        assert benchmark.success is True
+        assert 15 <= benchmark.ttft_ms < benchmark.latency_ms
+        assert benchmark.latency_ms >= 60
+        assert benchmark.memory_usage_mb >= 0
+
+    @pytest.mark.asyncio
+    async def test_throughput_uses_token_counter(self, tmp_path, config, backend):
+        counter = Mock()
+        counter.count.return_value = 50
+        infra = self.make_infra(tmp_path, token_counter=counter)
+        with patch.object(infra, "_create_test_infrastructure", return_value=backend):
+            benchmark = await infra._run_performance_test(config)
+
+        counter.count.assert_called_once_with("Paris is the capital.")
+        assert benchmark.tokens_per_second == pytest.approx(
+            50 / (benchmark.latency_ms / 1000)
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_backend_times_out(self, tmp_path, config, backend):
+        infra = self.make_infra(tmp_path, benchmark_timeout=0.01)
+        with patch.object(infra, "_create_test_infrastructure", return_value=backend):
+            benchmark = await infra._run_performance_test(config)
+
+        assert benchmark.success is False
+        assert "timeout" in benchmark.error_message
+        backend.shutdown.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_results_are_reused_across_startups(self, tmp_path, config):
+        measured = PerformanceBenchmark(
+            tokens_per_second=42.0, latency_ms=10.0, memory_usage_mb=1.0, success=True
+        )
+        first = self.make_infra(tmp_path)
+        with patch.object(first, "_run_performance_test", return_value=measured):
+            await first._benchmark_and_select([config])
+
+        second = self.make_infra(tmp_path)
+        with patch.object(second, "_run_performance_test") as run:
+            await second._benchmark_and_select([config])
+
+        run.assert_not_called()
+        assert second.benchmark_results[config.backend] == measured
+
+    @pytest.mark.asyncio
+    async def test_force_benchmark_ignores_stored_results(self, tmp_path, config):
+        measured = PerformanceBenchmark(
+            tokens_per_second=42.0, latency_ms=10.0, memory_usage_mb=1.0, success=True
+        )
+        first = self.make_infra(tmp_path)
+        with patch.object(first, "_run_performance_test", return_value=measured):
+            await first._benchmark_and_select([config])
+
+        forced = self.make_infra(tmp_path, force_benchmark=True)
+        with patch.object(
+            forced, "_run_performance_test", return_value=measured
+        ) as run:
+            await forced._benchmark_and_select([config])
+
+        run.assert_awaited_once()
+
+    def test_cache_key_depends_on_model_and_hardware(self, config):
+        other_model = ModelConfig(
+            backend=config.backend,
+            model_name="other-model",
+            acceleration=config.acceleration,
+        )
+
+        key = BenchmarkCache.key(config, AccelerationType.CPU_ONLY)
+
+        assert key == BenchmarkCache.key(config, AccelerationType.CPU_ONLY)
+        assert key != BenchmarkCache.key(other_model, AccelerationType.CPU_ONLY)
+        assert key != BenchmarkCache.key(config, AccelerationType.CUDA)
+
+    def test_failed_and_stale_results_are_not_reused(self, tmp_path, config):
+        cache = BenchmarkCache(tmp_path / "benchmarks.json", max_age=0.0)
+        failed = PerformanceBenchmark(0.0, 0.0, 0.0, success=False)
+        ok = PerformanceBenchmark(10.0, 1.0, 1.0, success=True)
+
+        cache.put("failed", config, failed)
+        cache.put("ok", config, ok)
+
+        assert cache.get("failed") is None
+        assert cache.get("ok") is None
+        assert (
+            BenchmarkCache(tmp_path / "benchmarks.json", max_age=None).get("ok") == ok
+        )
+
+
+class TestStandardModelInfrastructure:
+    """Pipeline loading for transformers backends."""
+
+    @pytest.fixture
+    def transformers(self):
+        fake = Mock()
+        fake.loaded = []
+
+        def pipeline(*args, **kwargs):
+            fake.loaded.append(threading.get_ident())
+            return Mock(return_value=[{"generated_text": "hi"}])
+
+        fake.pipeline.side_effect = pipeline
+        with patch("entity.infrastructure.adaptive_llm_infra.transformers", fake):
+            with patch(
+                "entity.infrastructure.adaptive_llm_infra.TRANSFORMERS_AVAILABLE", True
+            ):
+                yield fake
+
+    @pytest.mark.asyncio
+    async def test_startup_loads_pipeline_in_a_thread(self, transformers):
+        infra = StandardModelInfrastructure(
+            ModelConfig(
+                backend=ModelBackend.TRANSFORMERS_GPTQ,
+                model_name="test-model",
+                acceleration=AccelerationType.CUDA,
+            )
+        )
+
+        await infra.startup()
+        assert transformers.loaded
+        assert transformers.loaded[0] != threading.get_ident()
+
+        assert await infra.generate("p") == "hi"
+        assert len(transformers.loaded) == 1
+
+
+class FakeBackend:
+    """Backend whose latency and failures are set by the test."""
+
+    def __init__(self, name, latency=0.0, fail=False, fail_startup=False):
+        self.name = name
+        self.latency = latency
+        self.fail = fail
+        self.fail_startup = fail_startup
+        self.calls = 0
+        self.shutdown = AsyncMock()
+
+    async def startup(self):
+        if self.fail_startup:
+            raise RuntimeError(f"{self.name} failed to load")
+
+    async def generate(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return self.name
+
+
+class TestRuntimeFailover:
+    """Live monitoring of the active backend and switching between models."""
+
+    BACKENDS = [
+        ModelBackend.TRANSFORMERS_GPTQ,
+        ModelBackend.TRANSFORMERS_AWQ,
+        ModelBackend.CPU_FALLBACK,
+    ]
+
+    async def make_infra(self, fakes, **kwargs):
+        configs = [
+            ModelConfig(
+                backend=backend,
+                model_name=backend.value,
+                acceleration=AccelerationType.CUDA,
+                priority=priority,
+            )
+            for priority, backend in enumerate(self.BACKENDS[: len(fakes)])
+        ]
+        options = {
+            "cache_benchmarks": False,
+            "failover_min_samples": 2,
+            "failover_cooldown": 0.0,
+            **kwargs,
+        }
+        infra = AdaptiveLLMInfrastructure(preferred_models=configs, **options)
+        infra._build_backend = lambda config: fakes[configs.index(config)]
+        infra._candidates = configs
+        await infra._initialize_backend(configs[0])
+        return infra
+
+    @pytest.mark.asyncio
+    async def test_errors_fail_over_and_retry_request(self):
+        primary, secondary = FakeBackend("primary", fail=True), FakeBackend("second")
+        infra = await self.make_infra([primary, secondary])
+
+        with pytest.raises(RuntimeError, match="primary failed"):
+            await infra.generate("hi")
+        assert await infra.generate("hi") == "second"
+
+        stats = infra.get_failover_stats()
+        assert stats["current_backend"] == ModelBackend.TRANSFORMERS_AWQ.value
+        assert stats["switches"] == 1
+        assert "error rate" in stats["recent_switches"][0]["reason"]
+        primary.shutdown.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_slow_backend_fails_over(self):
+        primary = FakeBackend("primary", latency=0.03)
+        infra = await self.make_infra(
+            [primary, FakeBackend("second")], failover_latency=0.01
+        )
+
+        assert await infra.generate("hi") == "primary"
+        assert await infra.generate("hi") == "primary"
+        assert await infra.generate("hi") == "second"
+        assert (
+            "median latency"
+            in infra.get_failover_stats()["recent_switches"][0]["reason"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_latency_threshold_defaults_to_baseline(self):
+        primary = FakeBackend("primary", latency=0.01)
+        infra = await self.make_infra(
+            [primary, FakeBackend("second")], failover_min_samples=3
+        )
+
+        for _ in range(3):
+            await infra.generate("hi")
+        assert infra.current_backend == ModelBackend.TRANSFORMERS_GPTQ
+        threshold = infra.get_failover_stats()["latency_threshold"]
+        assert threshold == pytest.approx(0.03, abs=0.02)
+
+        primary.latency = 0.1
+        for _ in range(3):
+            await infra.generate("hi")
+        assert infra.current_backend == ModelBackend.TRANSFORMERS_AWQ
+
+    @pytest.mark.asyncio
+    async def test_cooldown_prevents_flapping(self):
+        primary = FakeBackend("primary", fail=True)
+        infra = await self.make_infra(
+            [primary, FakeBackend("second")], failover_cooldown=60.0
+        )
+
+        for _ in range(4):
+            with pytest.raises(RuntimeError):
+                await infra.generate("hi")
+
+        assert infra.current_backend == ModelBackend.TRANSFORMERS_GPTQ
+        assert infra.get_failover_stats()["switches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_preferred_backend_is_retried_after_recovery_interval(self):
+        primary = FakeBackend("primary", fail=True)
+        infra = await self.make_infra(
+            [primary, FakeBackend("second")], recovery_interval=0.0
+        )
+        with pytest.raises(RuntimeError):
+            await infra.generate("hi")
+        assert await infra.generate("hi") == "second"
+
+        primary.fail = False
+        assert await infra.generate("hi") == "primary"
+
+        reasons = [s["reason"] for s in infra.get_failover_stats()["recent_switches"]]
+        assert reasons[-1] == "retrying preferred backend"
+
+    @pytest.mark.asyncio
+    async def test_backend_that_fails_to_start_is_skipped(self):
+        infra = await self.make_infra(
+            [
+                FakeBackend("primary", fail=True),
+                FakeBackend("second", fail_startup=True),
+                FakeBackend("third"),
+            ]
+        )
+        with pytest.raises(RuntimeError):
+            await infra.generate("hi")
+
+        assert await infra.generate("hi") == "third"
+        assert infra.current_backend == ModelBackend.CPU_FALLBACK
+
+    @pytest.mark.asyncio
+    async def test_no_alternative_keeps_current_backend(self):
+        infra = await self.make_infra([FakeBackend("primary", fail=True)])
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError, match="primary failed"):
+                await infra.generate("hi")
+
+        stats = infra.get_failover_stats()
+        assert stats["current_backend"] == ModelBackend.TRANSFORMERS_GPTQ.value
+        assert stats["errors"] == 3
+        assert stats["switches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_time_on_backend_is_tracked(self):
+        infra = await self.make_infra(
+            [FakeBackend("primary", fail=True), FakeBackend("second")]
+        )
+        await asyncio.sleep(0.02)
+        with pytest.raises(RuntimeError):
+            await infra.generate("hi")
+        await infra.generate("hi")
+        await asyncio.sleep(0.02)
+
+        time_on_backend = infra.get_failover_stats()["time_on_backend"]
+        assert time_on_backend[ModelBackend.TRANSFORMERS_GPTQ.value] >= 0.02
+        assert time_on_backend[ModelBackend.TRANSFORMERS_AWQ.value] >= 0.02
+
+    @pytest.mark.asyncio
+    async def test_generate_requires_startup(self):
+        with pytest.raises(RuntimeError, match="not been started"):
+            await AdaptiveLLMInfrastructure(cache_benchmarks=False).generate("hi")
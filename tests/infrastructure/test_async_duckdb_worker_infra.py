@@ -0,0 +1,138 @@
+"""Tests for the worker-thread async DuckDB infrastructure."""
+
+import asyncio
+import threading
+
+import pytest
+
+from entity.infrastructure.async_duckdb_worker_infra import (
+    AsyncDuckDBWorkerInfrastructure,
+)
+from entity.resources.async_database import AsyncDatabaseResource
+from entity.resources.async_memory import AsyncMemory
+from entity.resources.vector_store import VectorStoreResource
+
+SLOW_QUERY = "SELECT count(*) FROM range(10000000000) a"
+
+
+class TestAsyncDuckDBWorkerInfrastructure:
+    """Test suite for AsyncDuckDBWorkerInfrastructure."""
+
+    @pytest.fixture
+    async def infra(self, tmp_path):
+        """Create a started file-backed infrastructure."""
+        infra = AsyncDuckDBWorkerInfrastructure(
+            str(tmp_path / "worker.duckdb"), pool_size=2, query_timeout=5.0
+        )
+        await infra.startup()
+        yield infra
+        await infra.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_execute_and_fetch(self, infra):
+        await infra.execute_async("CREATE TABLE t (id INTEGER, name TEXT)")
+        cursor = await infra.execute_async("INSERT INTO t VALUES (?, ?)", (1, "a"))
+        assert cursor.rowcount == 1
+
+        assert await infra.execute_async("SELECT name FROM t", fetch_one=True) == ("a",)
+        assert await infra.execute_async("SELECT * FROM t", fetch_all=True) == [
+            (1, "a")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_queries_run_off_the_event_loop(self, infra):
+        """Each connection runs on its own worker thread."""
+        loop_thread = threading.get_ident()
+        async with infra.connect() as conn:
+            cursor = await conn.execute("SELECT 1")
+            thread_id = await conn._call(threading.get_ident)
+            assert await cursor.fetchall() == [(1,)]
+
+        assert thread_id != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_unbuffered_cursor_fetchmany(self, infra):
+        async with infra.connect() as conn:
+            cursor = await conn.execute("SELECT * FROM range(5)")
+            assert await cursor.fetchmany(2) == [(0,), (1,)]
+            assert await cursor.fetchall() == [(2,), (3,), (4,)]
+
+    @pytest.mark.asyncio
+    async def test_readers_are_pooled(self, infra):
+        for _ in range(5):
+            await infra.execute_async("SELECT 1", fetch_one=True)
+
+        stats = await infra.get_connection_stats()
+        assert stats["workers_created"] == 2
+        assert stats["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_many_is_atomic(self, infra):
+        await infra.execute_async("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        await infra.execute_many("INSERT INTO t VALUES (?)", [(1,), (2,)])
+        with pytest.raises(Exception):
+            await infra.execute_many("INSERT INTO t VALUES (?)", [(3,), (1,)])
+
+        rows = await infra.execute_async("SELECT id FROM t ORDER BY id", fetch_all=True)
+        assert rows == [(1,), (2,)]
+
+    @pytest.mark.asyncio
+    async def test_execute_script(self, infra):
+        await infra.execute_script(
+            "CREATE TABLE s (x INTEGER); INSERT INTO s VALUES (1), (2);"
+        )
+        assert await infra.execute_async("SELECT sum(x) FROM s", fetch_one=True) == (3,)
+
+    @pytest.mark.asyncio
+    async def test_timeout_interrupts_running_query(self, infra):
+        infra.query_timeout = 0.2
+        with pytest.raises(asyncio.TimeoutError):
+            await infra.execute_async(SLOW_QUERY, fetch_one=True)
+
+        infra.query_timeout = 5.0
+        assert await infra.execute_async("SELECT 1", fetch_one=True) == (1,)
+        stats = await infra.get_connection_stats()
+        assert stats["timeouts"] == 1
+        assert stats["interrupted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_interrupts_running_query(self, infra):
+        task = asyncio.create_task(infra.execute_async(SLOW_QUERY, fetch_one=True))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert await infra.execute_async("SELECT 2", fetch_one=True) == (2,)
+        assert (await infra.get_connection_stats())["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_requires_startup(self):
+        infra = AsyncDuckDBWorkerInfrastructure(":memory:")
+        with pytest.raises(RuntimeError):
+            await infra.execute_async("SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_health_checks(self, infra):
+        assert await infra.health_check() is True
+        assert infra.health_check_sync() is True
+
+    @pytest.mark.asyncio
+    async def test_async_memory_drop_in(self, infra):
+        """AsyncMemory works unchanged on top of the DuckDB worker backend."""
+        db = AsyncDatabaseResource(infra)
+        memory = AsyncMemory(db, VectorStoreResource(infra))
+
+        await memory.store("a", {"x": 1})
+        await memory.store("a", {"x": 2})
+        await memory.batch_store({"b": 1, "c": 2})
+
+        assert await memory.load("a") == {"x": 2}
+        assert sorted(await memory.keys()) == ["a", "b", "c"]
+        assert await memory.batch_load(["b", "c"]) == {"b": 1, "c": 2}
+        assert await memory.delete("b") is True
+        assert await memory.delete("b") is False
+        assert await db.execute_fetch_all("SELECT key FROM memory ORDER BY key") == [
+            ("a",),
+            ("c",),
+        ]
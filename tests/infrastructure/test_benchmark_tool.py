@@ -417,6 +417,7 @@ class TestLLMBenchmarkTool:
                 str(temp_dir),
                 "--suites",
                 "quick_qa",
+                "--rebenchmark",
             ]
 
             mock_infra = Mock(spec=AdaptiveLLMInfrastructure)
@@ -429,7 +430,7 @@ class TestLLMBenchmarkTool:
                 patch(
                     "entity.infrastructure.benchmark_tool.AdaptiveLLMInfrastructure",
                     return_value=mock_infra,
-                ),
+                ) as mock_infra_class,
                 patch(
                     "entity.infrastructure.benchmark_tool.LLMBenchmarkTool"
                 ) as mock_tool_class,
@@ -449,6 +450,9 @@ class TestLLMBenchmarkTool:
                 mock_tool.run_comprehensive_benchmark.assert_called_once_with(
                     mock_infra
                 )
+                mock_infra_class.assert_called_once_with(
+                    benchmark_cache=None, force_benchmark=True
+                )
 
     def test_benchmark_suite_filtering(self):
         """Test benchmark suite filtering by name."""
@@ -0,0 +1,147 @@
+"""Tests for chunked bulk loading."""
+
+import pytest
+
+from entity.infrastructure import async_duckdb_worker_infra
+from entity.infrastructure.async_duckdb_infra import AsyncDuckDBInfrastructure
+from entity.infrastructure.async_duckdb_worker_infra import (
+    AsyncDuckDBWorkerInfrastructure,
+)
+from entity.infrastructure.bulk_load import (
+    AdaptiveChunker,
+    insert_statement,
+    iter_chunks,
+)
+
+
+async def _async_rows(count):
+    for i in range(count):
+        yield (i, f"name_{i}")
+
+
+class TestAdaptiveChunker:
+    """Test suite for chunk sizing and chunk iteration."""
+
+    def test_grows_when_fast_and_shrinks_when_slow(self):
+        chunker = AdaptiveChunker(initial_size=100, target_seconds=1.0, min_size=10)
+        chunker.record(100, 0.1)
+        assert chunker.size == 200
+        chunker.record(200, 5.0)
+        assert chunker.size == 100
+        chunker.record(50, 0.01)
+        assert chunker.size == 100
+
+    def test_respects_bounds(self):
+        chunker = AdaptiveChunker(initial_size=10, min_size=10, max_size=15)
+        chunker.record(10, 0.0)
+        assert chunker.size == 15
+        with pytest.raises(ValueError):
+            AdaptiveChunker(min_size=0)
+
+    @pytest.mark.asyncio
+    async def test_iter_chunks_accepts_sync_and_async_iterables(self):
+        chunker = AdaptiveChunker(initial_size=4, min_size=1)
+        sync_chunks = [c async for c in iter_chunks(((i,) for i in range(10)), chunker)]
+        async_chunks = [c async for c in iter_chunks(_async_rows(10), chunker)]
+
+        assert [len(c) for c in sync_chunks] == [4, 4, 2]
+        assert [len(c) for c in async_chunks] == [4, 4, 2]
+
+    def test_insert_statement_validates_identifiers(self):
+        assert (
+            insert_statement("t", ["a", "b"], 2) == "INSERT INTO t (a, b) VALUES (?, ?)"
+        )
+        with pytest.raises(ValueError):
+            insert_statement("t; DROP TABLE x", None, 1)
+
+
+class TestBulkInsert:
+    """Test suite for bulk_insert on both async backends."""
+
+    @pytest.fixture(params=["aiosqlite", "duckdb_worker"])
+    async def infra(self, request, tmp_path):
+        cls = {
+            "aiosqlite": AsyncDuckDBInfrastructure,
+            "duckdb_worker": AsyncDuckDBWorkerInfrastructure,
+        }[request.param]
+        infra = cls(str(tmp_path / "bulk.db"), query_timeout=5.0)
+        await infra.startup()
+        await infra.execute_async("CREATE TABLE people (id INTEGER, name TEXT)")
+        yield infra
+        await infra.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_streams_async_iterable_with_progress(self, infra):
+        progress = []
+        stats = await infra.bulk_insert(
+            "people",
+            _async_rows(2500),
+            chunker=AdaptiveChunker(initial_size=1000, target_seconds=60.0),
+            on_progress=lambda s: progress.append(s.rows),
+        )
+
+        assert stats.rows == 2500
+        assert progress[-1] == 2500
+        assert stats.chunks == len(progress)
+        assert stats.rows_per_second > 0
+        count = await infra.execute_async("SELECT COUNT(*) FROM people", fetch_one=True)
+        assert count == (2500,)
+
+    @pytest.mark.asyncio
+    async def test_explicit_columns(self, infra):
+        await infra.bulk_insert("people", [("a", 1), ("b", 2)], columns=["name", "id"])
+        rows = await infra.execute_async(
+            "SELECT id, name FROM people ORDER BY id", fetch_all=True
+        )
+        assert [tuple(r) for r in rows] == [(1, "a"), (2, "b")]
+
+    @pytest.mark.asyncio
+    async def test_small_batches_get_the_full_timeout(self, infra):
+        """A two-row execute_many is not limited to a fraction of a second."""
+        infra.query_timeout = 1.0
+        await infra.execute_many(
+            "INSERT INTO people VALUES (?, ?)", [(1, "a"), (2, "b")]
+        )
+        count = await infra.execute_async("SELECT COUNT(*) FROM people", fetch_one=True)
+        assert tuple(count) == (2,)
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, infra):
+        stats = await infra.bulk_insert("people", [])
+        assert stats.rows == 0
+        assert stats.chunks == 0
+
+
+class TestArrowIngest:
+    """Test suite for the Arrow ingest path of the DuckDB worker backend."""
+
+    @pytest.mark.asyncio
+    async def test_uses_arrow_when_available(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        infra = AsyncDuckDBWorkerInfrastructure(str(tmp_path / "arrow.duckdb"))
+        await infra.startup()
+        try:
+            await infra.execute_async("CREATE TABLE t (id INTEGER, score DOUBLE)")
+            stats = await infra.bulk_insert("t", ((i, i / 2) for i in range(5000)))
+            assert stats.method == "arrow"
+            total = await infra.execute_async(
+                "SELECT sum(score) FROM t", fetch_one=True
+            )
+            assert total == (sum(i / 2 for i in range(5000)),)
+        finally:
+            await infra.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_pyarrow(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(async_duckdb_worker_infra, "PYARROW_AVAILABLE", False)
+        infra = AsyncDuckDBWorkerInfrastructure(":memory:")
+        await infra.startup()
+        try:
+            await infra.execute_async("CREATE TABLE t (id INTEGER)")
+            stats = await infra.bulk_insert("t", [(1,), (2,)])
+            assert stats.method == "executemany"
+            assert await infra.execute_async(
+                "SELECT count(*) FROM t", fetch_one=True
+            ) == (2,)
+        finally:
+            await infra.shutdown()
@@ -0,0 +1,144 @@
+"""Tests for the pooled DuckDB infrastructure."""
+
+import threading
+import time
+
+import pytest
+
+from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+
+
+class TestDuckDBInfrastructure:
+    """Test suite for DuckDBInfrastructure connection pooling."""
+
+    @pytest.fixture
+    async def file_infra(self, tmp_path):
+        """Create a file-backed infrastructure with a small pool."""
+        infra = DuckDBInfrastructure(
+            str(tmp_path / "pool.duckdb"), pool_size=2, acquire_timeout=0.2
+        )
+        await infra.startup()
+        yield infra
+        await infra.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_readers_share_writer_database(self, file_infra):
+        """Writes through the writer are visible to pooled readers."""
+        with file_infra.connect(write=True) as conn:
+            conn.execute("CREATE TABLE items (id INTEGER, name TEXT)")
+            conn.execute("INSERT INTO items VALUES (1, 'a')")
+
+        with file_infra.connect() as conn:
+            assert conn.execute("SELECT name FROM items").fetchall() == [("a",)]
+
+    @pytest.mark.asyncio
+    async def test_memory_database_is_shared_across_connections(self):
+        """In-memory databases keep one instance for readers and the writer."""
+        infra = DuckDBInfrastructure(":memory:")
+        with infra.connect(write=True) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.execute("INSERT INTO t VALUES (42)")
+
+        with infra.connect() as first, infra.connect() as second:
+            assert first is not second
+            assert first.execute("SELECT x FROM t").fetchone() == (42,)
+            assert second.execute("SELECT x FROM t").fetchone() == (42,)
+        await infra.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, file_infra):
+        """Released connections go back to the pool instead of being closed."""
+        with file_infra.connect() as first:
+            pass
+        with file_infra.connect() as second:
+            pass
+
+        assert first is second
+        stats = file_infra.get_connection_stats()
+        assert stats["created"] == 1
+        assert stats["acquisitions"] == 2
+        assert stats["idle"] == 1
+        assert stats["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pool_is_bounded_and_times_out(self, file_infra):
+        """Acquiring beyond pool_size waits and then raises TimeoutError."""
+        with file_infra.connect(), file_infra.connect():
+            with pytest.raises(TimeoutError):
+                with file_infra.connect():
+                    pass
+
+        stats = file_infra.get_connection_stats()
+        assert stats["created"] == 2
+        assert stats["waits"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["total_wait_time"] > 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_gets_released_connection(self, file_infra):
+        """A waiting caller is woken when another connection is released."""
+        file_infra.acquire_timeout = 5.0
+        held = file_infra._acquire()
+        other = file_infra._acquire()
+        acquired = []
+
+        def waiter():
+            with file_infra.connect() as conn:
+                acquired.append(conn)
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired
+
+        file_infra._release(held)
+        thread.join(timeout=2)
+        file_infra._release(other)
+
+        assert acquired == [held.conn]
+        assert file_infra.get_connection_stats()["waits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_connection_is_discarded(self, file_infra):
+        """Connections that raised inside the block are not returned to the pool."""
+        with pytest.raises(Exception):
+            with file_infra.connect() as conn:
+                conn.execute("SELECT * FROM missing_table")
+
+        stats = file_infra.get_connection_stats()
+        assert stats["discarded"] == 1
+        assert stats["idle"] == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_are_recycled(self, file_infra):
+        """Connections idle longer than max_idle are replaced on checkout."""
+        file_infra.max_idle = 0.01
+        with file_infra.connect() as first:
+            pass
+        time.sleep(0.05)
+        with file_infra.connect() as second:
+            pass
+
+        assert first is not second
+        assert file_infra.get_connection_stats()["recycled"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_max_lifetime_recycles_on_release(self, file_infra):
+        """Connections older than max_lifetime are closed when released."""
+        file_infra.max_lifetime = 0.01
+        with file_infra.connect():
+            time.sleep(0.05)
+
+        stats = file_infra.get_connection_stats()
+        assert stats["recycled"] == 1
+        assert stats["idle"] == 0
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, file_infra):
+        """Health check opens the database and runs a query."""
+        assert await file_infra.health_check() is True
+
+    def test_invalid_pool_size(self, tmp_path):
+        """A pool must hold at least one connection."""
+        with pytest.raises(ValueError):
+            DuckDBInfrastructure(str(tmp_path / "bad.duckdb"), pool_size=0)
@@ -6,9 +6,12 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from entity.infrastructure.harmony_oss_infra import (
+    ConversationHistory,
     HarmonyChannel,
+    HarmonyDelta,
     HarmonyMessage,
     HarmonyOSSInfrastructure,
+    HarmonyStreamParser,
     ReasoningEffort,
     Role,
 )
@@ -184,19 +187,27 @@ class TestHarmonyOSSInfrastructure:
     @pytest.mark.asyncio
     async def test_health_check_success(self, infra):
         """Test successful health check."""
-        with patch.object(infra, "generate", new_callable=AsyncMock) as mock_gen:
-            mock_gen.return_value = "Test response"
+        with patch.object(infra, "_call_model", new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = "Test response"
 
             result = await infra.health_check()
 
             assert result is True
-            mock_gen.assert_called_once_with("test", "You are a test assistant")
+            mock_call.assert_called_once()
+            assert "test" in mock_call.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_health_check_leaves_history_alone(self, infra):
+        """The probe is not recorded in any conversation."""
+        assert await infra.health_check() is True
+
+        assert len(infra.conversation_history) == 0
 
     @pytest.mark.asyncio
     async def test_health_check_failure(self, infra):
         """Test failed health check."""
-        with patch.object(infra, "generate", new_callable=AsyncMock) as mock_gen:
-            mock_gen.side_effect = Exception("Connection failed")
+        with patch.object(infra, "_call_model", new_callable=AsyncMock) as mock_call:
+            mock_call.side_effect = Exception("Connection failed")
 
             result = await infra.health_check()
 
@@ -240,3 +251,211 @@ class TestHarmonyOSSInfrastructure:
         # Verify order: system > developer > user > assistant > tool
         roles = [json.loads(line)["role"] for line in lines]
         assert roles == ["system", "developer", "user", "assistant", "tool"]
+
+
+class TestConversationHistory:
+    """Bounded, per-conversation history and prompt assembly."""
+
+    def test_trims_oldest_turns_past_message_limit(self):
+        history = ConversationHistory(max_messages=4)
+        for i in range(5):
+            history.append(HarmonyMessage(Role.USER, f"q{i}"))
+            history.append(HarmonyMessage(Role.ASSISTANT, f"a{i}"))
+
+        assert [m.content for m in history] == ["q3", "a3", "q4", "a4"]
+
+    def test_trims_to_token_budget(self):
+        history = ConversationHistory(token_budget=100)
+        for i in range(20):
+            history.append(HarmonyMessage(Role.USER, "x" * 40))
+            history.append(HarmonyMessage(Role.ASSISTANT, "y" * 40))
+
+        assert 0 < history.tokens <= 100
+        assert history[0].role == Role.USER
+
+    def test_never_starts_with_orphaned_reply(self):
+        history = ConversationHistory(max_messages=3)
+        for i in range(3):
+            history.append(HarmonyMessage(Role.USER, f"q{i}"))
+            history.append(HarmonyMessage(Role.ASSISTANT, f"a{i}"))
+
+        assert [m.content for m in history] == ["q2", "a2"]
+
+    def test_serialized_matches_messages_after_trim(self):
+        history = ConversationHistory(max_messages=2)
+        for i in range(3):
+            history.append(HarmonyMessage(Role.USER, f"q{i}"))
+            history.append(HarmonyMessage(Role.ASSISTANT, f"a{i}"))
+
+        assert history.serialized == "\n".join(json.dumps(m.to_dict()) for m in history)
+
+    @pytest.mark.asyncio
+    async def test_history_is_per_conversation(self):
+        infra = HarmonyOSSInfrastructure("model")
+        with patch.object(infra, "_call_model", new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = "<<FINAL>>\nok"
+            await infra.generate("hello from alice", conversation_id="alice")
+            await infra.generate("hello from bob", conversation_id="bob")
+            await infra.generate("again", conversation_id="alice")
+
+            last_prompt = mock_call.call_args[0][0]
+
+        assert "hello from alice" in last_prompt
+        assert "hello from bob" not in last_prompt
+        assert len(infra.get_history("alice")) == 4
+        assert len(infra.get_history("bob")) == 2
+        assert len(infra.conversation_history) == 0
+
+    @pytest.mark.asyncio
+    async def test_prompt_keeps_turn_order_after_instructions(self):
+        infra = HarmonyOSSInfrastructure("model")
+        with patch.object(infra, "_call_model", new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = "<<FINAL>>\nfirst answer"
+            await infra.generate("first question", "Be brief")
+            await infra.generate("second question", "Be brief")
+
+            lines = mock_call.call_args[0][0].split("\n")
+
+        messages = [json.loads(line) for line in lines]
+        assert [m["role"] for m in messages] == [
+            "system",
+            "developer",
+            "user",
+            "assistant",
+            "user",
+        ]
+        assert [m["content"] for m in messages[2:]] == [
+            "first question",
+            "first answer",
+            "second question",
+        ]
+
+    def test_conversations_are_bounded(self):
+        infra = HarmonyOSSInfrastructure("model", max_conversations=2)
+        for name in ["a", "b", "c"]:
+            infra.get_history(name).append(HarmonyMessage(Role.USER, name))
+
+        assert len(infra.get_history("c")) == 1
+        assert len(infra.get_history("a")) == 0
+
+    def test_clear_history(self):
+        infra = HarmonyOSSInfrastructure("model")
+        infra.get_history("a").append(HarmonyMessage(Role.USER, "hi"))
+
+        infra.clear_history("a")
+
+        assert len(infra.get_history("a")) == 0
+
+
+RESPONSE = (
+    "<<ANALYSIS>>\nThe user wants a number.\n\n"
+    "<<COMMENTARY>>\nSimple lookup.\n"
+    "<<FINAL>>\nThe answer << is 42.\n"
+)
+
+
+def _collect(deltas):
+    channels = {}
+    for delta in deltas:
+        channels[delta.channel] = channels.get(delta.channel, "") + delta.text
+    return channels
+
+
+class TestHarmonyStreamParser:
+    """Incremental channel splitting of streamed output."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, len(RESPONSE)])
+    def test_chunk_boundaries_do_not_matter(self, size):
+        parser = HarmonyStreamParser()
+        deltas = []
+        for start in range(0, len(RESPONSE), size):
+            deltas += parser.feed(RESPONSE[start : start + size])
+        deltas += parser.close()
+
+        assert _collect(deltas) == {
+            HarmonyChannel.ANALYSIS: "The user wants a number.",
+            HarmonyChannel.COMMENTARY: "Simple lookup.",
+            HarmonyChannel.FINAL: "The answer << is 42.",
+        }
+
+    def test_emits_deltas_as_chunks_arrive(self):
+        parser = HarmonyStreamParser()
+
+        assert parser.feed("<<FINAL>>\nHello") == [
+            HarmonyDelta(HarmonyChannel.FINAL, "Hello")
+        ]
+        assert parser.feed(" world") == [HarmonyDelta(HarmonyChannel.FINAL, " world")]
+
+    def test_partial_marker_is_held_back(self):
+        parser = HarmonyStreamParser()
+
+        assert parser.feed("<<ANALY") == []
+        assert parser.feed("SIS>>thinking") == [
+            HarmonyDelta(HarmonyChannel.ANALYSIS, "thinking")
+        ]
+
+    def test_unmarked_text_is_final(self):
+        parser = HarmonyStreamParser()
+        deltas = parser.feed("plain reply <<") + parser.close()
+
+        assert _collect(deltas) == {HarmonyChannel.FINAL: "plain reply <<"}
+
+    def test_unsubscribed_channels_are_discarded(self):
+        discarded = []
+        parser = HarmonyStreamParser(["final"], on_discard=discarded.append)
+
+        deltas = parser.feed(RESPONSE) + parser.close()
+
+        assert _collect(deltas) == {HarmonyChannel.FINAL: "The answer << is 42."}
+        assert {delta.channel for delta in discarded} == {
+            HarmonyChannel.ANALYSIS,
+            HarmonyChannel.COMMENTARY,
+        }
+
+
+class TestHarmonyStreaming:
+    """Streaming generation through HarmonyOSSInfrastructure."""
+
+    @pytest.fixture
+    def infra(self):
+        infra = HarmonyOSSInfrastructure("model")
+
+        async def chunks(prompt):
+            for start in range(0, len(RESPONSE), 4):
+                yield RESPONSE[start : start + 4]
+
+        infra._stream_model = chunks
+        return infra
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_only_final_channel(self, infra):
+        chunks = [chunk async for chunk in infra.stream("question")]
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == "The answer << is 42."
+
+    @pytest.mark.asyncio
+    async def test_stream_channels_tags_every_channel(self, infra):
+        deltas = [delta async for delta in infra.stream_channels("question")]
+
+        assert _collect(deltas)[HarmonyChannel.ANALYSIS] == "The user wants a number."
+        assert deltas[0].channel is HarmonyChannel.ANALYSIS
+        assert deltas[-1].channel is HarmonyChannel.FINAL
+
+    @pytest.mark.asyncio
+    async def test_completed_stream_is_added_to_history(self, infra):
+        async for _ in infra.stream("question", conversation_id="c1"):
+            pass
+
+        assert [m.content for m in infra.get_history("c1")] == [
+            "question",
+            "The answer << is 42.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_not_added_to_history(self, infra):
+        stream = infra.stream("question", conversation_id="c1")
+        await anext(stream)
+        await stream.aclose()
+
+        assert len(infra.get_history("c1")) == 0
@@ -0,0 +1,274 @@
+"""Tests for LoadBalancedLLMInfrastructure against local stub servers."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from entity.benchmarks.stub_ollama import StubOllamaServer
+from entity.infrastructure import LoadBalancedLLMInfrastructure
+
+
+@pytest.fixture
+async def servers():
+    stubs = [StubOllamaServer(response=f"from {i}") for i in range(3)]
+    for stub in stubs:
+        await stub.start()
+    yield stubs
+    for stub in stubs:
+        await stub.stop()
+
+
+@pytest.fixture
+async def balancer(servers):
+    infra = LoadBalancedLLMInfrastructure(
+        [s.url for s in servers], "stub", max_failures=2, probe_interval=None
+    )
+    await infra.startup()
+    yield infra
+    await infra.shutdown()
+
+
+class TestRouting:
+    """Least-outstanding and power-of-two-choices selection."""
+
+    async def test_least_outstanding_spreads_concurrent_load(self, servers, balancer):
+        for stub in servers:
+            stub.latency = 0.03
+
+        await asyncio.gather(*(balancer.generate("p") for _ in range(6)))
+
+        assert [stub.requests for stub in servers] == [2, 2, 2]
+
+    async def test_p2c_prefers_faster_endpoint(self, servers):
+        servers[0].latency = 0.0
+        servers[1].latency = 0.05
+        infra = LoadBalancedLLMInfrastructure(
+            [s.url for s in servers[:2]], "stub", strategy="p2c", probe_interval=None
+        )
+        await infra.startup()
+        infra.endpoints[0].latency = 0.001
+        infra.endpoints[1].latency = 0.05
+        try:
+            results = [await infra.generate("p") for _ in range(10)]
+        finally:
+            await infra.shutdown()
+
+        assert results.count("from 0") == 10
+
+    async def test_stream_routes_and_tracks_outstanding(self, servers, balancer):
+        servers[0].response = "a b"
+        balancer.endpoints[1].outstanding = 5
+        balancer.endpoints[2].outstanding = 5
+
+        chunks = [chunk async for chunk in balancer.stream("p")]
+
+        assert chunks == ["a ", "b"]
+        assert balancer.endpoints[0].outstanding == 0
+        assert balancer.endpoints[0].latency is not None
+
+    def test_rejects_bad_configuration(self):
+        with pytest.raises(ValueError):
+            LoadBalancedLLMInfrastructure([])
+        with pytest.raises(ValueError):
+            LoadBalancedLLMInfrastructure(["http://a"], "m", strategy="random")
+        with pytest.raises(ValueError):
+            LoadBalancedLLMInfrastructure(["http://a"])
+
+    def test_model_defaults_to_endpoint_models(self, servers):
+        from entity.infrastructure import OllamaInfrastructure
+
+        infra = LoadBalancedLLMInfrastructure(
+            [OllamaInfrastructure(s.url, "small") for s in servers[:2]]
+            + [OllamaInfrastructure(servers[2].url, "large")],
+            probe_interval=None,
+        )
+
+        assert infra.model == "large+small"
+
+
+class TestOutlierEjection:
+    """Passive ejection and background re-probing."""
+
+    async def test_failing_endpoint_is_ejected_and_retried_elsewhere(
+        self, servers, balancer
+    ):
+        servers[1].status = 500
+
+        results = [await balancer.generate("p") for _ in range(40)]
+
+        assert "from 1" not in results
+        stats = {s["endpoint"]: s for s in balancer.get_endpoint_stats()}
+        assert stats[servers[1].url]["available"] is False
+        assert stats[servers[1].url]["ejections"] == 1
+        # Once ejected it receives no further traffic.
+        assert servers[1].requests == 2
+
+    async def test_slow_responses_count_as_failures(self, servers):
+        servers[0].latency = 0.05
+        infra = LoadBalancedLLMInfrastructure(
+            [servers[0].url, servers[1].url],
+            "stub",
+            max_failures=1,
+            slow_threshold=0.02,
+            probe_interval=None,
+            strategy="least_outstanding",
+        )
+        await infra.startup()
+        try:
+            for _ in range(6):
+                await infra.generate("p")
+        finally:
+            await infra.shutdown()
+
+        assert infra.endpoints[0].available(time.monotonic()) is False
+        assert servers[0].requests <= 1
+
+    async def test_all_endpoints_failing_raises(self, servers):
+        for stub in servers:
+            stub.status = 503
+        infra = LoadBalancedLLMInfrastructure(
+            [s.url for s in servers], "stub", probe_interval=None, max_attempts=3
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await infra.generate("p")
+        await infra.shutdown()
+
+        assert sum(stub.requests for stub in servers) == 3
+
+    async def test_background_probe_restores_endpoint(self, servers):
+        infra = LoadBalancedLLMInfrastructure(
+            [s.url for s in servers[:2]],
+            "stub",
+            max_failures=1,
+            ejection_time=60.0,
+            probe_interval=0.02,
+        )
+        await infra.startup()
+        try:
+            servers[0].status = 500
+            infra._record(infra.endpoints[0], 0.0, failed=True)
+            assert not infra.endpoints[0].available(time.monotonic())
+
+            servers[0].status = 200
+            for _ in range(50):
+                if infra.endpoints[0].available(time.monotonic()):
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await infra.shutdown()
+
+        assert infra.endpoints[0].available(time.monotonic())
+        assert infra.endpoints[0].consecutive_failures == 0
+
+    async def test_probe_keeps_dead_endpoint_ejected(self, servers):
+        url = servers[2].url
+        await servers[2].stop()
+        infra = LoadBalancedLLMInfrastructure(
+            [servers[0].url, url], "stub", max_failures=2, probe_interval=None
+        )
+
+        assert await infra.health_check() is True
+        assert [s["available"] for s in infra.get_endpoint_stats()] == [True, True]
+        assert await infra.health_check() is True
+        assert [s["available"] for s in infra.get_endpoint_stats()] == [True, False]
+        await infra.shutdown()
+
+    async def test_successful_probe_resets_failure_count(self):
+        class Flaky:
+            model = "stub"
+            healthy = [False, True, False]
+
+            async def health_check(self):
+                return self.healthy.pop(0)
+
+        infra = LoadBalancedLLMInfrastructure(
+            [Flaky()], max_failures=2, probe_interval=None
+        )
+        for _ in range(3):
+            await infra.health_check()
+
+        assert infra.endpoints[0].available(time.monotonic())
+        assert infra.endpoints[0].consecutive_failures == 1
+
+
+class TestHedging:
+    """Duplicate slow requests to a second endpoint."""
+
+    @pytest.fixture
+    async def hedged(self, servers):
+        servers[0].latency = 0.3
+        servers[0].response = "slow"
+        servers[1].response = "fast"
+        infra = LoadBalancedLLMInfrastructure(
+            [s.url for s in servers[:2]],
+            "stub",
+            probe_interval=None,
+            hedge_percentile=90,
+            hedge_min_samples=5,
+            hedge_budget=0.5,
+        )
+        infra._latencies.extend([0.02] * 10)
+        infra._ttfts.extend([0.02] * 10)
+        infra._hedge_metrics["requests"] = 10
+        # Make the slow endpoint the primary choice.
+        infra.endpoints[1].outstanding = 1
+        await infra.startup()
+        yield infra
+        infra.endpoints[1].outstanding -= 1
+        await infra.shutdown()
+
+    async def test_slow_request_hedged_to_other_endpoint(self, hedged):
+        start = time.perf_counter()
+        result = await hedged.generate("p")
+
+        assert result == "fast"
+        assert time.perf_counter() - start < 0.25
+        stats = hedged.get_hedge_stats()
+        assert (stats["hedged"], stats["hedge_wins"]) == (1, 1)
+        assert stats["generate_delay"] == pytest.approx(0.02)
+        # The losing request was cancelled and released its slot.
+        assert hedged.endpoints[0].outstanding == 0
+        # Both calls are sampled, the cancelled one at its elapsed time.
+        assert len(hedged._latencies) == 12
+        assert max(hedged._latencies) > 0.02
+
+    async def test_fast_primary_is_not_hedged(self, servers, hedged):
+        servers[0].latency = 0
+
+        assert await hedged.generate("p") == "slow"
+        assert hedged.get_hedge_stats()["hedged"] == 0
+
+    async def test_budget_caps_hedges(self, hedged):
+        hedged.hedge_budget = 0.0
+
+        assert await hedged.generate("p") == "slow"
+        stats = hedged.get_hedge_stats()
+        assert (stats["hedged"], stats["budget_exhausted"]) == (0, 1)
+
+    async def test_no_hedging_before_enough_samples(self, hedged):
+        hedged._latencies.clear()
+
+        assert await hedged.generate("p") == "slow"
+        assert hedged.get_hedge_stats()["generate_delay"] is None
+
+    async def test_stream_hedged_on_first_chunk(self, servers, hedged):
+        servers[1].response = "fast stream"
+
+        chunks = [chunk async for chunk in hedged.stream("p")]
+
+        assert chunks == ["fast ", "stream"]
+        assert hedged.get_hedge_stats()["hedge_wins"] == 1
+        for _ in range(50):
+            if servers[0].disconnects:
+                break
+            await asyncio.sleep(0.01)
+        assert servers[0].disconnects == 1
+        assert hedged.endpoints[0].outstanding == 0
+        assert len(hedged._ttfts) == 12
+        assert max(hedged._ttfts) > 0.02
+
+    def test_rejects_bad_percentile(self):
+        with pytest.raises(ValueError):
+            LoadBalancedLLMInfrastructure(["http://a"], "m", hedge_percentile=100)
@@ -0,0 +1,168 @@
+"""Tests for the in-process NumPy vector index."""
+
+import numpy as np
+import pytest
+
+from entity.infrastructure import NumPyVectorInfrastructure, VectorIndexInfrastructure
+from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+from entity.resources import VectorStoreResource
+
+
+def _populate(store: VectorStoreResource) -> None:
+    store.add_vector("docs", [1.0, 0.0, 0.0], id="a", metadata={"src": "mail"})
+    store.add_vector(
+        "docs", [0.0, 2.0, 0.0], id="b", metadata={"src": "web"}, user_id="u1"
+    )
+    store.add_vector("docs", [0.9, 0.1, 0.0], id="c", metadata={"src": "web"})
+
+
+class TestNumPyVectorInfrastructure:
+    """Matrix-based top-k search and memory-mapped persistence."""
+
+    @pytest.fixture
+    def infra(self):
+        return NumPyVectorInfrastructure()
+
+    def test_implements_vector_index_protocol(self, infra):
+        assert isinstance(infra, VectorIndexInfrastructure)
+        assert not isinstance(
+            DuckDBInfrastructure(":memory:"), VectorIndexInfrastructure
+        )
+
+    def test_batched_search_matches_brute_force(self, infra):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(500, 16)).astype(np.float32)
+        queries = rng.normal(size=(8, 16)).astype(np.float32)
+        ids = [f"v{i}" for i in range(500)]
+        infra.upsert_vectors("emb", ids, vectors, [None] * 500, [None] * 500)
+
+        results = infra.search_vectors("emb", queries, k=5)
+
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        for query, found in zip(queries, results):
+            expected = np.argsort(-(unit @ query))[:5]
+            assert [r[0] for r in found] == [ids[i] for i in expected]
+
+    @pytest.mark.parametrize("metric", ["cosine", "l2", "ip"])
+    def test_metrics_match_duckdb(self, metric):
+        numpy_store = VectorStoreResource(NumPyVectorInfrastructure())
+        duckdb_store = VectorStoreResource(DuckDBInfrastructure(":memory:"))
+        _populate(numpy_store)
+        _populate(duckdb_store)
+
+        query = [0.5, 0.7, 0.1]
+        expected = duckdb_store.search("docs", query, k=3, metric=metric)
+        actual = numpy_store.search("docs", query, k=3, metric=metric)
+
+        assert [r.id for r in actual] == [r.id for r in expected]
+        for a, e in zip(actual, expected):
+            assert a.distance == pytest.approx(e.distance, abs=1e-5)
+
+    def test_resource_metadata_filter_and_upsert(self):
+        store = VectorStoreResource(NumPyVectorInfrastructure())
+        _populate(store)
+
+        results = store.search("docs", [1.0, 0.0, 0.0], k=3, filter={"src": "web"})
+        assert [r.id for r in results] == ["c", "b"]
+        assert results[1].user_id == "u1"
+
+        store.add_vector("docs", [0.0, 0.0, 1.0], id="a")
+        assert store.search("docs", [0.0, 0.0, 1.0], k=1)[0].id == "a"
+        assert store.create_index("docs") is False
+
+    def test_search_batch_returns_one_list_per_query(self):
+        store = VectorStoreResource(NumPyVectorInfrastructure())
+        _populate(store)
+
+        results = store.search_batch("docs", [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], k=1)
+
+        assert [[r.id for r in found] for found in results] == [["a"], ["b"]]
+
+    def test_resource_add_vectors(self):
+        store = VectorStoreResource(NumPyVectorInfrastructure())
+        ids = store.add_vectors(
+            "docs", np.eye(3, dtype=np.float32), metadata=[{"n": i} for i in range(3)]
+        )
+
+        result = store.search("docs", [0.0, 1.0, 0.0], k=1)[0]
+        assert (result.id, result.metadata) == (ids[1], {"n": 1})
+
+    def test_dimension_mismatch(self, infra):
+        infra.create_table("emb", 3)
+        with pytest.raises(ValueError):
+            infra.upsert_vectors("emb", ["x"], [[1.0, 2.0]], [None], [None])
+        with pytest.raises(ValueError):
+            infra.search_vectors("emb", [[1.0, 2.0]], k=1)
+        with pytest.raises(ValueError):
+            infra.search_vectors("missing", [[1.0, 2.0, 3.0]], k=1)
+
+    def test_sql_queries_are_rejected(self, infra):
+        with pytest.raises(RuntimeError):
+            VectorStoreResource(infra).query("SELECT 1")
+
+    async def test_persists_to_memory_mapped_files(self, tmp_path):
+        infra = NumPyVectorInfrastructure(str(tmp_path))
+        await infra.startup()
+        store = VectorStoreResource(infra)
+        _populate(store)
+        await infra.shutdown()
+
+        assert (tmp_path / "docs.npy").exists()
+        reopened = NumPyVectorInfrastructure(str(tmp_path))
+        store = VectorStoreResource(reopened)
+        results = store.search("docs", [0.0, 1.0, 0.0], k=1)
+        assert results[0].id == "b"
+        assert results[0].metadata == {"src": "web"}
+        assert isinstance(reopened._tables["docs"].matrix, np.memmap)
+
+        store.add_vector("docs", [0.0, 0.0, 1.0], id="d")
+        reopened.flush()
+        again = VectorStoreResource(NumPyVectorInfrastructure(str(tmp_path)))
+        assert again.search("docs", [0.0, 0.0, 1.0], k=1)[0].id == "d"
+        assert len(again.search("docs", [0.0, 0.0, 1.0], k=10)) == 4
+
+
+class TestUserPartitions:
+    """Per-user row partitions in the NumPy index."""
+
+    def test_select_only_returns_user_rows(self):
+        infra = NumPyVectorInfrastructure()
+        infra.upsert_vectors(
+            "emb",
+            ["a", "b", "c"],
+            np.eye(3, dtype=np.float32),
+            [{"x": 1}, {"x": 2}, {"x": 1}],
+            ["u1", "u2", "u1"],
+        )
+        table = infra._tables["emb"]
+
+        assert table.select("u1", None).tolist() == [0, 2]
+        assert table.select("u1", {"x": 2}).tolist() == []
+        assert table.select(None, {"x": 2}).tolist() == [1]
+        assert table.select(None, None) is None
+
+    def test_partitions_rebuilt_after_reload(self, tmp_path):
+        infra = NumPyVectorInfrastructure(str(tmp_path))
+        infra.upsert_vectors(
+            "emb", ["a", "b"], np.eye(2, dtype=np.float32), [None, None], ["u1", "u2"]
+        )
+        infra.flush()
+
+        reopened = NumPyVectorInfrastructure(str(tmp_path))
+        found = reopened.search_vectors("emb", [[1.0, 0.0]], k=2, user_id="u2")
+
+        assert [m[0] for m in found[0]] == ["b"]
+
+    def test_quantized_search_scoped_to_user(self):
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(2000, 16)).astype(np.float32)
+        users = ["u1" if i % 10 else "u2" for i in range(2000)]
+        infra = NumPyVectorInfrastructure(quantization="int8", quantize_min_rows=100)
+        infra.upsert_vectors(
+            "emb", [str(i) for i in range(2000)], vectors, [None] * 2000, users
+        )
+
+        found = infra.search_vectors("emb", vectors[:3], k=10, user_id="u2")
+
+        assert all(len(matches) == 10 for matches in found)
+        assert all(m[3] == "u2" for matches in found for m in matches)
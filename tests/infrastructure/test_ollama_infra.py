@@ -0,0 +1,259 @@
+"""Tests for OllamaInfrastructure's pooled HTTP client."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from entity.benchmarks.stub_ollama import StubOllamaServer
+from entity.infrastructure.ollama_infra import OllamaInfrastructure
+
+
+@pytest.fixture
+async def server():
+    async with StubOllamaServer(response="hello") as stub:
+        yield stub
+
+
+@pytest.fixture
+def threaded_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture
+def threaded_server(threaded_loop):
+    stub = StubOllamaServer(response="hello")
+    asyncio.run_coroutine_threadsafe(stub.__aenter__(), threaded_loop).result(5)
+    yield stub
+    asyncio.run_coroutine_threadsafe(
+        stub.__aexit__(None, None, None), threaded_loop
+    ).result(5)
+
+
+class TestPooledClient:
+    """One keep-alive client owned by the infrastructure lifecycle."""
+
+    async def test_generate_reuses_connection(self, server):
+        infra = OllamaInfrastructure(server.url, "stub")
+        await infra.startup()
+        try:
+            results = [await infra.generate(f"p{i}") for i in range(5)]
+        finally:
+            await infra.shutdown()
+
+        assert results == ["hello"] * 5
+        assert server.connections == 1
+        assert server.payloads[0] == {"model": "stub", "prompt": "p0", "stream": False}
+
+    async def test_concurrent_requests_respect_connection_limit(self, server):
+        server.latency = 0.02
+        infra = OllamaInfrastructure(server.url, "stub", max_connections=2)
+        await infra.startup()
+        try:
+            await asyncio.gather(*(infra.generate("p") for _ in range(8)))
+        finally:
+            await infra.shutdown()
+
+        assert server.requests == 8
+        assert server.connections == 2
+
+    async def test_shutdown_closes_client(self, server):
+        infra = OllamaInfrastructure(server.url, "stub")
+        await infra.startup()
+        client = infra._client
+
+        await infra.shutdown()
+
+        assert client.is_closed
+        assert infra._client is None
+
+    async def test_generate_without_startup_creates_client(self, server):
+        infra = OllamaInfrastructure(server.url, "stub")
+
+        assert await infra.generate("p") == "hello"
+        assert infra._client is not None
+        await infra.shutdown()
+
+    async def test_health_check_uses_pool_after_startup(self, server):
+        infra = OllamaInfrastructure(server.url, "stub")
+        assert await infra.health_check() is True
+        assert infra._client is None
+
+        await infra.startup()
+        await infra.health_check()
+        await infra.generate("p")
+        await infra.shutdown()
+        assert server.connections == 2
+
+    def test_limits_and_timeouts_configurable(self):
+        infra = OllamaInfrastructure(
+            "http://localhost:11434/",
+            "model",
+            max_connections=4,
+            max_keepalive_connections=2,
+            keepalive_expiry=10.0,
+            timeout=30.0,
+            connect_timeout=1.0,
+        )
+
+        assert infra.base_url == "http://localhost:11434"
+        assert infra.limits == httpx.Limits(
+            max_connections=4, max_keepalive_connections=2, keepalive_expiry=10.0
+        )
+        assert infra.timeout.read == 30.0
+        assert infra.timeout.connect == 1.0
+
+
+class TestEventLoops:
+    """Clients never outlive or leak across the loop that opened them."""
+
+    def test_client_is_closed_when_its_loop_finishes(self, threaded_server):
+        infra = OllamaInfrastructure(threaded_server.url, "stub")
+
+        async def use():
+            assert await infra.generate("p") == "hello"
+            return infra._client
+
+        first = asyncio.run(use())
+        assert first.is_closed
+
+        second = asyncio.run(use())
+        assert second is not first
+        asyncio.run(infra.shutdown())
+        assert second.is_closed
+
+    def test_client_of_a_running_loop_is_closed_on_that_loop(
+        self, threaded_server, threaded_loop
+    ):
+        infra = OllamaInfrastructure(threaded_server.url, "stub")
+        asyncio.run_coroutine_threadsafe(infra.startup(), threaded_loop).result(5)
+        first = infra._client
+
+        async def use():
+            result = await infra.generate("p")
+            await asyncio.to_thread(
+                lambda: asyncio.run_coroutine_threadsafe(
+                    asyncio.sleep(0), threaded_loop
+                ).result(5)
+            )
+            await infra.shutdown()
+            return result
+
+        assert asyncio.run(use()) == "hello"
+        assert first.is_closed
+
+    def test_rejects_client_of_an_idle_loop(self, threaded_server):
+        infra = OllamaInfrastructure(threaded_server.url, "stub")
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(infra.startup())
+
+            with pytest.raises(RuntimeError, match="another event loop"):
+                asyncio.run(infra.generate("p"))
+
+            loop.run_until_complete(infra.shutdown())
+        finally:
+            loop.close()
+
+
+class TestStreaming:
+    """Incremental NDJSON streaming with latency metrics."""
+
+    async def test_stream_yields_chunks_incrementally(self, server):
+        server.response = "one two three"
+        server.token_delay = 0.05
+        infra = OllamaInfrastructure(server.url, "stub")
+        await infra.startup()
+        loop = asyncio.get_running_loop()
+        arrivals = []
+        try:
+            chunks = []
+            async for chunk in infra.stream("p"):
+                chunks.append(chunk)
+                arrivals.append(loop.time())
+        finally:
+            await infra.shutdown()
+
+        assert chunks == ["one ", "two ", "three"]
+        assert arrivals[-1] - arrivals[0] >= 0.08
+        assert server.payloads[0]["stream"] is True
+
+    async def test_stream_records_ttft_and_inter_token_latency(self, server):
+        server.latency = 0.05
+        server.token_delay = 0.02
+        server.response = "a b c d"
+        infra = OllamaInfrastructure(server.url, "stub")
+        await infra.startup()
+        try:
+            assert "".join([chunk async for chunk in infra.stream("p")]) == "a b c d"
+        finally:
+            await infra.shutdown()
+
+        stats = infra.get_stream_stats()
+        assert stats["streams"] == stats["completed"] == 1
+        assert stats["chunks"] == 4
+        assert stats["average_ttft"] >= 0.04
+        assert 0.01 <= stats["average_inter_token"] < stats["average_ttft"]
+        assert stats["max_inter_token"] >= stats["average_inter_token"]
+
+    async def test_closing_stream_early_closes_upstream(self, server):
+        server.response = " ".join(["tok"] * 50)
+        server.token_delay = 0.01
+        infra = OllamaInfrastructure(server.url, "stub")
+        await infra.startup()
+        try:
+            stream = infra.stream("p")
+            assert await anext(stream) == "tok "
+            await stream.aclose()
+            for _ in range(50):
+                if server.disconnects:
+                    break
+                await asyncio.sleep(0.01)
+            assert server.disconnects == 1
+            assert infra.get_stream_stats()["cancelled"] == 1
+            # The pool recovers with a fresh connection.
+            assert await infra.generate("again") == server.response
+        finally:
+            await infra.shutdown()
+
+    async def test_cancelling_consumer_task_closes_upstream(self, server):
+        server.response = " ".join(["tok"] * 50)
+        server.token_delay = 0.01
+        infra = OllamaInfrastructure(server.url, "stub")
+        await infra.startup()
+
+        async def consume():
+            async for _ in infra.stream("p"):
+                pass
+
+        try:
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            for _ in range(50):
+                if server.disconnects:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await infra.shutdown()
+
+        assert server.disconnects == 1
+        assert infra.get_stream_stats()["cancelled"] == 1
+
+    async def test_stream_http_error_is_counted(self, server):
+        infra = OllamaInfrastructure(server.url + "/missing", "stub")
+        with pytest.raises(httpx.HTTPStatusError):
+            async for _ in infra.stream("p"):
+                pass
+        await infra.shutdown()
+
+        assert infra.get_stream_stats()["errors"] == 1
@@ -0,0 +1,177 @@
+"""Tests for vector quantizers and quantized NumPy search."""
+
+import numpy as np
+import pytest
+
+from entity.infrastructure.numpy_vector_infra import NumPyVectorInfrastructure
+from entity.infrastructure.quantization import (
+    ProductQuantizer,
+    ScalarQuantizer,
+    make_quantizer,
+)
+
+
+@pytest.fixture
+def clustered():
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(32, 64))
+    labels = rng.integers(0, 32, 3000)
+    vectors = centers[labels] + rng.normal(scale=0.3, size=(3000, 64))
+    queries = centers[rng.integers(0, 32, 20)] + rng.normal(scale=0.3, size=(20, 64))
+    return vectors.astype(np.float32), queries.astype(np.float32)
+
+
+class TestQuantizers:
+    """Encoding and approximate inner products."""
+
+    def test_scalar_round_trip(self, clustered):
+        vectors, _ = clustered
+        quantizer = ScalarQuantizer().fit(vectors)
+
+        codes = quantizer.encode(vectors)
+
+        assert codes.dtype == np.int8
+        assert codes.shape == vectors.shape
+        error = np.abs(quantizer.decode(codes) - vectors).max(axis=0)
+        assert np.all(error <= quantizer.scale / 2 + 1e-5)
+
+    @pytest.mark.parametrize("quantizer", [ScalarQuantizer(), ProductQuantizer(8)])
+    def test_inner_products_match_decoded_vectors(self, clustered, quantizer):
+        vectors, queries = clustered
+        quantizer.fit(vectors)
+        codes = quantizer.encode(vectors)
+
+        approx = quantizer.inner_products(queries, codes)
+
+        expected = queries @ quantizer.decode(codes).T
+        np.testing.assert_allclose(approx, expected, rtol=1e-3, atol=1e-2)
+
+    def test_product_quantizer_code_size(self, clustered):
+        vectors, _ = clustered
+        quantizer = ProductQuantizer(subspaces=16).fit(vectors)
+
+        codes = quantizer.encode(vectors)
+
+        assert codes.dtype == np.uint8
+        assert codes.shape == (len(vectors), 16)
+
+    def test_make_quantizer(self):
+        assert make_quantizer(None) is None
+        assert isinstance(make_quantizer("int8"), ScalarQuantizer)
+        assert make_quantizer("pq", subspaces=4).subspaces == 4
+        with pytest.raises(ValueError):
+            make_quantizer("binary")
+
+
+class TestQuantizedSearch:
+    """Quantized candidates re-ranked with exact distances."""
+
+    def _search(self, vectors, queries, **options):
+        infra = NumPyVectorInfrastructure(quantize_min_rows=100, **options)
+        ids = [str(i) for i in range(len(vectors))]
+        infra.upsert_vectors("emb", ids, vectors, [None] * len(ids), [None] * len(ids))
+        return infra, infra.search_vectors("emb", queries, k=10)
+
+    @pytest.mark.parametrize("quantization", ["int8", "pq"])
+    def test_recall_and_exact_distances(self, clustered, quantization):
+        vectors, queries = clustered
+        _, exact = self._search(vectors, queries)
+        infra, approx = self._search(vectors, queries, quantization=quantization)
+
+        hits = sum(
+            len({m[0] for m in a} & {m[0] for m in e}) for a, e in zip(approx, exact)
+        )
+        assert hits / (10 * len(queries)) >= 0.9
+        # Re-ranked distances are exact, not approximations.
+        for found, expected in zip(approx, exact):
+            lookup = {m[0]: m[1] for m in expected}
+            for vector_id, distance, _, _ in found:
+                if vector_id in lookup:
+                    assert distance == pytest.approx(lookup[vector_id], abs=1e-5)
+
+        stats = infra.get_table_stats("emb")
+        assert stats["quantized"] is True
+        assert stats["code_bytes"] < stats["vector_bytes"]
+
+    def test_small_tables_are_searched_exactly(self, clustered):
+        vectors, queries = clustered
+        infra = NumPyVectorInfrastructure(quantization="int8")
+        ids = [str(i) for i in range(100)]
+        infra.upsert_vectors("emb", ids, vectors[:100], [None] * 100, [None] * 100)
+        infra.search_vectors("emb", queries, k=10)
+
+        assert infra.get_table_stats("emb")["quantized"] is False
+
+    def test_rows_added_after_training_are_encoded(self, clustered):
+        vectors, queries = clustered
+        infra, _ = self._search(vectors, queries, quantization="int8")
+
+        infra.upsert_vectors("emb", ["new"], queries[:1], [{"n": 1}], [None])
+
+        assert infra.search_vectors("emb", queries[:1], k=1)[0][0][0] == "new"
+
+    def test_filter_applies_before_shortlisting(self, clustered):
+        vectors, queries = clustered
+        infra = NumPyVectorInfrastructure(quantization="pq", quantize_min_rows=100)
+        ids = [str(i) for i in range(len(vectors))]
+        metadata = [{"even": i % 2 == 0} for i in range(len(vectors))]
+        infra.upsert_vectors("emb", ids, vectors, metadata, [None] * len(ids))
+
+        results = infra.search_vectors("emb", queries, k=5, filter={"even": True})
+
+        assert all(len(found) == 5 for found in results)
+        assert all(int(m[0]) % 2 == 0 for found in results for m in found)
+
+    def test_stats_do_not_train(self, clustered):
+        vectors, _ = clustered
+        infra = NumPyVectorInfrastructure(quantization="int8", quantize_min_rows=100)
+        ids = [str(i) for i in range(len(vectors))]
+        infra.upsert_vectors("emb", ids, vectors, [None] * len(ids), [None] * len(ids))
+
+        stats = infra.get_table_stats("emb")
+
+        assert stats["quantized"] is False
+        assert stats["code_bytes"] == 0
+        assert infra._tables["emb"].quantizer is None
+
+    def test_rows_stay_in_memory_until_quantized(self, clustered):
+        vectors, queries = clustered
+        infra = NumPyVectorInfrastructure(quantization="int8", quantize_min_rows=100)
+        infra.upsert_vectors("emb", ["a", "b"], vectors[:2], [None] * 2, [None] * 2)
+        infra.search_vectors("emb", queries[:1], k=1)
+
+        stats = infra.get_table_stats("emb")
+        assert stats["quantized"] is False
+        assert stats["vectors_in_memory"] is True
+        assert infra._tables["emb"].spill_path.exists() is False
+
+    def test_only_codes_are_held_in_memory(self, clustered):
+        vectors, queries = clustered
+        infra, _ = self._search(vectors, queries, quantization="int8")
+
+        stats = infra.get_table_stats("emb")
+        assert stats["vectors_in_memory"] is False
+        assert stats["resident_bytes"] < stats["vector_bytes"]
+
+    def test_reopened_table_stays_memory_mapped(self, clustered, tmp_path):
+        vectors, queries = clustered
+        infra, expected = self._search(
+            vectors, queries, quantization="int8", storage_path=str(tmp_path)
+        )
+        infra.flush()
+
+        reopened = NumPyVectorInfrastructure(
+            str(tmp_path), quantization="int8", quantize_min_rows=100
+        )
+        found = reopened.search_vectors("emb", queries[1:], k=10)
+        reopened.upsert_vectors("emb", ["new"], queries[:1], [None], [None])
+
+        assert isinstance(reopened._tables["emb"].matrix, np.memmap)
+        assert [[m[0] for m in r] for r in found] == [
+            [m[0] for m in r] for r in expected[1:]
+        ]
+        assert reopened.search_vectors("emb", queries[:1], k=1)[0][0][0] == "new"
+
+    def test_unknown_quantization_rejected(self):
+        with pytest.raises(ValueError):
+            NumPyVectorInfrastructure(quantization="binary")
@@ -0,0 +1,154 @@
+"""Tests for token counting and backend-reported usage."""
+
+import threading
+
+import pytest
+
+from entity.infrastructure import token_counter
+
+from entity.benchmarks.stub_ollama import StubOllamaServer
+from entity.infrastructure import (
+    EstimatingTokenCounter,
+    LoadBalancedLLMInfrastructure,
+    OllamaInfrastructure,
+    TokenCounter,
+    TokenUsage,
+    default_token_counter,
+)
+from entity.infrastructure.token_counter import (
+    _DefaultTokenCounter,
+    count_usage,
+    usage_from_ollama,
+)
+
+TEXT = "Tokenizers split uncommon words like 'reparametrization' into pieces."
+
+
+class TestEstimatingTokenCounter:
+    """Character-based estimate used when no tokenizer is installed."""
+
+    def test_counts_more_than_words(self):
+        counter = EstimatingTokenCounter()
+
+        assert counter.count(TEXT) > len(TEXT.split())
+        assert counter.count("") == 0
+
+    def test_never_below_one_token_per_word(self):
+        assert EstimatingTokenCounter().count("a b c d e f") == 6
+
+    def test_rejects_invalid_ratio(self):
+        with pytest.raises(ValueError):
+            EstimatingTokenCounter(chars_per_token=0)
+
+    def test_default_counter_is_shared(self):
+        counter = default_token_counter()
+
+        assert isinstance(counter, TokenCounter)
+        assert default_token_counter() is counter
+
+
+class TestDefaultTokenCounter:
+    """The tokenizer is never loaded on the event loop."""
+
+    @pytest.fixture
+    def loads(self, monkeypatch):
+        threads = []
+
+        class ExactCounter:
+            def __init__(self, encoding):
+                threads.append(threading.current_thread())
+
+            def count(self, text):
+                return 42
+
+        monkeypatch.setattr(token_counter, "TiktokenTokenCounter", ExactCounter)
+        return threads
+
+    def test_loads_synchronously_off_the_loop(self, loads):
+        counter = _DefaultTokenCounter()
+
+        assert counter.count(TEXT) == 42
+        assert loads == [threading.current_thread()]
+
+    async def test_estimates_on_the_loop_while_loading_in_a_thread(self, loads):
+        counter = _DefaultTokenCounter()
+
+        assert counter.count(TEXT) == EstimatingTokenCounter().count(TEXT)
+        await counter._loading
+
+        assert counter.count(TEXT) == 42
+        assert len(loads) == 1
+        assert loads[0] is not threading.current_thread()
+
+    def test_falls_back_when_the_encoding_cannot_load(self, monkeypatch):
+        def unavailable(encoding):
+            raise OSError("no network")
+
+        monkeypatch.setattr(token_counter, "TiktokenTokenCounter", unavailable)
+
+        counter = _DefaultTokenCounter()
+
+        assert counter.load() is counter.fallback
+        assert counter.count(TEXT) == EstimatingTokenCounter().count(TEXT)
+
+
+class TestUsage:
+    """Exact counts from the backend with estimated fallbacks."""
+
+    def test_ollama_counts_are_exact(self):
+        usage = usage_from_ollama(
+            {"prompt_eval_count": 12, "eval_count": 34}, "prompt", "completion"
+        )
+
+        assert usage == TokenUsage(12, 34, exact=True)
+        assert usage.total_tokens == 46
+
+    def test_missing_prompt_count_is_estimated(self):
+        counter = EstimatingTokenCounter()
+
+        usage = usage_from_ollama({"eval_count": 5}, TEXT, "done", counter)
+
+        assert usage == TokenUsage(counter.count(TEXT), 5, exact=False)
+
+    def test_count_usage(self):
+        counter = EstimatingTokenCounter()
+
+        usage = count_usage("hello there", TEXT, counter)
+
+        assert usage == TokenUsage(counter.count("hello there"), counter.count(TEXT))
+
+    async def test_ollama_generate_with_usage(self):
+        async with StubOllamaServer(response="one two three") as server:
+            infra = OllamaInfrastructure(server.url, "stub")
+            try:
+                text, usage = await infra.generate_with_usage("count these words")
+            finally:
+                await infra.shutdown()
+
+        assert text == "one two three"
+        assert usage == TokenUsage(3, 3, exact=True)
+
+    async def test_ollama_stream_with_usage(self):
+        async with StubOllamaServer(response="one two three") as server:
+            infra = OllamaInfrastructure(server.url, "stub")
+            try:
+                items = [item async for item in infra.stream_with_usage("count these")]
+                chunks = [chunk async for chunk in infra.stream("count these")]
+            finally:
+                await infra.shutdown()
+
+        assert "".join(items[:-1]) == "".join(chunks) == "one two three"
+        assert items[-1] == TokenUsage(2, 3, exact=True)
+
+    async def test_load_balancer_passes_usage_through(self):
+        async with StubOllamaServer(response="one two") as server:
+            infra = LoadBalancedLLMInfrastructure(
+                [server.url], "stub", probe_interval=None
+            )
+            await infra.startup()
+            try:
+                text, usage = await infra.generate_with_usage("hi")
+            finally:
+                await infra.shutdown()
+
+        assert (text, usage) == ("one two", TokenUsage(1, 2, exact=True))
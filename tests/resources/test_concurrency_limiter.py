@@ -0,0 +1,211 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from entity.resources import (
+    LLM,
+    AdaptiveConcurrencyLimiter,
+    LimitAlgorithm,
+    LLMResource,
+)
+
+
+class TrackingInfra:
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.order = []
+
+    async def generate(self, prompt):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.order.append(prompt)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return prompt
+
+    def health_check_sync(self):
+        return True
+
+
+async def _hold(limiter, seconds, priority=0):
+    async with limiter.acquire(priority):
+        await asyncio.sleep(seconds)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Admission, queueing and limit adjustment."""
+
+    async def test_in_flight_bounded_by_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        tasks = [asyncio.create_task(_hold(limiter, 0.03)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+
+        assert limiter.in_flight == 2
+        assert limiter.queue_depth == 3
+        await asyncio.gather(*tasks)
+        stats = limiter.get_stats()
+        assert (stats["in_flight"], stats["queue_depth"]) == (0, 0)
+        assert (stats["admitted"], stats["queued"], stats["max_queue_depth"]) == (
+            5,
+            3,
+            3,
+        )
+
+    async def test_queued_callers_admitted_by_priority(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        order = []
+
+        async def job(name, priority):
+            async with limiter.acquire(priority):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        first = asyncio.create_task(job("first", 0))
+        await asyncio.sleep(0)
+        others = [
+            asyncio.create_task(job(name, priority))
+            for name, priority in [("low", 5), ("high", -1), ("mid", 0), ("mid2", 0)]
+        ]
+        await asyncio.gather(first, *others)
+
+        assert order == ["first", "high", "mid", "mid2", "low"]
+
+    async def test_aimd_backs_off_on_errors_and_slow_calls(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=10,
+            algorithm="aimd",
+            latency_threshold=0.01,
+            backoff_ratio=0.5,
+        )
+
+        with pytest.raises(RuntimeError):
+            async with limiter.acquire():
+                raise RuntimeError("backend overloaded")
+        assert limiter.limit == 5
+
+        await _hold(limiter, 0.02)
+        assert limiter.limit == 2
+        assert limiter.get_stats()["dropped"] == 2
+
+    async def test_aimd_grows_while_saturated(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=2, max_limit=4, algorithm="aimd"
+        )
+
+        for _ in range(10):
+            await asyncio.gather(_hold(limiter, 0), _hold(limiter, 0))
+
+        assert limiter.limit == 4
+
+    async def test_aimd_does_not_grow_when_idle(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, algorithm="aimd")
+
+        for _ in range(20):
+            await _hold(limiter, 0)
+
+        assert limiter.limit == 4
+
+    async def test_gradient_shrinks_when_latency_rises(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=16, algorithm="gradient", smoothing=0.5
+        )
+        limiter._update(0.01, False)
+        before = limiter._limit
+
+        for _ in range(5):
+            limiter._in_flight = 16
+            limiter._update(0.05, False)
+
+        assert limiter.algorithm is LimitAlgorithm.GRADIENT
+        assert limiter._limit < before
+        assert limiter.get_stats()["baseline_latency"] < 0.05
+
+    async def test_default_shrinks_on_rising_latency(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, smoothing=0.5)
+        limiter._update(0.01, False)
+
+        for _ in range(5):
+            limiter._in_flight = 16
+            limiter._update(0.05, False)
+
+        assert limiter.algorithm is LimitAlgorithm.GRADIENT
+        assert limiter.limit < 16
+
+    async def test_gradient_grows_when_latency_flat(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=4, max_limit=32, algorithm=LimitAlgorithm.GRADIENT
+        )
+
+        for _ in range(20):
+            limiter._in_flight = limiter.limit
+            limiter._update(0.01, False)
+
+        assert limiter.limit > 4
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        holder = asyncio.create_task(_hold(limiter, 0.03))
+        waiter = asyncio.create_task(_hold(limiter, 0))
+        await asyncio.sleep(0.01)
+
+        waiter.cancel()
+        await asyncio.sleep(0)
+
+        assert limiter.queue_depth == 0
+        await holder
+        assert limiter.in_flight == 0
+        assert limiter.limit == 1
+
+    async def test_queue_limit_rejects(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1, max_queue=1)
+        holder = asyncio.create_task(_hold(limiter, 0.03))
+        queued = asyncio.create_task(_hold(limiter, 0))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(RuntimeError):
+            await _hold(limiter, 0)
+        await asyncio.gather(holder, queued)
+        assert limiter.get_stats()["rejected"] == 1
+
+    def test_validates_limits(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=4)
+
+
+class TestLimitedLLMResource:
+    """The limiter in front of LLM infrastructure calls."""
+
+    async def test_generate_respects_limit_and_priority(self):
+        infra = TrackingInfra()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        llm = LLM(LLMResource(infra, limiter=limiter))
+
+        first = asyncio.create_task(llm.generate("first"))
+        await asyncio.sleep(0)
+        rest = [
+            asyncio.create_task(llm.generate("batch", priority=10)),
+            asyncio.create_task(llm.generate("interactive", priority=0)),
+        ]
+        await asyncio.gather(first, *rest)
+
+        assert infra.peak == 1
+        assert infra.order == ["first", "interactive", "batch"]
+
+    async def test_stream_holds_slot_until_done(self):
+        infra = TrackingInfra(delay=0)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        resource = LLMResource(infra, limiter=limiter)
+
+        stream = resource.stream("p")
+        assert await anext(stream) == "p"
+        assert limiter.in_flight == 1
+        await stream.aclose()
+
+        assert limiter.in_flight == 0
+        assert limiter.get_stats()["dropped"] == 0
@@ -0,0 +1,79 @@
+"""Tests for DatabaseResource query execution and fetch modes."""
+
+import threading
+
+import pytest
+
+from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+from entity.resources.database import DatabaseResource, _is_read_only
+
+
+@pytest.fixture
+def database(tmp_path):
+    infra = DuckDBInfrastructure(str(tmp_path / "fetch.duckdb"), pool_size=2)
+    db = DatabaseResource(infra)
+    db.execute("CREATE TABLE scores (id INTEGER, name TEXT, score DOUBLE)")
+    db.execute("INSERT INTO scores VALUES (1, 'a', 0.5), (2, 'b', 1.5), (3, 'c', 2.5)")
+    return db
+
+
+class TestDatabaseResource:
+    """Test suite for DatabaseResource fetch helpers."""
+
+    def test_fetch_one(self, database):
+        assert database.fetch_one("SELECT name FROM scores WHERE id = ?", 2) == ("b",)
+        assert database.fetch_one("SELECT name FROM scores WHERE id = ?", 99) is None
+
+    def test_fetch_all(self, database):
+        rows = database.fetch_all("SELECT id, name FROM scores ORDER BY id")
+        assert rows == [(1, "a"), (2, "b"), (3, "c")]
+
+    def test_fetch_arrow(self, database):
+        pytest.importorskip("pyarrow")
+        table = database.fetch_arrow(
+            "SELECT id, score FROM scores WHERE score > ? ORDER BY id", 1.0
+        )
+        assert table.num_rows == 2
+        assert table.column("id").to_pylist() == [2, 3]
+
+    def test_fetch_numpy(self, database):
+        np = pytest.importorskip("numpy")
+        columns = database.fetch_numpy("SELECT id, score FROM scores ORDER BY id")
+        assert set(columns) == {"id", "score"}
+        np.testing.assert_allclose(columns["score"], [0.5, 1.5, 2.5])
+
+    def test_fetch_materializes_inside_connection_scope(self, database):
+        """Rows survive another caller reusing the same pooled connection."""
+        rows = database.fetch_all("SELECT id FROM scores ORDER BY id")
+        database.fetch_all("SELECT 42")
+        assert rows == [(1,), (2,), (3,)]
+        assert database.infrastructure.get_connection_stats()["in_use"] == 0
+
+    def test_concurrent_fetches(self, database):
+        results = []
+
+        def worker():
+            for _ in range(20):
+                results.append(database.fetch_one("SELECT COUNT(*) FROM scores")[0])
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [3] * 80
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("SELECT 1", True),
+            ("  with t AS (SELECT 1) SELECT * FROM t", True),
+            ("(SELECT 1)", True),
+            ("INSERT INTO scores VALUES (4, 'd', 0)", False),
+            ("CREATE TABLE x (y INTEGER)", False),
+            ("", False),
+        ],
+    )
+    def test_read_only_detection(self, query, expected):
+        assert _is_read_only(query) is expected
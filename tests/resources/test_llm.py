@@ -0,0 +1,223 @@
+"""Tests for LLMResource and the LLM wrapper."""
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from entity.infrastructure.adaptive_llm_infra import (
+    AccelerationType,
+    AdaptiveLLMInfrastructure,
+    ModelBackend,
+    ModelConfig,
+)
+from entity.infrastructure.harmony_oss_infra import HarmonyOSSInfrastructure
+from entity.resources import LLM, LLMResource
+
+
+class StreamingInfra:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    async def generate(self, prompt):
+        return "".join(self.chunks)
+
+    async def stream(self, prompt):
+        try:
+            for chunk in self.chunks:
+                await asyncio.sleep(0)
+                yield chunk
+        finally:
+            self.closed = True
+
+    def health_check_sync(self):
+        return True
+
+
+class GenerateOnlyInfra:
+    async def generate(self, prompt):
+        return f"echo {prompt}"
+
+    def health_check_sync(self):
+        return True
+
+
+class TestStreaming:
+    """``stream()`` through the resource and wrapper layers."""
+
+    async def test_stream_passes_chunks_through(self):
+        llm = LLM(LLMResource(StreamingInfra(["a", "b", "c"])))
+
+        assert [chunk async for chunk in llm.stream("p")] == ["a", "b", "c"]
+
+    async def test_stream_falls_back_to_generate(self):
+        llm = LLM(LLMResource(GenerateOnlyInfra()))
+
+        assert [chunk async for chunk in llm.stream("hi")] == ["echo hi"]
+
+    async def test_closing_wrapper_closes_infrastructure_stream(self):
+        infra = StreamingInfra(["a", "b", "c"])
+        llm = LLM(LLMResource(infra))
+
+        async with aclosing(llm.stream("p")) as chunks:
+            async for chunk in chunks:
+                break
+
+        assert chunk == "a"
+        assert infra.closed is True
+
+
+class SlowInfra:
+    def __init__(self, delay=0.05, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, prompt):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return f"{prompt}!"
+
+    def health_check_sync(self):
+        return True
+
+
+class TestSingleFlight:
+    """Identical in-flight prompts share one upstream call."""
+
+    async def test_concurrent_identical_prompts_share_a_call(self):
+        infra = SlowInfra()
+        resource = LLMResource(infra)
+
+        results = await asyncio.gather(
+            *(resource.generate("daily summary") for _ in range(5)),
+            resource.generate("other"),
+        )
+
+        assert results == ["daily summary!"] * 5 + ["other!"]
+        assert infra.calls == 2
+        stats = resource.get_stats()
+        assert stats == {
+            "requests": 6,
+            "upstream_calls": 2,
+            "coalesced": 4,
+            "in_flight": 0,
+        }
+
+    async def test_sequential_calls_are_not_coalesced(self):
+        infra = SlowInfra(delay=0)
+        resource = LLMResource(infra)
+
+        await resource.generate("p")
+        await resource.generate("p")
+
+        assert infra.calls == 2
+
+    async def test_exception_is_shared(self):
+        infra = SlowInfra(error=RuntimeError("model crashed"))
+        resource = LLMResource(infra)
+
+        results = await asyncio.gather(
+            *(resource.generate("p") for _ in range(3)), return_exceptions=True
+        )
+
+        assert infra.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        infra = SlowInfra()
+        resource = LLMResource(infra)
+        first = asyncio.create_task(resource.generate("p"))
+        second = asyncio.create_task(resource.generate("p"))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+
+        assert await second == "p!"
+        assert first.cancelled()
+        assert infra.cancelled == 0
+
+    async def test_upstream_cancelled_when_every_caller_leaves(self):
+        infra = SlowInfra()
+        resource = LLMResource(infra)
+        task = asyncio.create_task(resource.generate("p"))
+        await asyncio.sleep(0.01)
+
+        task.cancel()
+        await asyncio.sleep(0.01)
+
+        assert infra.cancelled == 1
+        assert resource.get_stats()["in_flight"] == 0
+
+    async def test_coalescing_can_be_disabled(self):
+        infra = SlowInfra()
+        resource = LLMResource(infra, coalesce=False)
+
+        await asyncio.gather(*(resource.generate("p") for _ in range(3)))
+
+        assert infra.calls == 3
+
+    async def test_different_sampling_settings_are_not_shared(self):
+        infra = SlowInfra()
+        infra.temperature = 0.0
+        resource = LLMResource(infra)
+        cold = asyncio.create_task(resource.generate("p"))
+        await asyncio.sleep(0)
+        infra.temperature = 0.9
+        hot = asyncio.create_task(resource.generate("p"))
+
+        await asyncio.gather(cold, hot)
+
+        assert infra.calls == 2
+
+    async def test_stateful_infrastructure_is_not_coalesced(self):
+        infra = SlowInfra()
+        infra.stateful = True
+        resource = LLMResource(infra)
+
+        await asyncio.gather(*(resource.generate("p") for _ in range(3)))
+
+        assert resource.coalesce is False
+        assert infra.calls == 3
+
+    def test_harmony_infrastructure_is_not_coalesced(self):
+        resource = LLMResource(HarmonyOSSInfrastructure(model_path="test-model"))
+
+        assert resource.coalesce is False
+
+    async def test_stateful_backend_behind_adaptive_is_not_coalesced(self):
+        adaptive = AdaptiveLLMInfrastructure(cache_benchmarks=False)
+        resource = LLMResource(adaptive)
+        backend = SlowInfra()
+        adaptive.active_infrastructure = backend
+
+        await asyncio.gather(*(resource.generate("p") for _ in range(2)))
+        assert backend.calls == 1
+
+        backend.stateful = True
+        await asyncio.gather(*(resource.generate("p") for _ in range(2)))
+        assert backend.calls == 3
+
+    async def test_calls_on_different_active_backends_are_not_shared(self):
+        first = ModelConfig(ModelBackend.TRANSFORMERS_GPTQ, "m", AccelerationType.CUDA)
+        second = ModelConfig(ModelBackend.CPU_FALLBACK, "m", AccelerationType.CPU_ONLY)
+        adaptive = AdaptiveLLMInfrastructure([first, second], cache_benchmarks=False)
+        resource = LLMResource(adaptive)
+        old, new = SlowInfra(), SlowInfra()
+
+        adaptive.current_config, adaptive.active_infrastructure = first, old
+        pending = asyncio.create_task(resource.generate("p"))
+        while not old.calls:
+            await asyncio.sleep(0)
+        adaptive.current_config, adaptive.active_infrastructure = second, new
+        await asyncio.gather(pending, resource.generate("p"))
+
+        assert (old.calls, new.calls) == (1, 1)
@@ -0,0 +1,226 @@
+"""Tests for the two-tier LLM response cache."""
+
+import threading
+import time
+
+import pytest
+
+from entity.infrastructure.adaptive_llm_infra import (
+    AccelerationType,
+    AdaptiveLLMInfrastructure,
+    ModelBackend,
+    ModelConfig,
+)
+from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+from entity.infrastructure.harmony_oss_infra import HarmonyOSSInfrastructure
+from entity.resources import LLM, DatabaseResource, LLMResource, LLMResponseCache
+
+
+class CountingInfra:
+    model = "m1"
+    temperature = 0.2
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt):
+        self.calls += 1
+        return f"answer {self.calls}"
+
+    def health_check_sync(self):
+        return True
+
+
+class ThreadRecordingDatabase(DatabaseResource):
+    """Records which thread runs each query."""
+
+    def __init__(self, infrastructure):
+        super().__init__(infrastructure)
+        self.threads = []
+
+    def execute(self, query, *params):
+        self.threads.append(threading.get_ident())
+        return super().execute(query, *params)
+
+    def fetch_one(self, query, *params):
+        self.threads.append(threading.get_ident())
+        return super().fetch_one(query, *params)
+
+
+@pytest.fixture
+def database():
+    return DatabaseResource(DuckDBInfrastructure(":memory:"))
+
+
+class TestLLMResponseCache:
+    """Keys, expiry, eviction and the persistent tier."""
+
+    def test_exact_and_normalized_hits(self):
+        cache = LLMResponseCache()
+        cache.put("m", "Summarize  this\n", "ok")
+
+        assert cache.get("m", "Summarize  this\n") == "ok"
+        assert cache.get("m", "  Summarize this") == "ok"
+        assert cache.get("m", "summarize this") is None
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["normalized_hits"], stats["misses"]) == (2, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_model_and_params_are_part_of_the_key(self):
+        cache = LLMResponseCache()
+        cache.put("m", "p", "cold", {"temperature": 0.0})
+
+        assert cache.get("m", "p", {"temperature": 0.0}) == "cold"
+        assert cache.get("m", "p", {"temperature": 0.9}) is None
+        assert cache.get("other", "p", {"temperature": 0.0}) is None
+
+    def test_normalization_can_be_disabled(self):
+        cache = LLMResponseCache(normalize=None)
+        cache.put("m", "a  b", "ok")
+
+        assert cache.get("m", "a b") is None
+
+    def test_entries_expire(self):
+        cache = LLMResponseCache(ttl=0.05)
+        cache.put("m", "p", "ok")
+
+        time.sleep(0.06)
+
+        assert cache.get("m", "p") is None
+        assert cache.get_stats()["memory_entries"] == 0
+
+    def test_memory_tier_is_lru_bounded(self):
+        cache = LLMResponseCache(max_entries=2)
+        cache.put("m", "a", "1")
+        cache.put("m", "b", "2")
+        cache.get("m", "a")
+        cache.put("m", "c", "3")
+
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "a") == "1"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_persistent_tier_survives_new_cache(self, database):
+        LLMResponseCache(database).put("m", "p  q", "stored")
+
+        cache = LLMResponseCache(database)
+
+        assert cache.get("m", "p q") == "stored"
+        assert cache.get("m", "p  q") == "stored"
+        stats = cache.get_stats()
+        assert (stats["persistent_hits"], stats["memory_hits"]) == (1, 1)
+
+    def test_persistent_tier_respects_ttl_and_size(self, database):
+        cache = LLMResponseCache(database, ttl=0.05, max_persistent_entries=3)
+        for i in range(5):
+            cache.put("m", f"p{i}", str(i))
+        count = "SELECT COUNT(*) FROM llm_response_cache"
+        assert database.fetch_one(count)[0] == 3
+
+        time.sleep(0.06)
+        cache.prune()
+
+        assert database.fetch_one(count)[0] == 0
+        assert LLMResponseCache(database).get("m", "p4") is None
+
+    def test_rejects_bad_table_name(self):
+        with pytest.raises(ValueError):
+            LLMResponseCache(table="cache; DROP TABLE x")
+
+
+class TestCachedGenerate:
+    """``LLM.generate`` consults the cache unless told not to."""
+
+    async def test_repeated_prompt_served_from_cache(self, database):
+        infra = CountingInfra()
+        llm = LLM(LLMResource(infra), cache=LLMResponseCache(database))
+
+        assert await llm.generate("classify: spam?") == "answer 1"
+        assert await llm.generate("classify:  spam?") == "answer 1"
+        assert infra.calls == 1
+
+    async def test_persistent_tier_runs_off_the_event_loop(self):
+        database = ThreadRecordingDatabase(DuckDBInfrastructure(":memory:"))
+        cache = LLMResponseCache(database)
+        assert database.threads == []
+        llm = LLM(LLMResource(CountingInfra()), cache=cache)
+
+        await llm.generate("p")
+        await llm.generate("p")
+
+        assert database.threads
+        assert threading.get_ident() not in database.threads
+        assert cache.get_stats()["memory_hits"] == 1
+
+    async def test_backend_switch_misses_the_cache(self):
+        first = ModelConfig(ModelBackend.TRANSFORMERS_GPTQ, "m", AccelerationType.CUDA)
+        second = ModelConfig(ModelBackend.CPU_FALLBACK, "m", AccelerationType.CPU_ONLY)
+        infra = AdaptiveLLMInfrastructure([first, second], cache_benchmarks=False)
+        infra.current_config, infra.active_infrastructure = first, CountingInfra()
+        llm = LLM(LLMResource(infra), cache=LLMResponseCache())
+
+        assert await llm.generate("p") == "answer 1"
+        infra.current_config, infra.active_infrastructure = second, CountingInfra()
+
+        assert await llm.generate("p") == "answer 1"
+        assert llm.cache.get_stats()["misses"] == 2
+
+    async def test_per_call_opt_out(self):
+        infra = CountingInfra()
+        cache = LLMResponseCache()
+        llm = LLM(LLMResource(infra), cache=cache)
+
+        await llm.generate("p")
+        assert await llm.generate("p", cache=False) == "answer 2"
+        assert cache.get_stats()["bypassed"] == 1
+
+    async def test_stateful_infrastructure_bypasses_cache(self):
+        infra = CountingInfra()
+        infra.stateful = True
+        cache = LLMResponseCache()
+        llm = LLM(LLMResource(infra), cache=cache)
+
+        assert await llm.generate("p") == "answer 1"
+        assert await llm.generate("p") == "answer 2"
+        assert cache.get_stats()["bypassed"] == 2
+
+    async def test_harmony_replies_follow_the_conversation(self):
+        infra = HarmonyOSSInfrastructure(model_path="test-model")
+        llm = LLM(LLMResource(infra), cache=LLMResponseCache())
+
+        await llm.generate("p")
+        await llm.generate("p")
+
+        assert len(infra.conversation_history) == 4
+
+    async def test_harmony_behind_adaptive_bypasses_cache(self):
+        infra = AdaptiveLLMInfrastructure(cache_benchmarks=False)
+        harmony = HarmonyOSSInfrastructure(model_path="test-model")
+        infra.active_infrastructure = harmony
+        llm = LLM(LLMResource(infra), cache=LLMResponseCache())
+
+        await llm.generate("p")
+        await llm.generate("p")
+
+        assert infra.stateful is True
+        assert len(harmony.conversation_history) == 4
+
+    async def test_sampling_parameters_change_the_key(self):
+        infra = CountingInfra()
+        llm = LLM(LLMResource(infra), cache=LLMResponseCache())
+
+        await llm.generate("p")
+        infra.temperature = 0.9
+        await llm.generate("p")
+
+        assert infra.calls == 2
+
+    async def test_no_cache_by_default(self):
+        infra = CountingInfra()
+        llm = LLM(LLMResource(infra))
+
+        await llm.generate("p")
+        await llm.generate("p")
+
+        assert infra.calls == 2
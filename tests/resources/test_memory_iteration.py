@@ -0,0 +1,107 @@
+"""Tests for paged key and item iteration in memory resources."""
+
+import pytest
+
+from entity.infrastructure.async_duckdb_infra import AsyncDuckDBInfrastructure
+from entity.infrastructure.async_duckdb_worker_infra import (
+    AsyncDuckDBWorkerInfrastructure,
+)
+from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+from entity.resources.async_database import AsyncDatabaseResource
+from entity.resources.async_memory import AsyncMemory
+from entity.resources.database import DatabaseResource
+from entity.resources.memory_components import BaseMemory
+from entity.resources.memory_decorators import MonitoringDecorator
+from entity.resources.vector_store import VectorStoreResource
+
+
+class TestAsyncMemoryIteration:
+    """Test suite for AsyncMemory.iter_keys and iter_items."""
+
+    @pytest.fixture(params=["aiosqlite", "duckdb_worker"])
+    async def memory(self, request, tmp_path):
+        cls = {
+            "aiosqlite": AsyncDuckDBInfrastructure,
+            "duckdb_worker": AsyncDuckDBWorkerInfrastructure,
+        }[request.param]
+        infra = cls(str(tmp_path / "iter.db"))
+        await infra.startup()
+        memory = AsyncMemory(AsyncDatabaseResource(infra), VectorStoreResource(infra))
+        await memory.batch_store({f"k{i:03d}": i for i in range(25)})
+        await memory.batch_store({"alice:a": 1, "alice:b": 2, "alice_x:c": 3})
+        yield memory
+        await infra.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_iter_keys_pages_through_everything(self, memory):
+        keys = [key async for key in memory.iter_keys("k%", page_size=4)]
+        assert keys == [f"k{i:03d}" for i in range(25)]
+
+    @pytest.mark.asyncio
+    async def test_iter_items(self, memory):
+        items = [item async for item in memory.iter_items("k00%", page_size=3)]
+        assert items == [(f"k00{i}", i) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_user_scope_strips_prefix(self, memory):
+        assert [k async for k in memory.iter_keys(user_id="alice")] == ["a", "b"]
+        assert await memory.keys("b", user_id="alice") == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_keys_built_on_iterator(self, memory):
+        assert len(await memory.keys()) == 28
+
+    @pytest.mark.asyncio
+    async def test_batch_load_pages_large_key_lists(self, memory):
+        keys = [f"k{i:03d}" for i in range(25)] + [f"missing{i}" for i in range(1200)]
+        loaded = await memory.batch_load(keys)
+        assert loaded == {f"k{i:03d}": i for i in range(25)}
+
+    @pytest.mark.asyncio
+    async def test_invalid_page_size(self, memory):
+        with pytest.raises(ValueError):
+            [k async for k in memory.iter_keys(page_size=0)]
+
+
+class TestBaseMemoryIteration:
+    """Test suite for BaseMemory keyset pagination."""
+
+    @pytest.fixture
+    async def memory(self):
+        infra = DuckDBInfrastructure(":memory:")
+        memory = BaseMemory(DatabaseResource(infra), VectorStoreResource(infra))
+        for i in range(7):
+            await memory.store(f"item{i}", {"n": i}, user_id="u1")
+        await memory.store("other", 1, user_id="u2")
+        return memory
+
+    @pytest.mark.asyncio
+    async def test_iter_keys_for_user(self, memory):
+        keys = [k async for k in memory.iter_keys(user_id="u1", page_size=2)]
+        assert keys == [f"item{i}" for i in range(7)]
+
+    @pytest.mark.asyncio
+    async def test_iter_items_with_pattern(self, memory):
+        items = [
+            item
+            async for item in memory.iter_items("item[0-2]", user_id="u1", page_size=2)
+        ]
+        assert items == [(f"item{i}", {"n": i}) for i in range(3)]
+
+    @pytest.mark.asyncio
+    async def test_decorators_forward_iteration(self, memory):
+        decorated = MonitoringDecorator(memory)
+        assert [k async for k in decorated.iter_keys(user_id="u2")] == ["other"]
+        assert await decorated.keys(user_id="u1") == [f"item{i}" for i in range(7)]
+
+    @pytest.mark.asyncio
+    async def test_reads_and_deletes_on_real_database(self, memory):
+        assert await memory.load("item3", user_id="u1") == {"n": 3}
+        assert await memory.load("missing", "default") == "default"
+        assert await memory.exists("other", user_id="u2")
+        assert await memory.size(user_id="u1") == 7
+
+        assert await memory.delete("item0", user_id="u1") is True
+        assert await memory.delete("item0", user_id="u1") is False
+        assert await memory.clear("item[1-2]", user_id="u1") == 2
+        assert await memory.size() == 5
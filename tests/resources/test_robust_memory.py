@@ -414,9 +414,7 @@ class TestRobustMemory:
                 with patch(
                     "asyncio.to_thread", new_callable=AsyncMock
                 ) as mock_to_thread:
-                    mock_to_thread.return_value = Mock(
-                        fetchone=Mock(return_value="result")
-                    )
+                    mock_to_thread.return_value = ("result",)
 
                     result = await robust_memory._execute_with_locks(
                         "SELECT * FROM test", "param1", fetch_one=True
@@ -424,7 +422,18 @@ class TestRobustMemory:
 
                     # Should have acquired lock
                     mock_acquire.assert_called_once()
-                    assert result == "result"
+                    mock_to_thread.assert_awaited_once_with(
+                        robust_memory.database.fetch_one, "SELECT * FROM test", "param1"
+                    )
+                    assert result == ("result",)
+
+    @pytest.mark.asyncio
+    async def test_store_and_load_round_trip(self, robust_memory):
+        """Stored values load back through a real DuckDB database."""
+        await robust_memory.store("answer", {"value": 42})
+
+        assert await robust_memory.load("answer") == {"value": 42}
+        assert await robust_memory.load("missing", "default") == "default"
 
     def test_get_lock_metrics(self, robust_memory):
         """Test lock metrics retrieval."""
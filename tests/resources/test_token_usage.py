@@ -0,0 +1,176 @@
+"""Tests for per-user and per-plugin token accounting."""
+
+import asyncio
+
+from entity.infrastructure import EstimatingTokenCounter, TokenUsage
+from entity.plugins.base import Plugin
+from entity.plugins.context import PluginContext
+from entity.resources import LLM, LLMResource, TokenUsageRecorder, token_attribution
+
+
+class ReportingInfra:
+    """Infrastructure that reports exact token counts."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def generate(self, prompt):
+        return (await self.generate_with_usage(prompt))[0]
+
+    async def generate_with_usage(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return "answer", TokenUsage(10, 20, exact=True)
+
+    def health_check_sync(self):
+        return True
+
+
+class PlainInfra:
+    async def generate(self, prompt):
+        return "a plain answer of several words"
+
+    async def stream(self, prompt):
+        for chunk in ["a plain ", "answer"]:
+            yield chunk
+
+    def health_check_sync(self):
+        return True
+
+
+class TestTokenUsageRecorder:
+    """Aggregation by user and plugin."""
+
+    def test_records_against_current_attribution(self):
+        recorder = TokenUsageRecorder()
+
+        with token_attribution("alice", "Summarizer"):
+            recorder.record(TokenUsage(10, 20, exact=True), duration=2.0)
+        recorder.record(TokenUsage(1, 2))
+
+        stats = recorder.get_stats()
+        assert stats["prompt_tokens"] == 11
+        assert stats["completion_tokens"] == 22
+        assert stats["exact_calls"] == 1
+        assert stats["by_user"]["alice"]["total_tokens"] == 30
+        assert stats["by_user"]["alice"]["completion_tokens_per_second"] == 10.0
+        assert stats["by_plugin"]["Summarizer"]["calls"] == 1
+        assert stats["by_user"]["unattributed"]["calls"] == 1
+
+    def test_explicit_ids_override_attribution(self):
+        recorder = TokenUsageRecorder()
+
+        with token_attribution("alice", "Summarizer"):
+            recorder.record(TokenUsage(1, 1), user_id="bob")
+
+        assert list(recorder.get_stats()["by_user"]) == ["bob"]
+        assert list(recorder.get_stats()["by_plugin"]) == ["Summarizer"]
+
+
+class TestLLMResourceUsage:
+    """Every upstream generation is recorded once."""
+
+    async def test_reported_counts_are_used(self):
+        resource = LLMResource(ReportingInfra())
+
+        with token_attribution("alice", "Chat"):
+            await LLM(resource).generate("question")
+
+        stats = resource.usage.get_stats()
+        assert (stats["prompt_tokens"], stats["completion_tokens"]) == (10, 20)
+        assert stats["exact_calls"] == 1
+        assert stats["by_plugin"]["Chat"]["calls"] == 1
+
+    async def test_counts_are_estimated_without_backend_counts(self):
+        counter = EstimatingTokenCounter()
+        resource = LLMResource(PlainInfra(), token_counter=counter)
+
+        await resource.generate("a question")
+
+        stats = resource.usage.get_stats()
+        assert stats["completion_tokens"] == counter.count(
+            "a plain answer of several words"
+        )
+        assert stats["exact_calls"] == 0
+
+    async def test_coalesced_requests_are_charged_once(self):
+        infra = ReportingInfra(latency=0.02)
+        resource = LLMResource(infra)
+
+        await asyncio.gather(*(resource.generate("same") for _ in range(3)))
+
+        assert infra.calls == 1
+        assert resource.usage.get_stats()["calls"] == 1
+
+    async def test_coalesced_tokens_go_to_the_starting_caller(self):
+        resource = LLMResource(ReportingInfra(latency=0.02))
+
+        async def ask(user):
+            with token_attribution(user):
+                return await resource.generate("same")
+
+        await asyncio.gather(ask("alice"), ask("bob"))
+
+        by_user = resource.usage.get_stats()["by_user"]
+        assert by_user["alice"]["total_tokens"] == 30
+        assert "bob" not in by_user
+
+    async def test_streams_are_recorded(self):
+        counter = EstimatingTokenCounter()
+        resource = LLMResource(PlainInfra(), token_counter=counter)
+
+        with token_attribution("carol"):
+            chunks = [chunk async for chunk in resource.stream("q")]
+
+        stats = resource.usage.get_stats()
+        assert "".join(chunks) == "a plain answer"
+        assert stats["by_user"]["carol"]["completion_tokens"] == counter.count(
+            "a plain answer"
+        )
+
+    async def test_streams_use_reported_counts(self):
+        class ReportingStreamInfra(PlainInfra):
+            async def stream_with_usage(self, prompt):
+                yield "a plain "
+                yield "answer"
+                yield TokenUsage(7, 2, exact=True)
+
+        resource = LLMResource(ReportingStreamInfra())
+
+        chunks = [chunk async for chunk in resource.stream("q")]
+
+        stats = resource.usage.get_stats()
+        assert chunks == ["a plain ", "answer"]
+        assert stats["prompt_tokens"] == 7
+        assert stats["completion_tokens"] == 2
+
+
+class TestPluginAttribution:
+    """Plugins charge LLM calls to the context's user and their class name."""
+
+    async def test_plugin_execution_sets_attribution(self):
+        resource = LLMResource(ReportingInfra())
+
+        class AskPlugin(Plugin):
+            supported_stages = ["think"]
+
+            async def _execute_impl(self, context):
+                return await context.get_resource("llm").generate("q")
+
+        context = PluginContext({"llm": LLM(resource)}, user_id="dave")
+        context.current_stage = "think"
+
+        await AskPlugin({}).execute(context)
+
+        stats = resource.usage.get_stats()
+        assert stats["by_user"]["dave"]["calls"] == 1
+        assert stats["by_plugin"]["AskPlugin"]["completion_tokens"] == 20
+
+    def test_attribution_is_restored_after_block(self):
+        with token_attribution("eve", "Outer"):
+            pass
+        recorder = TokenUsageRecorder()
+        recorder.record(TokenUsage(1, 1))
+
+        assert list(recorder.get_stats()["by_user"]) == ["unattributed"]
@@ -0,0 +1,233 @@
+"""Tests for VectorStoreResource similarity search."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+from entity.resources import VectorSearchResult, VectorStoreResource
+from entity.resources.exceptions import ResourceInitializationError
+
+
+class TestVectorStoreResource:
+    """Typed vector tables and top-k search."""
+
+    @pytest.fixture
+    def store(self):
+        store = VectorStoreResource(DuckDBInfrastructure(":memory:"))
+        store.add_vector("docs", [1.0, 0.0, 0.0], id="a", metadata={"src": "mail"})
+        store.add_vector(
+            "docs", [0.0, 1.0, 0.0], id="b", metadata={"src": "web"}, user_id="u1"
+        )
+        store.add_vector(
+            "docs", [0.9, 0.1, 0.0], id="c", metadata={"src": "web", "rank": 2}
+        )
+        return store
+
+    def test_requires_infrastructure(self):
+        with pytest.raises(ResourceInitializationError):
+            VectorStoreResource(None)
+
+    def test_search_orders_by_distance(self, store):
+        results = store.search("docs", [1.0, 0.0, 0.0], k=2)
+
+        assert [r.id for r in results] == ["a", "c"]
+        assert isinstance(results[0], VectorSearchResult)
+        assert results[0].distance == pytest.approx(0.0)
+        assert results[0].metadata == {"src": "mail"}
+        assert results[0].distance <= results[1].distance
+
+    def test_search_returns_user_id(self, store):
+        results = store.search("docs", [0.0, 1.0, 0.0], k=1)
+        assert results[0].id == "b"
+        assert results[0].user_id == "u1"
+
+    @pytest.mark.parametrize("metric", ["cosine", "l2", "ip"])
+    def test_search_metrics(self, store, metric):
+        results = store.search("docs", [1.0, 0.0, 0.0], k=3, metric=metric)
+        assert [r.id for r in results] == ["a", "c", "b"]
+
+    def test_metadata_filter(self, store):
+        results = store.search("docs", [1.0, 0.0, 0.0], k=3, filter={"src": "web"})
+        assert [r.id for r in results] == ["c", "b"]
+
+        results = store.search("docs", [1.0, 0.0, 0.0], k=3, filter={"rank": 2})
+        assert [r.id for r in results] == ["c"]
+
+    def test_add_vector_replaces_existing_id(self, store):
+        store.add_vector("docs", [0.0, 0.0, 1.0], id="a")
+        results = store.search("docs", [0.0, 0.0, 1.0], k=1)
+        assert results[0].id == "a"
+        assert results[0].metadata == {}
+
+    def test_add_vector_generates_id(self):
+        store = VectorStoreResource(DuckDBInfrastructure(":memory:"))
+        vector_id = store.add_vector("docs", [0.5, 0.5])
+        assert store.search("docs", [0.5, 0.5], k=1)[0].id == vector_id
+
+    def test_dimension_mismatch_raises(self, store):
+        with pytest.raises(Exception):
+            store.search("docs", [1.0, 0.0], k=1)
+
+    def test_invalid_arguments(self, store):
+        with pytest.raises(ValueError):
+            store.search("docs; DROP TABLE docs", [1.0, 0.0, 0.0])
+        with pytest.raises(ValueError):
+            store.search("docs", [1.0, 0.0, 0.0], metric="manhattan")
+        with pytest.raises(ValueError):
+            store.search("docs", [1.0, 0.0, 0.0], filter={"a') OR ('1": "x"})
+        assert store.search("docs", [1.0, 0.0, 0.0], k=0) == []
+
+    def test_create_index_falls_back_to_exact_search(self, store):
+        indexed = store.create_index("docs")
+
+        assert isinstance(indexed, bool)
+        results = store.search("docs", [1.0, 0.0, 0.0], k=2)
+        assert [r.id for r in results] == ["a", "c"]
+
+    def test_file_backed_index_requires_persist(self, tmp_path):
+        infra = MagicMock(spec=DuckDBInfrastructure)
+        infra.file_path = str(tmp_path / "vectors.duckdb")
+        store = VectorStoreResource(infra)
+
+        assert store.create_index("docs") is False
+        infra.connect.assert_not_called()
+
+        store.create_index("docs", persist=True)
+        executed = [c.args[0] for c in infra.connect().__enter__().execute.mock_calls]
+        assert "SET hnsw_enable_experimental_persistence = true" in executed
+
+    def test_legacy_table_raises_migration_hint(self):
+        infra = DuckDBInfrastructure(":memory:")
+        with infra.connect(write=True) as conn:
+            conn.execute("CREATE TABLE docs (vector FLOAT[])")
+        store = VectorStoreResource(infra)
+
+        with pytest.raises(RuntimeError, match="RENAME TO docs_legacy"):
+            store.search("docs", [1.0, 0.0], k=1)
+        with pytest.raises(RuntimeError, match="legacy"):
+            store.add_vector("docs", [1.0, 0.0])
+
+
+class TestBulkVectorIngestion:
+    """Columnar ``add_vectors`` and cached table creation."""
+
+    @pytest.fixture
+    def store(self):
+        return VectorStoreResource(DuckDBInfrastructure(":memory:"))
+
+    def test_add_vectors_from_numpy(self, store):
+        np = pytest.importorskip("numpy")
+        matrix = np.eye(4, dtype=np.float32)
+
+        ids = store.add_vectors(
+            "docs",
+            matrix,
+            ids=["a", "b", "c", "d"],
+            metadata=[{"n": i} for i in range(4)],
+            user_ids=["u1", "u1", "u2", None],
+        )
+
+        assert ids == ["a", "b", "c", "d"]
+        result = store.search("docs", [0.0, 0.0, 1.0, 0.0], k=1)[0]
+        assert (result.id, result.metadata, result.user_id) == ("c", {"n": 2}, "u2")
+        assert store.query("SELECT COUNT(*) FROM docs").fetchone()[0] == 4
+
+    def test_add_vectors_from_arrow_table(self, store):
+        pa = pytest.importorskip("pyarrow")
+        batch = pa.table(
+            {
+                "id": ["x", "y"],
+                "embedding": pa.array([[1.0, 0.0], [0.0, 1.0]], pa.list_(pa.float32())),
+                "metadata": ['{"src": "pdf"}', None],
+            }
+        )
+
+        assert store.add_vectors("docs", batch) == ["x", "y"]
+        result = store.search("docs", [1.0, 0.0], k=1)[0]
+        assert (result.id, result.metadata) == ("x", {"src": "pdf"})
+
+    def test_add_vectors_replaces_and_generates_ids(self, store):
+        ids = store.add_vectors("docs", [[1.0, 0.0], [0.0, 1.0]])
+        assert len(set(ids)) == 2
+
+        store.add_vectors("docs", [[0.5, 0.5]], ids=[ids[0]])
+        assert store.query("SELECT COUNT(*) FROM docs").fetchone()[0] == 2
+        assert store.add_vectors("docs", []) == []
+
+    def test_add_vectors_validates_lengths(self, store):
+        with pytest.raises(ValueError):
+            store.add_vectors("docs", [[1.0, 0.0]], ids=["a", "b"])
+        with pytest.raises(ValueError):
+            store.add_vectors("docs", [[1.0, 0.0], [1.0]])
+        with pytest.raises(ValueError):
+            store.add_vector("docs", [float("nan"), 0.0])
+
+    def test_table_creation_is_cached(self):
+        infra = MagicMock(spec=DuckDBInfrastructure)
+        store = VectorStoreResource(infra)
+
+        store.add_vector("docs", [1.0, 0.0])
+        store.add_vector("docs", [0.0, 1.0])
+        store.add_vectors("docs", [[0.5, 0.5]])
+
+        conn = infra.connect.return_value.__enter__.return_value
+        creates = [
+            call
+            for call in conn.execute.call_args_list
+            if "CREATE TABLE" in call.args[0]
+        ]
+        assert len(creates) == 1
+
+
+class TestUserScopedSearch:
+    """user_id and metadata filters applied before ranking."""
+
+    @pytest.fixture(params=["duckdb", "numpy"])
+    def store(self, request):
+        if request.param == "duckdb":
+            infra = DuckDBInfrastructure(":memory:")
+        else:
+            pytest.importorskip("numpy")
+            from entity.infrastructure import NumPyVectorInfrastructure
+
+            infra = NumPyVectorInfrastructure()
+        store = VectorStoreResource(infra)
+        # u1's vectors are all close to the query; u2 owns only distant ones.
+        store.add_vectors(
+            "mem",
+            [[1.0, 0.01 * i] for i in range(20)] + [[0.0, 1.0], [0.1, 1.0]],
+            ids=[f"a{i}" for i in range(20)] + ["b0", "b1"],
+            metadata=[{"kind": "note"}] * 20 + [{"kind": "note"}, {"kind": "task"}],
+            user_ids=["u1"] * 20 + ["u2", "u2"],
+        )
+        return store
+
+    def test_user_gets_k_results_from_own_rows(self, store):
+        results = store.search("mem", [1.0, 0.0], k=2, user_id="u2")
+
+        assert [r.id for r in results] == ["b1", "b0"]
+        assert all(r.user_id == "u2" for r in results)
+
+    def test_user_and_metadata_filters_combine(self, store):
+        results = store.search(
+            "mem", [1.0, 0.0], k=5, user_id="u2", filter={"kind": "task"}
+        )
+        assert [r.id for r in results] == ["b1"]
+
+    def test_unknown_user_has_no_results(self, store):
+        assert store.search("mem", [1.0, 0.0], k=3, user_id="nobody") == []
+
+    def test_search_batch_scoped_to_user(self, store):
+        results = store.search_batch("mem", [[1.0, 0.0], [0.0, 1.0]], k=1, user_id="u1")
+        assert all(found[0].user_id == "u1" for found in results)
+
+    def test_reassigned_vector_moves_between_users(self, store):
+        store.add_vector("mem", [1.0, 0.0], id="a0", user_id="u2")
+
+        assert "a0" in [
+            r.id for r in store.search("mem", [1.0, 0.0], k=5, user_id="u2")
+        ]
+        assert "a0" not in [
+            r.id for r in store.search("mem", [1.0, 0.0], k=30, user_id="u1")
+        ]
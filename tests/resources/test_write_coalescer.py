@@ -0,0 +1,129 @@
+"""Tests for group-committed memory writes."""
+
+import asyncio
+
+import pytest
+
+from entity.infrastructure.async_duckdb_infra import AsyncDuckDBInfrastructure
+from entity.resources.async_database import AsyncDatabaseResource
+from entity.resources.async_memory import AsyncMemory
+from entity.resources.vector_store import VectorStoreResource
+from entity.resources.write_coalescer import WriteCoalescer
+
+
+class TestWriteCoalescer:
+    """Test suite for WriteCoalescer batching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_a_batch(self):
+        batches = []
+
+        async def flush(rows):
+            batches.append(rows)
+
+        coalescer = WriteCoalescer(flush, window=0.05)
+        await asyncio.gather(*(coalescer.submit((i,)) for i in range(10)))
+
+        assert batches == [[(i,) for i in range(10)]]
+        stats = coalescer.get_stats()
+        assert stats["batches"] == 1
+        assert stats["writes"] == 10
+        assert stats["average_batch"] == 10
+
+    @pytest.mark.asyncio
+    async def test_max_batch_flushes_immediately(self):
+        batches = []
+
+        async def flush(rows):
+            batches.append(len(rows))
+
+        coalescer = WriteCoalescer(flush, window=10.0, max_batch=4)
+        await asyncio.wait_for(
+            asyncio.gather(*(coalescer.submit((i,)) for i in range(8))), timeout=1.0
+        )
+
+        assert batches == [4, 4]
+
+    @pytest.mark.asyncio
+    async def test_callers_resolve_only_after_commit(self):
+        committed = asyncio.Event()
+
+        async def flush(rows):
+            await asyncio.sleep(0.05)
+            committed.set()
+
+        coalescer = WriteCoalescer(flush, window=0.001)
+        await coalescer.submit(("a",))
+        assert committed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_every_caller(self):
+        async def flush(rows):
+            raise RuntimeError("disk full")
+
+        coalescer = WriteCoalescer(flush, window=0.01)
+        results = await asyncio.gather(
+            coalescer.submit((1,)), coalescer.submit((2,)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert coalescer.get_stats()["failures"] == 1
+
+    def test_invalid_batch_size(self):
+        async def flush(rows):
+            pass
+
+        with pytest.raises(ValueError):
+            WriteCoalescer(flush, max_batch=0)
+
+
+class TestAsyncMemoryWriteCoalescing:
+    """Test suite for AsyncMemory with coalesced writes."""
+
+    @pytest.fixture
+    async def memory(self, tmp_path):
+        infra = AsyncDuckDBInfrastructure(str(tmp_path / "coalesce.db"))
+        await infra.startup()
+        memory = AsyncMemory(
+            AsyncDatabaseResource(infra),
+            VectorStoreResource(infra),
+            coalesce_writes=True,
+            write_window=0.01,
+        )
+        yield memory
+        await infra.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stores_are_batched(self, memory):
+        await asyncio.gather(*(memory.store(f"k{i}", i) for i in range(50)))
+
+        assert await memory.size() == 50
+        assert await memory.load("k7") == 7
+        stats = (await memory.get_stats())["write_coalescing"]
+        assert stats["writes"] == 50
+        assert stats["batches"] < 50
+
+    @pytest.mark.asyncio
+    async def test_last_write_wins_within_a_batch(self, memory):
+        await asyncio.gather(memory.store("k", 1), memory.store("k", 2))
+        assert await memory.load("k") == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_with_nothing_pending(self, memory):
+        await memory.flush()
+        assert (await memory.get_stats())["write_coalescing"]["batches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stores_without_coalescing(self, tmp_path):
+        """Uncoalesced concurrent stores serialize on the process lock."""
+        infra = AsyncDuckDBInfrastructure(str(tmp_path / "plain.db"))
+        await infra.startup()
+        memory = AsyncMemory(AsyncDatabaseResource(infra), VectorStoreResource(infra))
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(memory.store(f"k{i}", i) for i in range(20))),
+                timeout=10,
+            )
+            assert await memory.size() == 20
+        finally:
+            await infra.shutdown()
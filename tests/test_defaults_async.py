@@ -0,0 +1,146 @@
+"""Tests for concurrent default resource loading."""
+
+import asyncio
+import time
+
+import pytest
+
+from entity.benchmarks.stub_ollama import StubOllamaServer
+from entity.defaults import DefaultConfig, DefaultResources, load_defaults_async
+from entity.resources import LLM, FileStorage, Memory
+from entity.resources.exceptions import InfrastructureError
+
+
+@pytest.fixture
+async def ollama():
+    async with StubOllamaServer(response="hi") as server:
+        yield server
+
+
+def _config(tmp_path, url, **overrides):
+    settings = {
+        "duckdb_path": str(tmp_path / "agent.duckdb"),
+        "ollama_url": url,
+        "ollama_model": "stub",
+        "storage_path": str(tmp_path / "files"),
+        "auto_install_ollama": False,
+        **overrides,
+    }
+    return DefaultConfig(**settings)
+
+
+class TestLoadDefaultsAsync:
+    """Concurrent probes, deferred storage and startup timings."""
+
+    async def test_builds_default_resources(self, tmp_path, ollama):
+        resources = await load_defaults_async(_config(tmp_path, ollama.url))
+
+        assert isinstance(resources, DefaultResources)
+        assert isinstance(resources["memory"], Memory)
+        assert isinstance(resources["llm"], LLM)
+        assert isinstance(resources["file_storage"], FileStorage)
+        assert await resources["llm"].generate("hello") == "hi"
+        assert set(resources.startup_timings) >= {"llm", "database", "wrappers"}
+
+    async def test_storage_deferred_until_first_use(self, tmp_path, ollama):
+        resources = await load_defaults_async(_config(tmp_path, ollama.url))
+
+        assert "file_storage" not in resources.startup_timings
+        assert not (tmp_path / "files").exists()
+
+        await resources["file_storage"].upload_text("note.txt", "saved")
+
+        assert (tmp_path / "files" / "note.txt").read_text() == "saved"
+        assert "file_storage" in resources.startup_timings
+
+    async def test_storage_probed_eagerly_when_not_deferred(self, tmp_path, ollama):
+        resources = await load_defaults_async(
+            _config(tmp_path, ollama.url), defer_optional=False
+        )
+
+        assert "file_storage" in resources.startup_timings
+        assert (tmp_path / "files").exists()
+
+    async def test_probes_run_concurrently(self, tmp_path, ollama, monkeypatch):
+        from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+
+        async def slow_db_probe(self):
+            time.sleep(0.2)
+            return True
+
+        monkeypatch.setattr(DuckDBInfrastructure, "health_check", slow_db_probe)
+        ollama.latency = 0.0
+        original = StubOllamaServer._route
+
+        async def slow_tags(self, method, path, payload):
+            if path == "/api/tags":
+                await asyncio.sleep(0.2)
+            return await original(self, method, path, payload)
+
+        monkeypatch.setattr(StubOllamaServer, "_route", slow_tags)
+
+        start = time.perf_counter()
+        resources = await load_defaults_async(_config(tmp_path, ollama.url))
+
+        assert time.perf_counter() - start < 0.35
+        assert resources.startup_timings["llm"] >= 0.2
+        assert resources.startup_timings["database"] >= 0.2
+
+    async def test_unreachable_ollama_fails_fast(self, tmp_path):
+        config = _config(tmp_path, "http://127.0.0.1:9")
+
+        start = time.perf_counter()
+        with pytest.raises(InfrastructureError):
+            await load_defaults_async(config, probe_timeout=0.5)
+
+        assert time.perf_counter() - start < 1.0
+
+    async def test_install_is_not_bound_by_probe_timeout(
+        self, tmp_path, ollama, monkeypatch
+    ):
+        from entity.setup.ollama_installer import OllamaInstaller
+
+        installed = False
+        original = StubOllamaServer._route
+
+        async def tags_after_install(self, method, path, payload):
+            if path == "/api/tags" and not installed:
+                return "503 Service Unavailable", {"error": "not installed"}
+            return await original(self, method, path, payload)
+
+        def slow_install(model=None):
+            nonlocal installed
+            time.sleep(0.3)
+            installed = True
+
+        monkeypatch.setattr(StubOllamaServer, "_route", tags_after_install)
+        monkeypatch.setattr(OllamaInstaller, "ensure_ollama_available", slow_install)
+
+        resources = await load_defaults_async(
+            _config(tmp_path, ollama.url, auto_install_ollama=True),
+            probe_timeout=0.1,
+        )
+
+        assert resources.startup_timings["llm_install"] >= 0.3
+        runtime = resources["llm"].resource.infrastructure
+        assert runtime.health_check_attempts > 1
+
+    async def test_failed_database_probe_is_shut_down(
+        self, tmp_path, ollama, monkeypatch
+    ):
+        from entity.infrastructure.duckdb_infra import DuckDBInfrastructure
+
+        closed = []
+
+        async def file_probe_fails(self):
+            return self.file_path == ":memory:"
+
+        async def record_shutdown(self):
+            closed.append(self.file_path)
+
+        monkeypatch.setattr(DuckDBInfrastructure, "health_check", file_probe_fails)
+        monkeypatch.setattr(DuckDBInfrastructure, "shutdown", record_shutdown)
+
+        await load_defaults_async(_config(tmp_path, ollama.url))
+
+        assert closed == [str(tmp_path / "agent.duckdb")]
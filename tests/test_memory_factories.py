@@ -52,6 +52,16 @@ class MockDatabaseResource:
 
         return None
 
+    def fetch_all(self, query, *params):
+        return self.execute(query, *params) or []
+
+    def fetch_one(self, query, *params):
+        if query.lstrip().startswith("DELETE"):
+            self.queries.append((query, params))
+            return (1,)
+        rows = self.fetch_all(query, *params)
+        return rows[0] if rows else None
+
     def health_check(self):
         return True
 